@@ -8,19 +8,23 @@ import aiohttp
 import asyncio
 import time
 from dotenv import load_dotenv
-from game_image_generator import GameImageGenerator
-from flask import Flask, request, jsonify
-import threading
+from aiohttp import web
+from render_service import RenderService
+from render_cache import RenderCache
+from game_image_generator import (RENDER_VERSION, COINFLIP_SPIN_FRAMES, DICE_ROLL_FRAMES, SLOTS_SPIN_FRAMES,
+                                  LIMBO_COUNT_FRAMES, PLINKO_FRAMES_PER_ROW, animation_seconds)
+from image_encoder import (IMAGE_FORMAT, IMAGE_EXTENSIONS, PNG_COMPRESS_LEVEL, ANIMATION_FORMAT,
+                           image_filename, animation_filename)
+from webhook_queue import WebhookQueue
+from event_bus import EventBus
+from dm_dispatcher import DMDispatcher
+from log_sink import LogSink
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize game image generator
-game_img_gen = GameImageGenerator()
-
-# Initialize card generator
-from card_generator import CardImageGenerator
-card_generator = CardImageGenerator()
+# Initialize card generator (hand formatting and totals; images are drawn by the render service)
+from cards import Hand, Shoe, baccarat_points, card_is_red, card_rank, card_suit, format_hand, is_three_card_straight
 
 # Load environment variables directly from os.environ (works with Replit Secrets)
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
@@ -45,16 +49,97 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.guilds = True
 
-# Create bot instance with proper setup for slash commands
-bot = commands.Bot(command_prefix="!", intents=intents)
+class VaultBot(commands.Bot):
+    async def close(self):
+        # Post buffered log entries while the HTTP session is still open
+        try:
+            await log_sink.close()
+        except Exception as e:
+            print(f"❌ Error flushing log channels on shutdown: {e}")
+        # Stop the render workers and the isolated signer so no child process outlives the bot
+        render_service.close()
+        if ltc_handler and ltc_handler.signer:
+            ltc_handler.signer.close()
+        await super().close()
 
-# Create Flask app for webhook handling
-flask_app = Flask(__name__)
+# Create bot instance with proper setup for slash commands
+bot = VaultBot(command_prefix="!", intents=intents)
+
+# Create aiohttp app for webhook handling (served on the bot's event loop)
+webhook_app = web.Application(client_max_size=16 * 1024)
+webhook_runner = None
+
+# In-process event bus; deposit notifications are journaled to notifications.jsonl until delivered
+event_bus = EventBus(spool_path="notifications.jsonl")
+
+# Outbound DM queue with per-user coalescing and a shared user cache
+dm_dispatcher = DMDispatcher(bot)
+
+# Buffered writer for the deposit/withdraw/tip/admin log channels
+log_sink = LogSink(bot)
+
+# Game images are drawn and encoded in worker processes, off the event loop;
+# small-outcome games are memoized and persisted under RENDER_CACHE_DIR/v<RENDER_VERSION>
+render_cache = RenderCache(cache_dir=os.getenv("RENDER_CACHE_DIR", "render_cache"),
+                           version=f"{RENDER_VERSION}-{IMAGE_FORMAT}-z{PNG_COMPRESS_LEVEL}-{ANIMATION_FORMAT}",
+                           extension=IMAGE_EXTENSIONS[IMAGE_FORMAT])
+render_service = RenderService(workers=int(os.getenv("RENDER_WORKERS", str(os.cpu_count() or 2))), cache=render_cache)
+
+# Outcome spaces of the small games, shared by the game logic and the render warm-up
+COINFLIP_SIDES = ["heads", "tails"]
+RPS_CHOICES = ["rock", "paper", "scissors"]
+SLOTS_SYMBOLS = ["🍒", "🍋", "🍊", "🔔", "⭐"]
+
+# Each player sits at their own blackjack / baccarat table whose shoes carry over between rounds
+SHOE_PENETRATION = float(os.getenv("SHOE_PENETRATION", "0.75"))
+BLACKJACK_DECKS = int(os.getenv("BLACKJACK_DECKS", "6"))
+BACCARAT_DECKS = int(os.getenv("BACCARAT_DECKS", "8"))
+blackjack_shoes = {}
+baccarat_shoes = {}
+
+def get_shoe(shoes, user_id, decks):
+    """Return a free shoe at a player's table, ready for a new round; the caller ends the round when it is settled"""
+    table = shoes.setdefault(user_id, [])
+    for shoe in table:
+        if not shoe.in_round:
+            break
+    else:
+        # Every shoe is held by an unfinished game, so this one gets its own
+        shoe = Shoe(decks=decks, penetration=SHOE_PENETRATION)
+        table.append(shoe)
+    shoe.start_round()
+    return shoe
+
+def render_warmup_jobs():
+    """Every finite outcome of coinflip, dice battle, RPS and slots as (generator, method, args) jobs"""
+    jobs = []
+    for result in COINFLIP_SIDES:
+        for choice in COINFLIP_SIDES:
+            jobs.append(("game", "create_coinflip_image", (result, choice)))
+            jobs.append(("game", "create_coinflip_animation", (result, choice)))
+    for player_roll in range(1, 7):
+        for bot_roll in range(1, 7):
+            jobs.append(("game", "create_dice_battle_image", (player_roll, bot_roll)))
+    for player_choice in RPS_CHOICES:
+        for bot_choice in RPS_CHOICES:
+            jobs.append(("game", "create_rps_image", (player_choice, bot_choice)))
+    for a in SLOTS_SYMBOLS:
+        for b in SLOTS_SYMBOLS:
+            for c in SLOTS_SYMBOLS:
+                jobs.append(("game", "create_slots_image", ([a, b, c],)))
+    return jobs
 
 # Ensure the command tree is properly initialized
 @bot.event
 async def setup_hook():
     """This is called when the bot is starting up"""
+    # Fill the render cache before the gateway connects so no player sees a cold render
+    render_service.start()
+    try:
+        await render_service.warm_up(render_warmup_jobs())
+    except Exception as e:
+        print(f"⚠️ Render warm-up failed: {e}")
+
     try:
         synced = await bot.tree.sync()
         print(f"Synced {len(synced)} command(s)")
@@ -64,51 +149,82 @@ async def setup_hook():
 # Initialize crypto handler to None
 ltc_handler = None
 
+async def process_webhook_callback(data):
+    """Queue worker entry point for a spooled Apirone callback"""
+    if not ltc_handler:
+        raise RuntimeError("Crypto handler not ready")
+    await ltc_handler.process_apirone_callback(data)
+
+# Durable callback queue drained by a fixed pool of workers
+webhook_queue = WebhookQueue(process_webhook_callback)
+
 # Status route for webview
-@flask_app.route('/', methods=['GET'])
-def status():
+async def status(request):
     """Simple status page for the webview"""
-    return jsonify({
+    return web.json_response({
         "status": "online",
         "service": "VaultBet Discord Bot Webhook Server",
         "endpoints": {
             "webhook": "/webhook/apirone"
         },
         "message": "Webhook server is running and ready to receive callbacks"
-    }), 200
+    }, status=200)
 
 # Apirone webhook route
-@flask_app.route('/webhook/apirone', methods=['POST'])
-def handle_apirone_webhook():
+async def handle_apirone_webhook(request):
     """Handle incoming Apirone callbacks for deposit detection"""
     try:
         global ltc_handler
-        data = request.get_json()
+        try:
+            data = await request.json()
+        except json.JSONDecodeError:
+            data = None
+        except web.HTTPRequestEntityTooLarge:
+            return web.json_response({"error": "Payload too large"}, status=413)
 
         if not data:
-            return jsonify({"error": "No data"}), 400
+            return web.json_response({"error": "No data"}, status=400)
 
-        # Process the callback asynchronously in the Discord bot's event loop
         if ltc_handler:
-            # Create an async task to process the callback
-            asyncio.run_coroutine_threadsafe(
-                ltc_handler.process_apirone_callback(data),
-                bot.loop
-            )
-            return jsonify({"status": "ok"}), 200
+            # Reject junk, forged and replayed callbacks before any file or network I/O
+            reason = ltc_handler.validate_apirone_callback(data)
+            if reason in ("unconfirmed", "duplicate"):
+                return web.json_response({"status": "ignored", "reason": reason}, status=200)
+            elif reason == "bad_signature":
+                return web.json_response({"error": "Invalid signature"}, status=403)
+            elif reason:
+                return web.json_response({"error": "Invalid callback"}, status=400)
+
+            # Persist the callback before acknowledging it; workers process it from the queue
+            if not webhook_queue.enqueue(data):
+                # Backpressure - Apirone retries the callback later
+                return web.json_response({"error": "Queue full"}, status=503)
+            return web.json_response({"status": "ok"}, status=200)
         else:
-            return jsonify({"error": "Handler not ready"}), 503
+            return web.json_response({"error": "Handler not ready"}, status=503)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        return jsonify({"error": str(e)}), 500
+        return web.json_response({"error": str(e)}, status=500)
+
+webhook_app.router.add_get('/', status)
+webhook_app.router.add_post('/webhook/apirone', handle_apirone_webhook)
 
-def start_flask_server():
-    """Start Flask webhook server in a separate thread"""
+async def start_webhook_server():
+    """Start the aiohttp webhook server on the bot's event loop"""
+    global webhook_runner
+    if webhook_runner:
+        # on_ready fires again after reconnects - the server is already listening
+        return
     try:
-        flask_app.run(host='0.0.0.0', port=5000, debug=False)
+        webhook_runner = web.AppRunner(webhook_app)
+        await webhook_runner.setup()
+        site = web.TCPSite(webhook_runner, host='0.0.0.0', port=5000)
+        await site.start()
+        print("✅ Webhook server started on port 5000")
     except Exception as e:
-        print(f"❌ Flask server error: {e}")
+        print(f"❌ Failed to start webhook server: {e}")
+        webhook_runner = None
 
 # --- Utility Functions ---
 
@@ -284,6 +400,13 @@ message_tracking = load_message_tracking()
 house_balance = load_house_balance()
 withdrawal_requests = load_withdrawal_requests()
 
+# Serializes /batchwithdraw so two runs can never broadcast the same approved requests
+batch_withdraw_lock = asyncio.Lock()
+
+# A request moves pending -> approved -> processing -> completed; needs_review when a broadcast is unconfirmed.
+# A user with a request in any of these states can't open another.
+OPEN_WITHDRAWAL_STATUSES = ("pending", "approved", "processing", "needs_review")
+
 # Rakeback system constants
 RAKEBACK_PERCENTAGE = 0.005  # 0.5%
 
@@ -325,183 +448,144 @@ def handle_affiliation_payout(user_id, wager_amount_usd):
 # Logging functions for deposit and withdraw channels
 async def log_deposit(member, amount_usd):
     deposit_channel_id = 1403907103944605736
-    channel = bot.get_channel(deposit_channel_id)
-    if channel:
-        embed = discord.Embed(
-            title="💸 New Deposit Logged",
-            color=0x00ff00
-        )
-        embed.add_field(name="👤 Depositor", value=member.display_name, inline=True)
-        embed.add_field(name="💵 Amount Deposited", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="📊 Total Deposited by User", value=f"${balances[str(member.id)]['deposited']:.2f} USD", inline=True)
-        await channel.send(embed=embed)
+    embed = discord.Embed(
+        title="💸 New Deposit Logged",
+        color=0x00ff00
+    )
+    embed.add_field(name="👤 Depositor", value=member.display_name, inline=True)
+    embed.add_field(name="💵 Amount Deposited", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="📊 Total Deposited by User", value=f"${balances[str(member.id)]['deposited']:.2f} USD", inline=True)
+    log_sink.emit(deposit_channel_id, embed)
 
 async def log_admin_deposit(admin_member, target_member, amount_usd):
     """Log admin-confirmed deposits to the admin deposit log channel"""
-    log_channel = bot.get_channel(DEPOSIT_LOG_CHANNEL_ID)
-    if log_channel:
-        embed = discord.Embed(
-            title="🔧 Admin Deposit Confirmation",
-            description="An administrator has manually credited a user's account",
-            color=0x0099ff
-        )
-        embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
-        embed.add_field(name="👤 User Credited", value=f"{target_member.display_name} ({target_member.id})", inline=True)
-        embed.add_field(name="💵 Amount Credited", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="💳 User's New Balance", value=f"${balances[str(target_member.id)]['balance']:.2f} USD", inline=True)
-        embed.add_field(name="📊 User's Total Deposited", value=f"${balances[str(target_member.id)]['deposited']:.2f} USD", inline=True)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
-        embed.set_footer(text="Manual deposit confirmation by administrator")
+    embed = discord.Embed(
+        title="🔧 Admin Deposit Confirmation",
+        description="An administrator has manually credited a user's account",
+        color=0x0099ff
+    )
+    embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
+    embed.add_field(name="👤 User Credited", value=f"{target_member.display_name} ({target_member.id})", inline=True)
+    embed.add_field(name="💵 Amount Credited", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="💳 User's New Balance", value=f"${balances[str(target_member.id)]['balance']:.2f} USD", inline=True)
+    embed.add_field(name="📊 User's Total Deposited", value=f"${balances[str(target_member.id)]['deposited']:.2f} USD", inline=True)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
+    embed.set_footer(text="Manual deposit confirmation by administrator")
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send admin deposit log: {e}")
+    log_sink.emit(DEPOSIT_LOG_CHANNEL_ID, embed)
 
 async def log_deposit_webhook(member, amount_ltc, amount_usd, tx_hash, input_address):
     """Log crypto deposits from webhook callbacks to dedicated channel"""
-    channel = bot.get_channel(CRYPTO_DEPOSIT_LOG_CHANNEL_ID)
-    if channel:
-        embed = discord.Embed(
-            title="💰 Crypto Deposit Confirmed",
-            description="Automatic deposit detection via blockchain",
-            color=0x00ff00
-        )
-        embed.add_field(name="👤 Depositor", value=f"{member.mention if hasattr(member, 'mention') else member}", inline=True)
-        embed.add_field(name="💵 USD Value", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="₿ LTC Amount", value=f"{amount_ltc:.8f} LTC", inline=True)
-        embed.add_field(name="📍 Receiving Address", value=f"`{input_address}`", inline=False)
-        embed.add_field(name="🔗 Transaction Hash", value=f"`{tx_hash[:32]}...`", inline=False)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=False)
-        try:
-            await channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send crypto deposit log: {e}")
+    embed = discord.Embed(
+        title="💰 Crypto Deposit Confirmed",
+        description="Automatic deposit detection via blockchain",
+        color=0x00ff00
+    )
+    embed.add_field(name="👤 Depositor", value=f"{member.mention if hasattr(member, 'mention') else member}", inline=True)
+    embed.add_field(name="💵 USD Value", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="₿ LTC Amount", value=f"{amount_ltc:.8f} LTC", inline=True)
+    embed.add_field(name="📍 Receiving Address", value=f"`{input_address}`", inline=False)
+    embed.add_field(name="🔗 Transaction Hash", value=f"`{tx_hash[:32]}...`", inline=False)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=False)
+    log_sink.emit(CRYPTO_DEPOSIT_LOG_CHANNEL_ID, embed)
 
 async def log_house_balance_webhook(admin_member, house_balance_ltc, house_balance_usd, wallet_address):
     """Log house balance check to dedicated channel"""
-    channel = bot.get_channel(CRYPTO_DEPOSIT_LOG_CHANNEL_ID)
-    if channel:
-        embed = discord.Embed(
-            title="🏦 House Balance Updated",
-            description="Current confirmed balance in house wallet",
-            color=0x0099ff
-        )
-        embed.add_field(name="👑 Admin", value=f"{admin_member.mention}", inline=True)
-        embed.add_field(name="₿ LTC Balance", value=f"{house_balance_ltc:.8f} LTC", inline=True)
-        embed.add_field(name="💵 USD Value", value=f"${house_balance_usd:.2f} USD", inline=True)
-        embed.add_field(name="📍 Wallet Address", value=f"`{wallet_address}`", inline=False)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=False)
-        try:
-            await channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send house balance log: {e}")
+    embed = discord.Embed(
+        title="🏦 House Balance Updated",
+        description="Current confirmed balance in house wallet",
+        color=0x0099ff
+    )
+    embed.add_field(name="👑 Admin", value=f"{admin_member.mention}", inline=True)
+    embed.add_field(name="₿ LTC Balance", value=f"{house_balance_ltc:.8f} LTC", inline=True)
+    embed.add_field(name="💵 USD Value", value=f"${house_balance_usd:.2f} USD", inline=True)
+    embed.add_field(name="📍 Wallet Address", value=f"`{wallet_address}`", inline=False)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=False)
+    log_sink.emit(CRYPTO_DEPOSIT_LOG_CHANNEL_ID, embed)
 
 async def log_withdraw(member, amount_usd, crypto_address):
     withdraw_channel_id = 1403907128023842996
-    channel = bot.get_channel(withdraw_channel_id)
-    if channel:
-        embed = discord.Embed(
-            title="💸 New Withdrawal Logged",
-            color=0xffaa00
-        )
-        embed.add_field(name="👤 Withdrawer", value=member.display_name, inline=True)
-        embed.add_field(name="💵 Amount Withdrawn", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="📍 Crypto Address", value=f"`{crypto_address}`", inline=False)
-        await channel.send(embed=embed)
+    embed = discord.Embed(
+        title="💸 New Withdrawal Logged",
+        color=0xffaa00
+    )
+    embed.add_field(name="👤 Withdrawer", value=member.display_name, inline=True)
+    embed.add_field(name="💵 Amount Withdrawn", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="📍 Crypto Address", value=f"`{crypto_address}`", inline=False)
+    log_sink.emit(withdraw_channel_id, embed)
 
 async def log_admin_withdraw(admin_member, target_member, amount_usd, ltc_address, withdrawal_id):
     """Log admin-confirmed withdrawals to the admin withdraw log channel"""
-    log_channel = bot.get_channel(WITHDRAW_LOG_CHANNEL_ID)
-    if log_channel:
-        embed = discord.Embed(
-            title="🔧 Admin Withdrawal Confirmation",
-            description="An administrator has manually processed a withdrawal request",
-            color=0xff6600
-        )
-        embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
-        embed.add_field(name="👤 User", value=f"{target_member.display_name} ({target_member.id})", inline=True)
-        embed.add_field(name="💵 Amount Withdrawn", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="📍 LTC Address", value=f"`{ltc_address}`", inline=False)
-        embed.add_field(name="🆔 Withdrawal ID", value=f"`{withdrawal_id}`", inline=True)
-        embed.add_field(name="📊 User's Total Withdrawn", value=f"${balances[str(target_member.id)]['withdrawn']:.2f} USD", inline=True)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
-        embed.set_footer(text="Manual withdrawal confirmation by administrator")
+    embed = discord.Embed(
+        title="🔧 Admin Withdrawal Confirmation",
+        description="An administrator has manually processed a withdrawal request",
+        color=0xff6600
+    )
+    embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
+    embed.add_field(name="👤 User", value=f"{target_member.display_name} ({target_member.id})", inline=True)
+    embed.add_field(name="💵 Amount Withdrawn", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="📍 LTC Address", value=f"`{ltc_address}`", inline=False)
+    embed.add_field(name="🆔 Withdrawal ID", value=f"`{withdrawal_id}`", inline=True)
+    embed.add_field(name="📊 User's Total Withdrawn", value=f"${balances[str(target_member.id)]['withdrawn']:.2f} USD", inline=True)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
+    embed.set_footer(text="Manual withdrawal confirmation by administrator")
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send admin withdraw log: {e}")
+    log_sink.emit(WITHDRAW_LOG_CHANNEL_ID, embed)
 
 async def log_admin_balance_change(admin_member, target_member, amount_usd, action_type):
     """Log admin balance changes to the specified channel"""
-    log_channel = bot.get_channel(1413123452193341450)
-    if log_channel:
-        embed = discord.Embed(
-            title=f"🔧 Admin Balance {action_type.title()}",
-            description=f"An administrator has {action_type.lower()} user balance",
-            color=0x0099ff if action_type == "Addition" else 0xff6600
-        )
-        embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
-        embed.add_field(name="👤 Target User", value=f"{target_member.display_name} ({target_member.id})", inline=True)
-        embed.add_field(name="💵 Amount", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="💳 User's New Balance", value=f"${balances[str(target_member.id)]['balance']:.2f} USD", inline=True)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
-        embed.set_footer(text=f"Manual balance {action_type.lower()} by administrator")
+    embed = discord.Embed(
+        title=f"🔧 Admin Balance {action_type.title()}",
+        description=f"An administrator has {action_type.lower()} user balance",
+        color=0x0099ff if action_type == "Addition" else 0xff6600
+    )
+    embed.add_field(name="👑 Admin", value=f"{admin_member.display_name} ({admin_member.id})", inline=True)
+    embed.add_field(name="👤 Target User", value=f"{target_member.display_name} ({target_member.id})", inline=True)
+    embed.add_field(name="💵 Amount", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="💳 User's New Balance", value=f"${balances[str(target_member.id)]['balance']:.2f} USD", inline=True)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
+    embed.set_footer(text=f"Manual balance {action_type.lower()} by administrator")
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send admin balance change log: {e}")
+    log_sink.emit(1413123452193341450, embed)
 
 async def log_tip_transaction(sender, receiver, amount_usd):
     """Log tip transactions to the specified channel"""
-    log_channel = bot.get_channel(1413123467171336273)
-    if log_channel:
-        embed = discord.Embed(
-            title="💝 Tip Transaction",
-            description="A user has sent a tip to another player",
-            color=0x00ff00
-        )
-        embed.add_field(name="👤 Sender", value=f"{sender.display_name} ({sender.id})", inline=True)
-        embed.add_field(name="👤 Receiver", value=f"{receiver.display_name} ({receiver.id})", inline=True)
-        embed.add_field(name="💰 Amount", value=f"${amount_usd:.2f} USD", inline=True)
-        embed.add_field(name="💳 Sender's New Balance", value=f"${balances[str(sender.id)]['balance']:.2f} USD", inline=True)
-        embed.add_field(name="💳 Receiver's New Balance", value=f"${balances[str(receiver.id)]['balance']:.2f} USD", inline=True)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
-        embed.set_footer(text="Player tip transaction")
+    embed = discord.Embed(
+        title="💝 Tip Transaction",
+        description="A user has sent a tip to another player",
+        color=0x00ff00
+    )
+    embed.add_field(name="👤 Sender", value=f"{sender.display_name} ({sender.id})", inline=True)
+    embed.add_field(name="👤 Receiver", value=f"{receiver.display_name} ({receiver.id})", inline=True)
+    embed.add_field(name="💰 Amount", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="💳 Sender's New Balance", value=f"${balances[str(sender.id)]['balance']:.2f} USD", inline=True)
+    embed.add_field(name="💳 Receiver's New Balance", value=f"${balances[str(receiver.id)]['balance']:.2f} USD", inline=True)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
+    embed.set_footer(text="Player tip transaction")
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send tip transaction log: {e}")
+    log_sink.emit(1413123467171336273, embed)
 
 async def log_affiliation_change(user, affiliate, previous_affiliate=None):
     """Log affiliation changes to the specified channel"""
-    log_channel = bot.get_channel(1413123467171336273)
-    if log_channel:
-        embed = discord.Embed(
-            title="🤝 Affiliation Update",
-            description="A user has updated their affiliation",
-            color=0x9932cc
-        )
-        embed.add_field(name="👤 User", value=f"{user.display_name} ({user.id})", inline=True)
-        embed.add_field(name="👤 New Affiliate", value=f"{affiliate.display_name} ({affiliate.id})", inline=True)
+    embed = discord.Embed(
+        title="🤝 Affiliation Update",
+        description="A user has updated their affiliation",
+        color=0x9932cc
+    )
+    embed.add_field(name="👤 User", value=f"{user.display_name} ({user.id})", inline=True)
+    embed.add_field(name="👤 New Affiliate", value=f"{affiliate.display_name} ({affiliate.id})", inline=True)
 
-        if previous_affiliate:
-            embed.add_field(name="👤 Previous Affiliate", value=f"{previous_affiliate.display_name} ({previous_affiliate.id})", inline=True)
-        else:
-            embed.add_field(name="👤 Previous Affiliate", value="None", inline=True)
+    if previous_affiliate:
+        embed.add_field(name="👤 Previous Affiliate", value=f"{previous_affiliate.display_name} ({previous_affiliate.id})", inline=True)
+    else:
+        embed.add_field(name="👤 Previous Affiliate", value="None", inline=True)
 
-        embed.add_field(name="💰 Commission Rate", value="0.5%", inline=True)
-        embed.add_field(name="📊 Affiliate's Total Earned", value=f"${affiliation_data[str(affiliate.id)]['total_earned']:.2f} USD", inline=True)
-        embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
-        embed.set_footer(text="Affiliation system update")
+    embed.add_field(name="💰 Commission Rate", value="0.5%", inline=True)
+    embed.add_field(name="📊 Affiliate's Total Earned", value=f"${affiliation_data[str(affiliate.id)]['total_earned']:.2f} USD", inline=True)
+    embed.add_field(name="⏰ Timestamp", value=f"<t:{int(time.time())}:F>", inline=True)
+    embed.set_footer(text="Affiliation system update")
 
-        try:
-            await log_channel.send(embed=embed)
-        except Exception as e:
-            print(f"Failed to send affiliation change log: {e}")
+    log_sink.emit(1413123467171336273, embed)
 
 async def get_ltc_price():
     """Get current Litecoin price in USD"""
@@ -517,85 +601,69 @@ async def get_ltc_price():
     except:
         return 75.0  # Fallback price
 
-async def check_notifications():
-    """Check for notifications from the webhook server"""
-    print("🔔 Notification checker started - checking every 5 seconds")
-
-    while True:
-        try:
-
-            # Check for notifications from webhook
-            notification_file_exists = os.path.exists('notifications.json')
+@event_bus.on("deposit_confirmed")
+async def on_deposit_confirmed(event):
+    """DM the depositor and log the deposit as soon as it is credited"""
+    user_id = event["user_id"]
+    amount_ltc = event["amount_ltc"]
+    amount_usd = event["amount_usd"]
+    tx_hash = event["tx_hash"]
 
-            if notification_file_exists:
-                try:
-                    with open('notifications.json', 'r') as f:
-                        content = f.read().strip()
+    print(f"🔔 Processing deposit confirmation for user {user_id}: {amount_ltc} LTC (${amount_usd:.2f})")
 
-                    if content:
-                        notifications = json.loads(content)
-                    else:
-                        notifications = []
+    user = await dm_dispatcher.get_user(user_id)
+    if not user:
+        return
 
-                except (json.JSONDecodeError, FileNotFoundError) as e:
-                    notifications = []
+    embed = discord.Embed(
+        title="✅ Deposit Confirmed & Credited!",
+        description="Your Litecoin deposit has been automatically processed",
+        color=0x00ff00
+    )
+    embed.add_field(name="💰 Amount", value=f"{amount_ltc:.8f} LTC", inline=True)
+    embed.add_field(name="💵 USD Value", value=f"${amount_usd:.2f} USD", inline=True)
+    embed.add_field(name="🔗 Transaction", value=f"`{tx_hash[:16]}...`", inline=False)
+    if event.get("confirmations"):
+        embed.add_field(name="✅ Confirmations", value=f"{event['confirmations']}", inline=True)
+    embed.add_field(name="🎮 Status", value="Balance updated - ready to play!", inline=True)
+    embed.set_footer(text="Your deposit has been credited automatically!")
+
+    # Log the deposit
+    if event.get("input_address"):
+        await log_deposit_webhook(user, amount_ltc, amount_usd, tx_hash, event["input_address"])
+    else:
+        await log_deposit(user, amount_usd)
 
-                if notifications:
-                    processed_notifications = []
-                    for notification in notifications:
-                        try:
-                            if notification.get('type') == 'deposit_confirmed':
-                                user_id = notification['user_id']
-                                amount_ltc = notification['amount_ltc']
-                                amount_usd = notification['amount_usd']
-                                tx_hash = notification['tx_hash']
-
-                                print(f"🔔 Processing deposit confirmation for user {user_id}: {amount_ltc} LTC (${amount_usd:.2f})")
-
-                                user = bot.get_user(int(user_id))
-                                if user:
-                                    embed = discord.Embed(
-                                        title="✅ Deposit Confirmed & Credited!",
-                                        description="Your Litecoin deposit has been successfully processed",
-                                        color=0x00ff00
-                                    )
-                                    embed.add_field(name="💰 Amount", value=f"{amount_ltc:.8f} LTC", inline=True)
-                                    embed.add_field(name="💵 USD Value", value=f"${amount_usd:.2f} USD", inline=True)
-                                    embed.add_field(name="🔗 Transaction", value=f"`{tx_hash[:16]}...`", inline=False)
-                                    embed.add_field(name="🎮 Status", value="Balance updated - ready to play!", inline=True)
-                                    embed.set_footer(text="Your deposit has been credited")
-
-                                    try:
-                                        await user.send(embed=embed)
-                                        print(f"✅ Sent deposit confirmation to user {user_id}")
-                                        # Log the deposit
-                                        await log_deposit(user, amount_usd)
-                                    except discord.Forbidden:
-                                        print(f"⚠️ Could not send DM to user {user_id} - DMs disabled")
-                                    except Exception as dm_error:
-                                        print(f"❌ Error sending DM to user {user_id}: {dm_error}")
-
-                                processed_notifications.append(notification)
-
-                        except Exception as e:
-                            print(f"❌ Error processing notification: {e}")
-                            processed_notifications.append(notification)  # Still mark as processed
-
-                    # Clear processed notifications
-                    if processed_notifications:
-                        try:
-                            remaining_notifications = [n for n in notifications if n not in processed_notifications]
-                            with open('notifications.json', 'w') as f:
-                                json.dump(remaining_notifications, f, indent=2)
-                            if processed_notifications:
-                                print(f"✅ Processed {len(processed_notifications)} notification(s)")
-                        except Exception as e:
-                            print(f"❌ Error clearing notifications: {e}")
+    # The event stays in the journal until this returns, so wait for the DM to actually go out
+    await dm_dispatcher.send(user_id, embed=embed)
 
-        except Exception as e:
-            print(f"❌ Error processing notifications file: {e}")
+@event_bus.on("withdrawal_completed")
+async def on_withdrawal_completed(event):
+    """Tell the user their withdrawal was approved (and sent, when a transaction is attached)"""
+    user_id = event["user_id"]
+    tx_hash = event.get("tx_hash")
 
-        await asyncio.sleep(5)  # Check every 5 seconds
+    if tx_hash:
+        user_embed = discord.Embed(
+            title="✅ Withdrawal Sent!",
+            description="Your withdrawal request has been approved and sent.",
+            color=0x00ff00
+        )
+    else:
+        user_embed = discord.Embed(
+            title="✅ Withdrawal Approved!",
+            description="Your withdrawal request has been approved and is being processed.",
+            color=0x00ff00
+        )
+    user_embed.add_field(name="🆔 Request ID", value=f"`{event['withdrawal_id']}`", inline=True)
+    user_embed.add_field(name="💵 Amount", value=f"${event['amount_usd']:.2f} USD", inline=True)
+    user_embed.add_field(name="💰 LTC", value=f"~{event['amount_ltc']:.8f} LTC", inline=True)
+    user_embed.add_field(name="📍 Destination", value=f"`{event['ltc_address']}`", inline=False)
+    if tx_hash:
+        user_embed.add_field(name="🔗 Transaction", value=f"`{tx_hash}`", inline=False)
+    else:
+        user_embed.set_footer(text="LTC will be sent to your address shortly.")
+    dm_dispatcher.send(user_id, embed=user_embed)
 
 @bot.event
 async def on_message(message):
@@ -629,30 +697,24 @@ async def on_message(message):
         save_message_tracking(message_tracking)
 
         # Send reward notification
-        try:
-            embed = discord.Embed(
-                title="💬 Chat Reward! 🎉",
-                description="You've been rewarded for being active in the server!",
-                color=0x00ff00
-            )
-            embed.add_field(name="💰 Reward", value="$0.10 USD", inline=True)
-            embed.add_field(name="📊 Messages Sent", value="100 messages", inline=True)
-            embed.add_field(name="💳 New Balance", value=f"${balances[user_id]['balance']:.2f} USD", inline=True)
-            embed.add_field(name="🎯 Total Rewards", value=f"{message_tracking[user_id]['total_rewarded']} times", inline=True)
-            embed.set_footer(text="Keep chatting to earn more rewards!")
-
-            await message.author.send(embed=embed)
-        except discord.Forbidden:
-            # User has DMs disabled, send in channel
-            try:
-                embed = discord.Embed(
-                    title="💬 Chat Reward!",
-                    description=f"{message.author.mention} earned $0.10 for 100 messages!",
-                    color=0x00ff00
-                )
-                await message.channel.send(embed=embed, delete_after=10)
-            except:
-                pass
+        embed = discord.Embed(
+            title="💬 Chat Reward! 🎉",
+            description="You've been rewarded for being active in the server!",
+            color=0x00ff00
+        )
+        embed.add_field(name="💰 Reward", value="$0.10 USD", inline=True)
+        embed.add_field(name="📊 Messages Sent", value="100 messages", inline=True)
+        embed.add_field(name="💳 New Balance", value=f"${balances[user_id]['balance']:.2f} USD", inline=True)
+        embed.add_field(name="🎯 Total Rewards", value=f"{message_tracking[user_id]['total_rewarded']} times", inline=True)
+        embed.set_footer(text="Keep chatting to earn more rewards!")
+
+        # User has DMs disabled -> the dispatcher posts this in the channel instead
+        fallback_embed = discord.Embed(
+            title="💬 Chat Reward!",
+            description=f"{message.author.mention} earned $0.10 for 100 messages!",
+            color=0x00ff00
+        )
+        dm_dispatcher.send(message.author.id, embed=embed, fallback_channel=message.channel, fallback_embed=fallback_embed)
     else:
         # Save updated count
         save_message_tracking(message_tracking)
@@ -671,25 +733,16 @@ async def on_ready():
         print(f"Failed to sync commands: {e}")
 
     # Always start the webhook server and notification checker first
-    import threading
-    import subprocess
-    import sys
+    await start_webhook_server()
 
-    def start_webhook_server():
-        """Start webhook server in a separate thread"""
-        try:
-            flask_thread = threading.Thread(target=start_flask_server, daemon=True)
-            flask_thread.start()
-            print("✅ Webhook server started on port 5000")
-        except Exception as e:
-            print(f"❌ Failed to start webhook server: {e}")
-
-    # Start webhook server for Apirone callbacks
-    start_webhook_server()
+    # Redeliver notifications the last run credited but never got out (on_ready also runs on reconnects)
+    await event_bus.start()
+    print("✅ Event bus started")
 
-    # Start notification checker
-    asyncio.create_task(check_notifications())
-    print("✅ Notification checker started")
+    # Start the outbound DM worker
+    dm_dispatcher.start()
+    log_sink.start()
+    render_service.start()
 
     # Initialize Litecoin handler with bot instance
     if BLOCKCYPHER_API_KEY:
@@ -699,7 +752,7 @@ async def on_ready():
             print(f"   Webhook Secret: {'✅ Set' if WEBHOOK_SECRET else '❌ Missing'}")
 
             from crypto_handler import init_litecoin_handler
-            ltc_handler = init_litecoin_handler(BLOCKCYPHER_API_KEY, WEBHOOK_SECRET, bot)
+            ltc_handler = init_litecoin_handler(BLOCKCYPHER_API_KEY, WEBHOOK_SECRET, bot, event_bus=event_bus)
 
             if ltc_handler and hasattr(ltc_handler, 'api_key') and ltc_handler.api_key:
                 print(f"✅ Crypto handler created successfully")
@@ -709,6 +762,9 @@ async def on_ready():
                     house_wallet_initialized = await ltc_handler.initialize_house_wallet()
                     if house_wallet_initialized:
                         print(f"✅ House wallet initialized: {ltc_handler.house_wallet_address}")
+                        # Seed the local UTXO set and keep it reconciled in the background
+                        await ltc_handler.reconcile_utxos()
+                        asyncio.create_task(ltc_handler.utxo_reconcile_loop())
                     else:
                         print("⚠️ House wallet initialization failed - address generation will still work")
                         print("   This is expected if you haven't created a house wallet yet")
@@ -719,6 +775,9 @@ async def on_ready():
                     import traceback
                     traceback.print_exc()
 
+                # Replay any spooled callbacks and start draining the webhook queue
+                await webhook_queue.start()
+
                 print(f"✅ Crypto handler is ready for deposit address generation")
             else:
                 print(f"❌ Crypto handler creation failed - handler is invalid")
@@ -853,7 +912,33 @@ async def balance(interaction: discord.Interaction, user: discord.Member = None)
                             await modal_interaction.followup.send("❌ Insufficient house wallet balance", ephemeral=True)
                             return
 
-                        tx_hash = await ltc_handler.withdraw_from_house_wallet(ltc_address, amount_ltc)
+                        from crypto_handler import PayoutStatusUnknown
+                        try:
+                            tx_hash = await ltc_handler.withdraw_from_house_wallet(ltc_address, amount_ltc)
+                        except PayoutStatusUnknown as e:
+                            # It may already be on chain: hold the funds and queue the request for an admin to check
+                            user_id = str(modal_interaction.user.id)
+                            balances[user_id]["balance"] -= amount_usd
+                            save_balances(balances)
+                            withdrawal_id = f"WD-{int(time.time())}-{user_id[-6:]}"
+                            stored_requests = load_withdrawal_requests()
+                            stored_requests[withdrawal_id] = {
+                                "user_id": user_id,
+                                "username": str(modal_interaction.user),
+                                "amount_usd": amount_usd,
+                                "amount_ltc": amount_ltc,
+                                "ltc_address": ltc_address,
+                                "status": "needs_review",
+                                "review_reason": str(e),
+                                "created_at": int(time.time()),
+                                "ltc_price_at_request": ltc_price
+                            }
+                            save_withdrawal_requests(stored_requests)
+                            await modal_interaction.followup.send(
+                                f"⚠️ Your withdrawal could not be confirmed. An admin will check it and settle request `{withdrawal_id}`.",
+                                ephemeral=True
+                            )
+                            return
 
                         if tx_hash:
                             balances[str(modal_interaction.user.id)]["balance"] -= amount_usd
@@ -1268,7 +1353,7 @@ class CoinflipPlayAgainView(discord.ui.View):
 async def start_coinflip(interaction, choice, wager_usd, user_id):
 
     # Generate coin flip result first
-    coin_flip = random.choice(["heads", "tails"])
+    coin_flip = random.choice(COINFLIP_SIDES)
 
     # Start with animation
     embed = discord.Embed(title="🪙 Coinflip - Flipping...", color=0xffaa00)
@@ -1276,42 +1361,19 @@ async def start_coinflip(interaction, choice, wager_usd, user_id):
     embed.add_field(name="🎯 Your Call", value=choice.title(), inline=True)
     embed.add_field(name="⏳ Status", value="🪙 Coin is spinning...", inline=False)
 
-    # Add the coin flip image
-    coin_flip_file = None
+    # Post the game message now: the render can take longer than Discord's 3 second response window
+    await interaction.response.defer(thinking=True)
+
+    # The whole flip is one animation that plays once client-side, so there are no per-frame edits
     files = []
-    if os.path.exists("attached_assets"):
-        # Look for the coin flip image/gif in attached_assets
-        for filename in os.listdir("attached_assets"):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                coin_flip_file = discord.File(f"attached_assets/{filename}", filename="coinflip.gif")
-                embed.set_image(url="attachment://coinflip.gif")
-                files.append(coin_flip_file)
-                break
+    coinflip_animation = await render_service.render("game", "create_coinflip_animation", coin_flip, choice)
+    if coinflip_animation:
+        files.append(discord.File(coinflip_animation, filename=animation_filename("coinflip")))
+        embed.set_image(url=f"attachment://{animation_filename('coinflip')}")
 
-    try:
-        await interaction.response.send_message(embed=embed, files=files)
-    except discord.errors.NotFound: # Handle case where the initial response might fail due to interaction expiry
-        await interaction.followup.send(embed=embed, files=files)
-
-    # Animation frames
-    frames = [
-        "🪙 FLIPPING...",
-        "🔄 SPINNING...",
-        "🪙 TUMBLING...",
-        "✨ LANDING..."
-    ]
-
-    for i, frame in enumerate(frames):
-        embed.set_field_at(2, name="⏳ Status", value=f"{frame}", inline=False)
-        # Keep the image during animation but remove it on the last frame
-        if i == len(frames) - 1:
-            # Remove image for final result to prevent loop
-            embed.set_image(url=None)
-        try:
-            await interaction.edit_original_response(embed=embed, attachments=[]) # Remove attachments on subsequent edits
-        except:
-            pass # Ignore if edit fails
-        await asyncio.sleep(0.8)
+    await interaction.edit_original_response(embed=embed, attachments=files)
+
+    await asyncio.sleep(animation_seconds(COINFLIP_SPIN_FRAMES))
 
     # Game logic
     won = coin_flip == choice.lower()
@@ -1335,8 +1397,7 @@ async def start_coinflip(interaction, choice, wager_usd, user_id):
     save_balances(balances)
 
     # Create coin flip result image
-    coinflip_img_path = f"coinflip_{user_id}_{time.time()}.png"
-    game_img_gen.create_coinflip_image(coin_flip, choice, coinflip_img_path)
+    coinflip_image = await render_service.render("game", "create_coinflip_image", coin_flip, choice)
 
     # Final result
     coin_visual = "🪙" if coin_flip == "heads" else "🟡"
@@ -1354,19 +1415,13 @@ async def start_coinflip(interaction, choice, wager_usd, user_id):
     embed.add_field(name="💳 New Balance", value=f"${format_number(new_balance_usd)} USD", inline=True)
 
     files = []
-    if os.path.exists(coinflip_img_path):
-        files.append(discord.File(coinflip_img_path, filename="coinflip.png"))
-        embed.set_image(url="attachment://coinflip.png")
+    if coinflip_image:
+        files.append(discord.File(coinflip_image, filename=image_filename("coinflip")))
+        embed.set_image(url=f"attachment://{image_filename('coinflip')}")
 
     play_again_view = CoinflipPlayAgainView(wager_usd, user_id)
     await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
-    if os.path.exists(coinflip_img_path):
-        try:
-            os.remove(coinflip_img_path)
-        except:
-            pass
-
 async def start_new_coinflip_game(interaction, wager_usd, user_id):
     # Show choice selection again
     class CoinflipChoiceView(discord.ui.View):
@@ -1439,15 +1494,17 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
     initial_embed.add_field(name="💰 Wagered", value=f"${format_number(wager_usd)} USD", inline=True)
     initial_embed.add_field(name="⏳ Status", value="🎲 Rolling dice...", inline=False)
 
-    await interaction.response.send_message(embed=initial_embed)
+    # Acknowledge first: the render can take longer than Discord's 3 second response window
+    await interaction.response.defer()
 
-    # Animation frames
-    roll_frames = ["⚀", "⚁", "⚂", "⚃", "⚄", "⚅"]
-    for _ in range(2):
-        for frame in roll_frames:
-            initial_embed.set_field_at(1, name="⏳ Status", value=f"🎲 {frame} Rolling...", inline=False)
-            await interaction.edit_original_response(embed=initial_embed)
-            await asyncio.sleep(0.2)
+    files = []
+    dice_animation = await render_service.render("game", "create_dice_battle_animation", player_roll, bot_roll)
+    if dice_animation:
+        files.append(discord.File(dice_animation, filename=animation_filename("dice")))
+        initial_embed.set_image(url=f"attachment://{animation_filename('dice')}")
+
+    await interaction.edit_original_response(embed=initial_embed, attachments=files)
+    await asyncio.sleep(animation_seconds(DICE_ROLL_FRAMES))
 
     # Determine winner
     if player_roll > bot_roll:
@@ -1477,9 +1534,9 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
     save_balances(balances)
 
     # Create dice battle image
-    dice_img_path = f"dice_{user_id}_{time.time()}.png"
+    dice_image = None
     try:
-        game_img_gen.create_dice_battle_image(player_roll, bot_roll, dice_img_path)
+        dice_image = await render_service.render("game", "create_dice_battle_image", player_roll, bot_roll)
     except Exception as e:
         print(f"Error creating dice image: {e}")
 
@@ -1500,9 +1557,9 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
 
     # Attach image if it exists
     files = []
-    if os.path.exists(dice_img_path):
-        files.append(discord.File(dice_img_path, filename="dice.png"))
-        embed.set_image(url="attachment://dice.png")
+    if dice_image:
+        files.append(discord.File(dice_image, filename=image_filename("dice")))
+        embed.set_image(url=f"attachment://{image_filename('dice')}")
 
     # Create play again view
     class DicePlayAgainView(discord.ui.View):
@@ -1525,6 +1582,8 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
             await start_new_dice_game(interaction, self.wager_usd, self.user_id)
 
     async def start_new_dice_game(interaction, wager_usd, user_id):
+        await interaction.response.defer()
+
         player_roll = random.randint(1, 6)
         bot_roll = random.randint(1, 6)
 
@@ -1551,9 +1610,9 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
         add_rakeback(user_id, wager_usd)
         save_balances(balances)
 
-        dice_img_path = f"dice_{user_id}_{time.time()}.png"
+        dice_image = None
         try:
-            game_img_gen.create_dice_battle_image(player_roll, bot_roll, dice_img_path)
+            dice_image = await render_service.render("game", "create_dice_battle_image", player_roll, bot_roll)
         except Exception as e:
             print(f"Error creating dice image: {e}")
 
@@ -1571,26 +1630,15 @@ async def dice(interaction: discord.Interaction, wager_amount: str):
         embed.add_field(name="💳 New Balance", value=f"${format_number(new_balance_usd)} USD", inline=True)
 
         files = []
-        if os.path.exists(dice_img_path):
-            files.append(discord.File(dice_img_path, filename="dice.png"))
-            embed.set_image(url="attachment://dice.png")
+        if dice_image:
+            files.append(discord.File(dice_image, filename=image_filename("dice")))
+            embed.set_image(url=f"attachment://{image_filename('dice')}")
 
         play_again_view = DicePlayAgainView(wager_usd, user_id)
         await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
-        if os.path.exists(dice_img_path):
-            try:
-                os.remove(dice_img_path)
-            except:
-                pass
-
     play_again_view = DicePlayAgainView(wager_usd, user_id)
     await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
-    if os.path.exists(dice_img_path):
-        try:
-            os.remove(dice_img_path)
-        except:
-            pass
 
 # ROCK PAPER SCISSORS
 @bot.tree.command(name="rps", description="Play Rock Paper Scissors (in USD)")
@@ -1662,8 +1710,7 @@ async def rps(interaction: discord.Interaction, wager_amount: str):
     return
 
 async def start_rps_game(interaction, user_choice, wager_usd, user_id):
-    choices = ["rock", "paper", "scissors"]
-    bot_choice = random.choice(choices)
+    bot_choice = random.choice(RPS_CHOICES)
 
     # Emojis for choices
     choice_emojis = {"rock": "🪨", "paper": "📄", "scissors": "✂️"}
@@ -1701,14 +1748,16 @@ async def start_rps_game(interaction, user_choice, wager_usd, user_id):
     embed.add_field(name="💰 Wagered", value=f"${format_number(wager_usd)} USD", inline=True)
     embed.add_field(name="💳 New Balance", value=f"${format_number(new_balance_usd)} USD", inline=True)
 
+    # Post the result message now: the render can take longer than Discord's 3 second response window
+    await interaction.response.defer(thinking=True)
+
     # Create and attach RPS image
-    rps_img_path = f"rps_{user_id}_{time.time()}.png"
     files = []
     try:
-        game_img_gen.create_rps_image(user_choice, bot_choice, rps_img_path)
-        if os.path.exists(rps_img_path) and os.path.getsize(rps_img_path) > 0:
-            files.append(discord.File(rps_img_path, filename="rps.png"))
-            embed.set_image(url="attachment://rps.png")
+        rps_image = await render_service.render("game", "create_rps_image", user_choice, bot_choice)
+        if rps_image:
+            files.append(discord.File(rps_image, filename=image_filename("rps")))
+            embed.set_image(url=f"attachment://{image_filename('rps')}")
     except Exception as e:
         print(f"Error creating RPS image: {e}")
 
@@ -1770,12 +1819,7 @@ async def start_rps_game(interaction, user_choice, wager_usd, user_id):
         await interaction.response.edit_message(embed=embed, view=view)
 
     play_again_view = RPSPlayAgainView(wager_usd, user_id)
-    await interaction.response.send_message(embed=embed, view=play_again_view, files=files)
-    if os.path.exists(rps_img_path): # Clean up image file
-        try:
-            os.remove(rps_img_path)
-        except:
-            pass
+    await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
 # WITHDRAW COMMAND - Manual queue-based system
 @bot.tree.command(name="withdraw", description="Request a withdrawal in Litecoin (admin approval required)")
@@ -1808,7 +1852,7 @@ async def withdraw(interaction: discord.Interaction, amount_usd: float, ltc_addr
 
     # Check if user already has a pending withdrawal
     for wd_id, wd_data in withdrawal_requests.items():
-        if wd_data.get("user_id") == user_id and wd_data.get("status") == "pending":
+        if wd_data.get("user_id") == user_id and wd_data.get("status") in OPEN_WITHDRAWAL_STATUSES:
             await interaction.response.send_message(f"❌ You already have a pending withdrawal request (ID: `{wd_id}`). Please wait for it to be processed.", ephemeral=True)
             return
 
@@ -1912,7 +1956,7 @@ async def deposit(interaction: discord.Interaction):
         embed.set_footer(text="Your deposits are monitored 24/7 and credited automatically")
 
         # Send to user's DM instead of server
-        user = await bot.fetch_user(int(user_id))
+        user = await dm_dispatcher.get_user(user_id)
         await user.send(embed=embed)
         await interaction.followup.send("✅ Deposit address sent to your DM!", ephemeral=True)
 
@@ -1954,7 +1998,7 @@ async def slots(interaction: discord.Interaction, wager_amount: str):
         await interaction.response.send_message(f"❌ You don't have enough balance! You have ${format_number(current_balance_usd)} USD but tried to wager ${format_number(wager_usd)} USD.")
         return
 
-    symbols = ["🍒", "🍋", "🍊", "🔔", "⭐"]
+    symbols = SLOTS_SYMBOLS
     result = [random.choice(symbols) for _ in range(3)]
     result_display = " ".join(result)
 
@@ -1994,33 +2038,19 @@ async def slots(interaction: discord.Interaction, wager_amount: str):
     embed.add_field(name="🎯 Status", value="🎰 Reels are spinning...", inline=True)
     embed.add_field(name="🎪 Reels", value="🔄 🔄 🔄", inline=False)
 
-    await interaction.response.send_message(embed=embed)
+    await interaction.response.defer()
 
-    # Animation frames
-    spin_frames = [
-        "🔄 🔄 🔄",
-        "🍒 🔄 🔄",
-        "🍋 🍒 🔄",
-        "🍊 🍋 🍒",
-        "🔔 🍊 🍋",
-        "⭐ 🔔 🍊",
-        "🍒 ⭐ 🔔",
-        "🍋 🍒 ⭐"
-    ]
-
-    for frame in spin_frames:
-        embed.set_field_at(2, name="🎪 Reels", value=frame, inline=False)
-        await interaction.edit_original_response(embed=embed)
-        await asyncio.sleep(0.4)
+    files = []
+    slots_animation = await render_service.render("game", "create_slots_animation", result, SLOTS_SYMBOLS)
+    if slots_animation:
+        files.append(discord.File(slots_animation, filename=animation_filename("slots")))
+        embed.set_image(url=f"attachment://{animation_filename('slots')}")
 
-    # Show final result
-    embed.set_field_at(2, name="🎪 Final Result", value=result_display, inline=False)
-    await interaction.edit_original_response(embed=embed)
-    await asyncio.sleep(1)
+    await interaction.edit_original_response(embed=embed, attachments=files)
+    await asyncio.sleep(animation_seconds(SLOTS_SPIN_FRAMES))
 
     # Create slots image
-    slots_img_path = f"slots_{user_id}_{time.time()}.png"
-    game_img_gen.create_slots_image(result, slots_img_path)
+    slots_image = await render_service.render("game", "create_slots_image", result)
 
     # Final result embed
     embed = discord.Embed(title=title, color=color)
@@ -2031,9 +2061,9 @@ async def slots(interaction: discord.Interaction, wager_amount: str):
 
     # Attach image
     files = []
-    if os.path.exists(slots_img_path):
-        files.append(discord.File(slots_img_path, filename="slots.png"))
-        embed.set_image(url="attachment://slots.png")
+    if slots_image:
+        files.append(discord.File(slots_image, filename=image_filename("slots")))
+        embed.set_image(url=f"attachment://{image_filename('slots')}")
 
     # Create play again view
     class SlotsPlayAgainView(discord.ui.View):
@@ -2056,7 +2086,7 @@ async def slots(interaction: discord.Interaction, wager_amount: str):
             await start_new_slots_game(interaction, self.wager_usd, self.user_id)
 
     async def start_new_slots_game(interaction, wager_usd, user_id):
-        symbols = ["🍒", "🍋", "🍊", "🔔", "⭐"]
+        symbols = SLOTS_SYMBOLS
         result = [random.choice(symbols) for _ in range(3)]
         result_display = " ".join(result)
 
@@ -2096,24 +2126,20 @@ async def slots(interaction: discord.Interaction, wager_amount: str):
         play_again_view = SlotsPlayAgainView(wager_usd, user_id)
         await interaction.response.edit_message(embed=embed, view=play_again_view, attachments=files if files else [])
 
-    # Clean up image
-    if os.path.exists(slots_img_path):
-        try:
-            os.remove(slots_img_path)
-        except:
-            pass
+    play_again_view = SlotsPlayAgainView(wager_usd, user_id)
+    await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
 # BLACKJACK SIDE BET MODAL
 class SideBetModal(discord.ui.Modal, title="Side Bets"):
     perfect_pairs = discord.ui.TextInput(
-        label="Perfect Pairs (pays 30:1)",
+        label="Perfect Pairs (pays up to 25:1)",
         placeholder="Enter amount (0 to skip)",
         required=False,
         default="0"
     )
     
     twentyone_plus_three = discord.ui.TextInput(
-        label="21+3 (pays 100:1)",
+        label="21+3 (pays up to 100:1)",
         placeholder="Enter amount (0 to skip)",
         required=False,
         default="0"
@@ -2162,14 +2188,16 @@ class SideBetModal(discord.ui.Modal, title="Side Bets"):
 
 # BLACKJACK CONFIRM BET VIEW
 class BlackjackConfirmView(discord.ui.View):
-    def __init__(self, wager_usd, user_id, deck, player_hand, dealer_hand):
+    def __init__(self, wager_usd, user_id, shoe, player_hand, dealer_hand):
         super().__init__(timeout=60)
         self.wager_usd = wager_usd
         self.user_id = user_id
-        self.deck = deck
+        self.shoe = shoe
         self.player_hand = player_hand
         self.dealer_hand = dealer_hand
         self.side_bets = {"perfect_pairs": 0, "21+3": 0}
+        # Identifies this round's table canvas in the render workers
+        self.table_id = f"{user_id}-{time.time_ns()}"
 
     @discord.ui.button(label="✅ Confirm Bet", style=discord.ButtonStyle.success, row=0)
     async def confirm_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -2197,6 +2225,8 @@ class BlackjackConfirmView(discord.ui.View):
         balances[self.user_id]["balance"] += self.wager_usd
         balances[self.user_id]["wagered"] -= self.wager_usd
         save_balances(balances)
+        self.shoe.end_round()
+        self.stop()
         
         await interaction.response.edit_message(
             content="❌ Bet cancelled. Wager refunded.",
@@ -2204,6 +2234,10 @@ class BlackjackConfirmView(discord.ui.View):
             view=None
         )
 
+    async def on_timeout(self):
+        # Abandoned before confirming - free the shoe for the player's next round
+        self.shoe.end_round()
+
     async def start_game(self, interaction: discord.Interaction):
         # Deduct side bets
         total_side_bets = self.side_bets["perfect_pairs"] + self.side_bets["21+3"]
@@ -2214,42 +2248,50 @@ class BlackjackConfirmView(discord.ui.View):
             save_balances(balances)
 
         # Check for immediate blackjacks
-        player_blackjack = card_generator.hand_value(self.player_hand) == 21
-        dealer_blackjack = card_generator.hand_value(self.dealer_hand) == 21
+        player_blackjack = self.player_hand.total == 21
+        dealer_blackjack = self.dealer_hand.total == 21
 
         # Calculate side bet payouts
         side_bet_winnings = 0
         side_bet_results = ""
         
-        # Perfect Pairs check
+        # Perfect Pairs check - standard multi-deck pay table, since a shoe can deal the same card twice
         if self.side_bets["perfect_pairs"] > 0:
-            if self.player_hand[0][0] == self.player_hand[1][0]:
-                if self.player_hand[0][1] == self.player_hand[1][1]:
+            first, second = self.player_hand[0], self.player_hand[1]
+            if card_rank(first) == card_rank(second):
+                if first == second:
                     # Perfect pair (same rank and suit)
-                    payout = self.side_bets["perfect_pairs"] * 30
+                    payout = self.side_bets["perfect_pairs"] * 25
                     side_bet_winnings += payout
                     side_bet_results += f"🎉 Perfect Pair! Won ${payout:.2f}\n"
-                else:
+                elif card_is_red(first) == card_is_red(second):
                     # Colored pair (same rank and color)
                     payout = self.side_bets["perfect_pairs"] * 12
                     side_bet_winnings += payout
                     side_bet_results += f"✅ Colored Pair! Won ${payout:.2f}\n"
+                else:
+                    # Mixed pair (same rank, different color)
+                    payout = self.side_bets["perfect_pairs"] * 6
+                    side_bet_winnings += payout
+                    side_bet_results += f"✅ Mixed Pair! Won ${payout:.2f}\n"
             else:
                 side_bet_results += f"❌ No pair\n"
         
         # 21+3 check (three card poker with first 2 player cards + dealer up card)
         if self.side_bets["21+3"] > 0:
             three_cards = [self.player_hand[0], self.player_hand[1], self.dealer_hand[0]]
-            ranks = [c[0] for c in three_cards]
-            suits = [c[1] for c in three_cards]
+            ranks = [card_rank(c) for c in three_cards]
+            suits = [card_suit(c) for c in three_cards]
+            flush = len(set(suits)) == 1
+            straight = is_three_card_straight(three_cards)
             
             # Check for suited trips (3 of same rank and suit)
-            if len(set(ranks)) == 1 and len(set(suits)) == 1:
+            if len(set(ranks)) == 1 and flush:
                 payout = self.side_bets["21+3"] * 100
                 side_bet_winnings += payout
                 side_bet_results += f"🎉 Suited Trips! Won ${payout:.2f}\n"
             # Check for straight flush
-            elif len(set(suits)) == 1:
+            elif straight and flush:
                 payout = self.side_bets["21+3"] * 40
                 side_bet_winnings += payout
                 side_bet_results += f"🎉 Straight Flush! Won ${payout:.2f}\n"
@@ -2258,6 +2300,14 @@ class BlackjackConfirmView(discord.ui.View):
                 payout = self.side_bets["21+3"] * 30
                 side_bet_winnings += payout
                 side_bet_results += f"🎉 Three of a Kind! Won ${payout:.2f}\n"
+            elif straight:
+                payout = self.side_bets["21+3"] * 10
+                side_bet_winnings += payout
+                side_bet_results += f"✅ Straight! Won ${payout:.2f}\n"
+            elif flush:
+                payout = self.side_bets["21+3"] * 5
+                side_bet_winnings += payout
+                side_bet_results += f"✅ Flush! Won ${payout:.2f}\n"
             else:
                 side_bet_results += f"❌ No 21+3 win\n"
         
@@ -2289,57 +2339,60 @@ class BlackjackConfirmView(discord.ui.View):
             save_balances(balances)
 
             embed = discord.Embed(title=title, color=color)
-            embed.add_field(name="🃏 Your Hand", value=f"{card_generator.format_hand(self.player_hand)} = {card_generator.hand_value(self.player_hand)}", inline=True)
-            embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand)} = {card_generator.hand_value(self.dealer_hand)}", inline=True)
+            embed.add_field(name="🃏 Your Hand", value=f"{format_hand(self.player_hand)} = {self.player_hand.total}", inline=True)
+            embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand)} = {self.dealer_hand.total}", inline=True)
             embed.add_field(name="🎯 Result", value=result_text, inline=False)
             if side_bet_results:
                 embed.add_field(name="💎 Side Bets", value=side_bet_results, inline=False)
             embed.add_field(name="💰 Wagered", value=f"${self.wager_usd:.2f} USD", inline=True)
             embed.add_field(name="💳 New Balance", value=f"${new_balance_usd:.2f} USD", inline=True)
 
+            self.shoe.end_round()
+            self.stop()
             await interaction.response.edit_message(embed=embed, view=None)
             return
 
+        # Acknowledge the click first: rendering can take longer than Discord's 3 second response window
+        await interaction.response.defer()
+
         # Create game image
-        initial_img = f"initial_blackjack_{self.user_id}.png"
+        initial_img = None
         try:
-            card_generator.save_blackjack_game_image([self.player_hand], self.dealer_hand, initial_img, 0, hide_dealer_first=True)
+            initial_img = await render_service.render("card", "encode_blackjack_table", self.table_id, [self.player_hand], self.dealer_hand, 0, hide_dealer_first=True)
         except Exception as e:
             print(f"Error creating initial blackjack image: {e}")
 
         # Create game embed
         embed = discord.Embed(title="🃏 Blackjack - Your Turn", color=0x0099ff)
-        embed.add_field(name="🃏 Your Hand", value=f"{card_generator.format_hand(self.player_hand)} = **{card_generator.hand_value(self.player_hand)}**", inline=True)
-        embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+        embed.add_field(name="🃏 Your Hand", value=f"{format_hand(self.player_hand)} = **{self.player_hand.total}**", inline=True)
+        embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
         embed.add_field(name="💰 Wager", value=f"${self.wager_usd:.2f} USD", inline=True)
         if side_bet_results:
             embed.add_field(name="💎 Side Bets", value=side_bet_results, inline=False)
         embed.set_footer(text="Hit: take card | Stand: keep hand | Double: double bet + 1 card | Split: split pairs")
 
         files = []
-        if os.path.exists(initial_img):
-            files.append(discord.File(initial_img, filename="blackjack_start.png"))
-            embed.set_image(url="attachment://blackjack_start.png")
+        if initial_img:
+            files.append(discord.File(initial_img, filename=image_filename("blackjack_start")))
+            embed.set_image(url=f"attachment://{image_filename('blackjack_start')}")
 
-        view = BlackjackView([self.player_hand], self.dealer_hand, self.deck, self.wager_usd, self.user_id, 0)
+        view = BlackjackView([self.player_hand], self.dealer_hand, self.shoe, self.wager_usd, self.user_id, 0, self.table_id)
+        # The round and its shoe now belong to the game view
+        self.stop()
 
         try:
-            await interaction.response.edit_message(embed=embed, view=view, attachments=files)
-            if os.path.exists(initial_img):
-                try:
-                    os.remove(initial_img)
-                except:
-                    pass
+            await interaction.edit_original_response(embed=embed, view=view, attachments=files)
         except Exception as e:
-            await interaction.response.edit_message(embed=embed, view=view)
+            await interaction.edit_original_response(embed=embed, view=view)
 
 # BLACKJACK VIEW CLASS
 class BlackjackView(discord.ui.View):
-    def __init__(self, player_hands, dealer_hand, deck, wager_usd, user_id, current_hand_index=0):
+    def __init__(self, player_hands, dealer_hand, shoe, wager_usd, user_id, current_hand_index=0, table_id=None):
         super().__init__(timeout=300)
+        self.table_id = table_id or f"{user_id}-{time.time_ns()}"
         self.player_hands = player_hands  # List of hands for split support
         self.dealer_hand = dealer_hand
-        self.deck = deck
+        self.shoe = shoe
         self.wager_usd = wager_usd
         self.user_id = user_id
         self.current_hand_index = current_hand_index
@@ -2347,7 +2400,7 @@ class BlackjackView(discord.ui.View):
         self.split_count = len(player_hands) - 1
         
         # Disable split button if already split or can't split
-        if len(player_hands) > 1 or len(player_hands[0]) != 2 or player_hands[0][0][0] != player_hands[0][1][0]:
+        if len(player_hands) > 1 or len(player_hands[0]) != 2 or card_rank(player_hands[0][0]) != card_rank(player_hands[0][1]):
             for item in self.children:
                 if hasattr(item, 'label') and item.label == "✂️ Split":
                     item.disabled = True
@@ -2358,14 +2411,17 @@ class BlackjackView(discord.ui.View):
             await interaction.response.send_message("This is not your game!", ephemeral=True)
             return
 
+        # Every path below renders the table, which can outlast Discord's 3 second response window
+        await interaction.response.defer()
+
         current_hand = self.player_hands[self.current_hand_index]
-        current_hand.append(self.deck.pop())
-        player_value = card_generator.hand_value(current_hand)
+        current_hand.append(self.shoe.deal())
+        player_value = current_hand.total
 
         # Create updated image
-        game_img = f"blackjack_{self.user_id}_{time.time()}.png"
+        game_img = None
         try:
-            card_generator.save_blackjack_game_image(self.player_hands, self.dealer_hand, game_img, self.current_hand_index, hide_dealer_first=True)
+            game_img = await render_service.render("card", "encode_blackjack_table", self.table_id, self.player_hands, self.dealer_hand, self.current_hand_index, hide_dealer_first=True)
         except Exception as e:
             print(f"Error creating blackjack image: {e}")
 
@@ -2375,22 +2431,17 @@ class BlackjackView(discord.ui.View):
                 # Move to next hand
                 self.current_hand_index += 1
                 embed = discord.Embed(title=f"🃏 Blackjack - Hand {self.current_hand_index} Busted!", color=0xff6600)
-                embed.add_field(name=f"🃏 Hand {self.current_hand_index}", value=f"{card_generator.format_hand(current_hand)} = **{player_value}** (BUST)", inline=True)
-                embed.add_field(name=f"🃏 Next Hand", value=f"{card_generator.format_hand(self.player_hands[self.current_hand_index])} = **{card_generator.hand_value(self.player_hands[self.current_hand_index])}**", inline=True)
-                embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+                embed.add_field(name=f"🃏 Hand {self.current_hand_index}", value=f"{format_hand(current_hand)} = **{player_value}** (BUST)", inline=True)
+                embed.add_field(name=f"🃏 Next Hand", value=f"{format_hand(self.player_hands[self.current_hand_index])} = **{self.player_hands[self.current_hand_index].total}**", inline=True)
+                embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
                 embed.set_footer(text=f"Playing hand {self.current_hand_index + 1} of {len(self.player_hands)}")
                 
                 files = []
-                if os.path.exists(game_img):
-                    files.append(discord.File(game_img, filename="blackjack.png"))
-                    embed.set_image(url="attachment://blackjack.png")
+                if game_img:
+                    files.append(discord.File(game_img, filename=image_filename("blackjack")))
+                    embed.set_image(url=f"attachment://{image_filename('blackjack')}")
                 
-                await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-                if os.path.exists(game_img):
-                    try:
-                        os.remove(game_img)
-                    except:
-                        pass
+                await interaction.edit_original_response(embed=embed, view=self, attachments=files)
             else:
                 # All hands done
                 await self.finish_game(interaction)
@@ -2399,42 +2450,32 @@ class BlackjackView(discord.ui.View):
             if self.current_hand_index < len(self.player_hands) - 1:
                 self.current_hand_index += 1
                 embed = discord.Embed(title=f"🃏 Blackjack - Hand {self.current_hand_index} stands at 21!", color=0x00ff00)
-                embed.add_field(name=f"🃏 Previous Hand", value=f"{card_generator.format_hand(current_hand)} = **21**", inline=True)
-                embed.add_field(name=f"🃏 Current Hand", value=f"{card_generator.format_hand(self.player_hands[self.current_hand_index])} = **{card_generator.hand_value(self.player_hands[self.current_hand_index])}**", inline=True)
-                embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+                embed.add_field(name=f"🃏 Previous Hand", value=f"{format_hand(current_hand)} = **21**", inline=True)
+                embed.add_field(name=f"🃏 Current Hand", value=f"{format_hand(self.player_hands[self.current_hand_index])} = **{self.player_hands[self.current_hand_index].total}**", inline=True)
+                embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
                 
                 files = []
-                if os.path.exists(game_img):
-                    files.append(discord.File(game_img, filename="blackjack.png"))
-                    embed.set_image(url="attachment://blackjack.png")
+                if game_img:
+                    files.append(discord.File(game_img, filename=image_filename("blackjack")))
+                    embed.set_image(url=f"attachment://{image_filename('blackjack')}")
                 
-                await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-                if os.path.exists(game_img):
-                    try:
-                        os.remove(game_img)
-                    except:
-                        pass
+                await interaction.edit_original_response(embed=embed, view=self, attachments=files)
             else:
                 await self.finish_game(interaction)
         else:
             embed = discord.Embed(title=f"🃏 Blackjack - Hand {self.current_hand_index + 1}", color=0x0099ff)
-            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{card_generator.format_hand(current_hand)} = **{player_value}**", inline=True)
-            embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{format_hand(current_hand)} = **{player_value}**", inline=True)
+            embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
             embed.add_field(name="💰 Wager", value=f"${self.wager_usd:.2f} USD", inline=True)
             if len(self.player_hands) > 1:
                 embed.set_footer(text=f"Playing hand {self.current_hand_index + 1} of {len(self.player_hands)}")
 
             files = []
-            if os.path.exists(game_img):
-                files.append(discord.File(game_img, filename="blackjack.png"))
-                embed.set_image(url="attachment://blackjack.png")
+            if game_img:
+                files.append(discord.File(game_img, filename=image_filename("blackjack")))
+                embed.set_image(url=f"attachment://{image_filename('blackjack')}")
 
-            await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-            if os.path.exists(game_img):
-                try:
-                    os.remove(game_img)
-                except:
-                    pass
+            await interaction.edit_original_response(embed=embed, view=self, attachments=files)
 
     @discord.ui.button(label="✋ Stand", style=discord.ButtonStyle.secondary)
     async def stand_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -2442,32 +2483,29 @@ class BlackjackView(discord.ui.View):
             await interaction.response.send_message("This is not your game!", ephemeral=True)
             return
 
+        await interaction.response.defer()
+
         if self.current_hand_index < len(self.player_hands) - 1:
             # Move to next hand
             self.current_hand_index += 1
             
-            game_img = f"blackjack_{self.user_id}_{time.time()}.png"
+            game_img = None
             try:
-                card_generator.save_blackjack_game_image(self.player_hands, self.dealer_hand, game_img, self.current_hand_index, hide_dealer_first=True)
+                game_img = await render_service.render("card", "encode_blackjack_table", self.table_id, self.player_hands, self.dealer_hand, self.current_hand_index, hide_dealer_first=True)
             except Exception as e:
                 print(f"Error creating blackjack image: {e}")
             
             embed = discord.Embed(title=f"🃏 Blackjack - Hand {self.current_hand_index + 1}", color=0x0099ff)
-            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{card_generator.format_hand(self.player_hands[self.current_hand_index])} = **{card_generator.hand_value(self.player_hands[self.current_hand_index])}**", inline=True)
-            embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{format_hand(self.player_hands[self.current_hand_index])} = **{self.player_hands[self.current_hand_index].total}**", inline=True)
+            embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
             embed.set_footer(text=f"Playing hand {self.current_hand_index + 1} of {len(self.player_hands)}")
             
             files = []
-            if os.path.exists(game_img):
-                files.append(discord.File(game_img, filename="blackjack.png"))
-                embed.set_image(url="attachment://blackjack.png")
+            if game_img:
+                files.append(discord.File(game_img, filename=image_filename("blackjack")))
+                embed.set_image(url=f"attachment://{image_filename('blackjack')}")
             
-            await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-            if os.path.exists(game_img):
-                try:
-                    os.remove(game_img)
-                except:
-                    pass
+            await interaction.edit_original_response(embed=embed, view=self, attachments=files)
         else:
             await self.finish_game(interaction)
 
@@ -2481,6 +2519,8 @@ class BlackjackView(discord.ui.View):
             await interaction.response.send_message(f"❌ Not enough balance to double down! You need ${self.wager_usd:.2f} more.", ephemeral=True)
             return
 
+        await interaction.response.defer()
+
         balances[self.user_id]["balance"] -= self.wager_usd
         balances[self.user_id]["wagered"] += self.wager_usd
         add_rakeback(self.user_id, self.wager_usd)
@@ -2488,32 +2528,27 @@ class BlackjackView(discord.ui.View):
         save_balances(balances)
 
         current_hand = self.player_hands[self.current_hand_index]
-        current_hand.append(self.deck.pop())
+        current_hand.append(self.shoe.deal())
 
         if self.current_hand_index < len(self.player_hands) - 1:
             self.current_hand_index += 1
             
-            game_img = f"blackjack_{self.user_id}_{time.time()}.png"
+            game_img = None
             try:
-                card_generator.save_blackjack_game_image(self.player_hands, self.dealer_hand, game_img, self.current_hand_index, hide_dealer_first=True)
+                game_img = await render_service.render("card", "encode_blackjack_table", self.table_id, self.player_hands, self.dealer_hand, self.current_hand_index, hide_dealer_first=True)
             except Exception as e:
                 print(f"Error creating blackjack image: {e}")
             
             embed = discord.Embed(title=f"🃏 Blackjack - Doubled Down! Next Hand", color=0x0099ff)
-            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{card_generator.format_hand(self.player_hands[self.current_hand_index])} = **{card_generator.hand_value(self.player_hands[self.current_hand_index])}**", inline=True)
-            embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+            embed.add_field(name=f"🃏 Your Hand {self.current_hand_index + 1}", value=f"{format_hand(self.player_hands[self.current_hand_index])} = **{self.player_hands[self.current_hand_index].total}**", inline=True)
+            embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
             
             files = []
-            if os.path.exists(game_img):
-                files.append(discord.File(game_img, filename="blackjack.png"))
-                embed.set_image(url="attachment://blackjack.png")
+            if game_img:
+                files.append(discord.File(game_img, filename=image_filename("blackjack")))
+                embed.set_image(url=f"attachment://{image_filename('blackjack')}")
             
-            await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-            if os.path.exists(game_img):
-                try:
-                    os.remove(game_img)
-                except:
-                    pass
+            await interaction.edit_original_response(embed=embed, view=self, attachments=files)
         else:
             await self.finish_game(interaction)
 
@@ -2526,7 +2561,7 @@ class BlackjackView(discord.ui.View):
         current_hand = self.player_hands[self.current_hand_index]
         
         # Check if can split
-        if len(current_hand) != 2 or current_hand[0][0] != current_hand[1][0]:
+        if len(current_hand) != 2 or card_rank(current_hand[0]) != card_rank(current_hand[1]):
             await interaction.response.send_message("❌ You can only split pairs!", ephemeral=True)
             return
 
@@ -2534,6 +2569,8 @@ class BlackjackView(discord.ui.View):
             await interaction.response.send_message(f"❌ Not enough balance to split! You need ${self.wager_usd:.2f} more.", ephemeral=True)
             return
 
+        await interaction.response.defer()
+
         # Deduct additional wager for split
         balances[self.user_id]["balance"] -= self.wager_usd
         balances[self.user_id]["wagered"] += self.wager_usd
@@ -2541,9 +2578,9 @@ class BlackjackView(discord.ui.View):
         save_balances(balances)
 
         # Split the hand
-        new_hand = [current_hand.pop()]
-        current_hand.append(self.deck.pop())
-        new_hand.append(self.deck.pop())
+        new_hand = Hand([current_hand.pop()])
+        current_hand.append(self.shoe.deal())
+        new_hand.append(self.shoe.deal())
         
         self.player_hands.insert(self.current_hand_index + 1, new_hand)
         
@@ -2552,30 +2589,29 @@ class BlackjackView(discord.ui.View):
             if hasattr(item, 'label') and item.label == "✂️ Split":
                 item.disabled = True
 
-        game_img = f"blackjack_{self.user_id}_{time.time()}.png"
+        game_img = None
         try:
-            card_generator.save_blackjack_game_image(self.player_hands, self.dealer_hand, game_img, self.current_hand_index, hide_dealer_first=True)
+            game_img = await render_service.render("card", "encode_blackjack_table", self.table_id, self.player_hands, self.dealer_hand, self.current_hand_index, hide_dealer_first=True)
         except Exception as e:
             print(f"Error creating blackjack image: {e}")
 
         embed = discord.Embed(title="🃏 Blackjack - Hand Split! ✂️", color=0x0099ff)
-        embed.add_field(name=f"🃏 Hand 1", value=f"{card_generator.format_hand(current_hand)} = **{card_generator.hand_value(current_hand)}**", inline=True)
-        embed.add_field(name=f"🃏 Hand 2", value=f"{card_generator.format_hand(new_hand)} = **{card_generator.hand_value(new_hand)}**", inline=True)
-        embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
+        embed.add_field(name=f"🃏 Hand 1", value=f"{format_hand(current_hand)} = **{current_hand.total}**", inline=True)
+        embed.add_field(name=f"🃏 Hand 2", value=f"{format_hand(new_hand)} = **{new_hand.total}**", inline=True)
+        embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand, hide_first=True)} = **?**", inline=True)
         embed.add_field(name="💰 Total Wager", value=f"${self.wager_usd * 2:.2f} USD", inline=True)
         embed.set_footer(text=f"Playing hand 1 of {len(self.player_hands)}")
 
         files = []
-        if os.path.exists(game_img):
-            files.append(discord.File(game_img, filename="blackjack.png"))
-            embed.set_image(url="attachment://blackjack.png")
+        if game_img:
+            files.append(discord.File(game_img, filename=image_filename("blackjack")))
+            embed.set_image(url=f"attachment://{image_filename('blackjack')}")
 
-        await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-        if os.path.exists(game_img):
-            try:
-                os.remove(game_img)
-            except:
-                pass
+        await interaction.edit_original_response(embed=embed, view=self, attachments=files)
+
+    async def on_timeout(self):
+        # Abandoned mid-hand - free the shoe for the player's next round
+        self.shoe.end_round()
 
     async def finish_game(self, interaction: discord.Interaction):
         self.game_over = True
@@ -2583,17 +2619,19 @@ class BlackjackView(discord.ui.View):
             item.disabled = True
 
         # Dealer draws
-        while card_generator.hand_value(self.dealer_hand) < 17:
-            self.dealer_hand.append(self.deck.pop())
+        while self.dealer_hand.total < 17:
+            self.dealer_hand.append(self.shoe.deal())
+        self.shoe.end_round()
+        self.stop()
 
-        dealer_value = card_generator.hand_value(self.dealer_hand)
+        dealer_value = self.dealer_hand.total
 
         # Calculate results for each hand
         total_winnings = 0
         results_text = ""
         
         for i, hand in enumerate(self.player_hands):
-            player_value = card_generator.hand_value(hand)
+            player_value = hand.total
             
             if player_value > 21:
                 results_text += f"Hand {i+1}: **{player_value}** - BUST 💥\n"
@@ -2626,34 +2664,27 @@ class BlackjackView(discord.ui.View):
         new_balance_usd = balances[self.user_id]["balance"]
 
         # Create final image with dealer cards revealed
-        final_img = f"blackjack_final_{self.user_id}_{time.time()}.png"
+        final_img = None
         try:
-            card_generator.save_blackjack_game_image(self.player_hands, self.dealer_hand, final_img, 0, hide_dealer_first=False)
+            final_img = await render_service.render("card", "encode_blackjack_table", self.table_id, self.player_hands, self.dealer_hand, 0, hide_dealer_first=False)
         except Exception as e:
             print(f"Error creating final blackjack image: {e}")
 
         embed = discord.Embed(title=title, color=color)
-        embed.add_field(name="🤖 Dealer Hand", value=f"{card_generator.format_hand(self.dealer_hand)} = **{dealer_value}**", inline=False)
+        embed.add_field(name="🤖 Dealer Hand", value=f"{format_hand(self.dealer_hand)} = **{dealer_value}**", inline=False)
         embed.add_field(name="🎯 Results", value=results_text, inline=False)
         embed.add_field(name="💰 Total Wagered", value=f"${self.wager_usd * len(self.player_hands):.2f} USD", inline=True)
         embed.add_field(name="💳 New Balance", value=f"${new_balance_usd:.2f} USD", inline=True)
 
         files = []
-        if os.path.exists(final_img):
-            files.append(discord.File(final_img, filename="blackjack_final.png"))
-            embed.set_image(url="attachment://blackjack_final.png")
+        if final_img:
+            files.append(discord.File(final_img, filename=image_filename("blackjack_final")))
+            embed.set_image(url=f"attachment://{image_filename('blackjack_final')}")
 
         try:
-            await interaction.response.edit_message(embed=embed, view=self, attachments=files)
+            await interaction.edit_original_response(embed=embed, view=self, attachments=files)
         except:
-            await interaction.response.defer()
             await interaction.followup.send(embed=embed, view=self, files=files)
-        
-        if os.path.exists(final_img):
-            try:
-                os.remove(final_img)
-            except:
-                pass
 
 # BLACKJACK
 @bot.tree.command(name="blackjack", description="Play Blackjack against the dealer (in USD)")
@@ -2693,15 +2724,10 @@ async def blackjack(interaction: discord.Interaction, wager_amount: str):
     add_rakeback(user_id, wager_usd)
     save_balances(balances)
 
-    # Create deck
-    suits = ['♠️', '♥️', '♦️', '♣️']
-    ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-    deck = [(rank, suit) for suit in suits for rank in ranks]
-    random.shuffle(deck)
-
-    # Deal initial cards
-    player_hand = [deck.pop(), deck.pop()]
-    dealer_hand = [deck.pop(), deck.pop()]
+    # Deal initial cards from the player's shoe
+    shoe = get_shoe(blackjack_shoes, user_id, BLACKJACK_DECKS)
+    player_hand = Hand([shoe.deal(), shoe.deal()])
+    dealer_hand = Hand([shoe.deal(), shoe.deal()])
 
     # Show confirm bet screen (without revealing cards)
     embed = discord.Embed(title="🃏 Blackjack - Confirm Your Bet", color=0x0099ff)
@@ -2709,10 +2735,10 @@ async def blackjack(interaction: discord.Interaction, wager_amount: str):
     embed.add_field(name="💳 Current Balance", value=f"${format_number(balances[user_id]['balance'])} USD", inline=True)
     embed.add_field(name="🎲 Game Ready", value="Cards will be dealt after confirmation", inline=True)
     embed.add_field(name="ℹ️ Game Rules", value="• Blackjack pays 3:2\n• Dealer stands on 17\n• Can split pairs\n• Can double down", inline=False)
-    embed.add_field(name="💎 Side Bets Available", value="• Perfect Pairs (30:1)\n• 21+3 (100:1)", inline=False)
+    embed.add_field(name="💎 Side Bets Available", value="• Perfect Pairs (up to 25:1)\n• 21+3 (up to 100:1)", inline=False)
     embed.set_footer(text="Click 'Side Bets' to add side bets or 'Confirm Bet' to start!")
 
-    view = BlackjackConfirmView(wager_usd, user_id, deck, player_hand, dealer_hand)
+    view = BlackjackConfirmView(wager_usd, user_id, shoe, player_hand, dealer_hand)
     await interaction.response.send_message(embed=embed, view=view)
 
 # MINES
@@ -3370,32 +3396,27 @@ async def limbo(interaction: discord.Interaction, wager_amount: str, target_mult
         await interaction.response.send_message(f"❌ You don't have enough balance! You have ${format_number(current_balance_usd)} USD but tried to wager ${format_number(wager_usd)} USD.")
         return
 
-    # Start animation
+    # Generate result (house edge based on target multiplier)
+    # Higher targets have lower win probability
+    win_chance = (1 / target_multiplier) * 0.95  # 5% house edge
+    won = random.random() < win_chance
+
+    # Start animation - one clip counting up to the target, played client-side
     embed = discord.Embed(title="🌌 Limbo - Calculating...", color=0x9932cc)
     embed.add_field(name="💰 Wagered", value=f"${format_number(wager_usd)} USD", inline=True)
     embed.add_field(name="🎯 Target", value=f"{target_multiplier:.2f}x", inline=True)
     embed.add_field(name="⏳ Status", value="🔮 Rolling the cosmic dice...", inline=False)
 
-    await interaction.response.send_message(embed=embed)
+    await interaction.response.defer()
 
-    # Animation frames
-    frames = [
-        "🌌 Entering the void...",
-        "⭐ Stars are aligning...",
-        "🌠 Cosmic forces at work...",
-        "🔮 Reality is bending...",
-        "✨ The universe decides..."
-    ]
-
-    for frame in frames:
-        embed.set_field_at(2, name="⏳ Status", value=frame, inline=False)
-        await interaction.edit_original_response(embed=embed)
-        await asyncio.sleep(0.6)
+    files = []
+    limbo_animation = await render_service.render("game", "create_limbo_animation", target_multiplier, won)
+    if limbo_animation:
+        files.append(discord.File(limbo_animation, filename=animation_filename("limbo")))
+        embed.set_image(url=f"attachment://{animation_filename('limbo')}")
 
-    # Generate result (house edge based on target multiplier)
-    # Higher targets have lower win probability
-    win_chance = (1 / target_multiplier) * 0.95  # 5% house edge
-    won = random.random() < win_chance
+    await interaction.edit_original_response(embed=embed, attachments=files)
+    await asyncio.sleep(animation_seconds(LIMBO_COUNT_FRAMES))
 
     if won:
         # Player wins - add back wager plus winnings
@@ -3454,28 +3475,26 @@ async def limbo(interaction: discord.Interaction, wager_amount: str, target_mult
         add_rakeback(user_id, wager_usd)
         save_balances(balances)
 
+        # Generate result
+        win_chance = (1 / target_multiplier) * 0.95
+        won = random.random() < win_chance
+
         # Start animation
         embed = discord.Embed(title="🌌 Limbo - Calculating...", color=0x9932cc)
         embed.add_field(name="💰 Wagered", value=f"${format_number(wager_usd)} USD", inline=True)
         embed.add_field(name="🎯 Target", value=f"{target_multiplier:.2f}x", inline=True)
         embed.add_field(name="⏳ Status", value="🔮 Rolling the cosmic dice...", inline=False)
 
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.defer()
 
-        # Animation frames
-        frames = [
-            "🌌 Entering the void...", "⭐ Stars are aligning...", "🌠 Cosmic forces at work...",
-            "🔮 Reality is bending...", "✨ The universe decides..."
-        ]
-
-        for frame in frames:
-            embed.set_field_at(2, name="⏳ Status", value=frame, inline=False)
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.6)
+        files = []
+        limbo_animation = await render_service.render("game", "create_limbo_animation", target_multiplier, won)
+        if limbo_animation:
+            files.append(discord.File(limbo_animation, filename=animation_filename("limbo")))
+            embed.set_image(url=f"attachment://{animation_filename('limbo')}")
 
-        # Generate result
-        win_chance = (1 / target_multiplier) * 0.95
-        won = random.random() < win_chance
+        await interaction.edit_original_response(embed=embed, view=None, attachments=files)
+        await asyncio.sleep(animation_seconds(LIMBO_COUNT_FRAMES))
 
         if won:
             # Player wins - add back wager plus winnings
@@ -3502,13 +3521,45 @@ async def limbo(interaction: discord.Interaction, wager_amount: str, target_mult
 
         save_balances(balances)
 
+        files = []
+        limbo_image = await render_service.render("game", "create_limbo_image", target_multiplier, won)
+        if limbo_image:
+            files.append(discord.File(limbo_image, filename=image_filename("limbo")))
+            embed.set_image(url=f"attachment://{image_filename('limbo')}")
+
         play_again_view = LimboPlayAgainView(wager_usd, target_multiplier, user_id)
-        await interaction.edit_original_response(embed=embed, view=play_again_view)
+        await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
+
+    files = []
+    limbo_image = await render_service.render("game", "create_limbo_image", target_multiplier, won)
+    if limbo_image:
+        files.append(discord.File(limbo_image, filename=image_filename("limbo")))
+        embed.set_image(url=f"attachment://{image_filename('limbo')}")
 
     play_again_view = LimboPlayAgainView(wager_usd, target_multiplier, user_id)
-    await interaction.edit_original_response(embed=embed, view=play_again_view)
+    await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
 # PLINKO
+def roll_plinko_path(rows, num_buckets, difficulty):
+    """Bounce the ball down every row and return its bucket position after each one"""
+    position = num_buckets // 2  # Start at center
+    path = []
+    for level in range(rows):
+        # Random bounce left or right (influenced by difficulty)
+        if difficulty.lower() == "low":
+            # More predictable bounces
+            bounce = random.choice([-1, 0, 1])
+        elif difficulty.lower() == "medium":
+            # Normal bounces
+            bounce = random.choice([-1, 1])
+        else:  # high
+            # More chaotic bounces
+            bounce = random.choice([-2, -1, 1, 2])
+
+        position = max(0, min(num_buckets - 1, position + bounce))
+        path.append(position)
+    return path
+
 @bot.tree.command(name="plinko", description="Drop a ball down the Plinko board with customizable rows and difficulty! (in USD)")
 async def plinko(interaction: discord.Interaction, wager_amount: str, rows: int = 8, difficulty: str = "medium"):
     user_id = str(interaction.user.id)
@@ -3584,48 +3635,29 @@ async def plinko(interaction: discord.Interaction, wager_amount: str, rows: int
             # Center buckets
             multipliers.append(center_multiplier)
 
+    # Simulate ball path up front so the whole drop can be sent as one animation
+    path = roll_plinko_path(rows, num_buckets, difficulty)
+
     # Start animation
     embed = discord.Embed(title=f"🏀 Plinko - {rows} Rows ({difficulty.title()} Risk)", color=0xff6600)
     embed.add_field(name="💰 Wagered", value=f"${format_number(wager_usd)} USD", inline=True)
     embed.add_field(name="📊 Rows", value=f"{rows} rows", inline=True)
     embed.add_field(name="⚡ Difficulty", value=difficulty.title(), inline=True)
-    embed.add_field(name="🏀 Ball", value="Starting at top!", inline=False)
+    embed.add_field(name="🏀 Ball", value="Dropping...", inline=False)
 
-    await interaction.response.send_message(embed=embed)
-
-    # Simulate ball path
-    position = num_buckets // 2  # Start at center
-
-    # Ball bounces down the specified number of rows
-    for level in range(rows):
-        # Random bounce left or right (influenced by difficulty)
-        if difficulty.lower() == "low":
-            # More predictable bounces
-            bounce = random.choice([-1, 0, 1])
-        elif difficulty.lower() == "medium":
-            # Normal bounces
-            bounce = random.choice([-1, 1])
-        else:  # high
-            # More chaotic bounces
-            bounce = random.choice([-2, -1, 1, 2])
-
-        position = max(0, min(num_buckets - 1, position + bounce))
-
-        # Create ball visualization
-        ball_visual = ""
-        for i in range(num_buckets):
-            if i == position:
-                ball_visual += "🏀"
-            else:
-                ball_visual += "⚫"
+    await interaction.response.defer()
 
-        embed.set_field_at(3, name="🏀 Ball", value=f"Row {level + 1}/{rows}: {ball_visual}", inline=False)
+    files = []
+    plinko_animation = await render_service.render("game", "create_plinko_animation", path, multipliers)
+    if plinko_animation:
+        files.append(discord.File(plinko_animation, filename=animation_filename("plinko")))
+        embed.set_image(url=f"attachment://{animation_filename('plinko')}")
 
-        await interaction.edit_original_response(embed=embed)
-        await asyncio.sleep(0.5)
+    await interaction.edit_original_response(embed=embed, attachments=files)
+    await asyncio.sleep(animation_seconds(rows * PLINKO_FRAMES_PER_ROW))
 
     # Final position determines multiplier
-    final_position = position
+    final_position = path[-1]
     multiplier = multipliers[final_position]
 
     # Calculate winnings (apply house edge)
@@ -3721,41 +3753,29 @@ async def plinko(interaction: discord.Interaction, wager_amount: str, rows: int
             else:
                 multipliers.append(center_multiplier)
 
+        # Simulate ball path
+        path = roll_plinko_path(rows, num_buckets, difficulty)
+
         # Start animation
         embed = discord.Embed(title=f"🏀 Plinko - {rows} Rows ({difficulty.title()} Risk)", color=0xff6600)
         embed.add_field(name="💰 Bet", value=f"${wager_usd:.2f} USD", inline=True)
         embed.add_field(name="📊 Rows", value=f"{rows} rows", inline=True)
         embed.add_field(name="⚡ Difficulty", value=difficulty.title(), inline=True)
-        embed.add_field(name="🏀 Ball", value="Starting at top!", inline=False)
+        embed.add_field(name="🏀 Ball", value="Dropping...", inline=False)
 
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.defer()
 
-        # Simulate ball path
-        position = num_buckets // 2
-
-        for level in range(rows):
-            if difficulty.lower() == "low":
-                bounce = random.choice([-1, 0, 1])
-            elif difficulty.lower() == "medium":
-                bounce = random.choice([-1, 1])
-            else:  # high
-                bounce = random.choice([-2, -1, 1, 2])
-
-            position = max(0, min(num_buckets - 1, position + bounce))
-
-            ball_visual = ""
-            for i in range(num_buckets):
-                if i == position:
-                    ball_visual += "🏀"
-                else:
-                    ball_visual += "⚫"
+        files = []
+        plinko_animation = await render_service.render("game", "create_plinko_animation", path, multipliers)
+        if plinko_animation:
+            files.append(discord.File(plinko_animation, filename=animation_filename("plinko")))
+            embed.set_image(url=f"attachment://{animation_filename('plinko')}")
 
-            embed.set_field_at(3, name="🏀 Ball", value=f"Row {level + 1}/{rows}: {ball_visual}", inline=False)
-            await interaction.edit_original_response(embed=embed)
-            await asyncio.sleep(0.5)
+        await interaction.edit_original_response(embed=embed, view=None, attachments=files)
+        await asyncio.sleep(animation_seconds(rows * PLINKO_FRAMES_PER_ROW))
 
         # Final result
-        final_position = position
+        final_position = path[-1]
         multiplier = multipliers[final_position]
 
         if multiplier >= 1:
@@ -3799,11 +3819,23 @@ async def plinko(interaction: discord.Interaction, wager_amount: str, rows: int
         add_rakeback(user_id, wager_usd)
         save_balances(balances)
 
+        files = []
+        plinko_image = await render_service.render("game", "create_plinko_image", path, multipliers)
+        if plinko_image:
+            files.append(discord.File(plinko_image, filename=image_filename("plinko")))
+            embed.set_image(url=f"attachment://{image_filename('plinko')}")
+
         play_again_view = PlinkoPlayAgainView(wager_usd, rows, difficulty, user_id)
-        await interaction.edit_original_response(embed=embed, view=play_again_view)
+        await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
+
+    files = []
+    plinko_image = await render_service.render("game", "create_plinko_image", path, multipliers)
+    if plinko_image:
+        files.append(discord.File(plinko_image, filename=image_filename("plinko")))
+        embed.set_image(url=f"attachment://{image_filename('plinko')}")
 
     play_again_view = PlinkoPlayAgainView(wager_usd, rows, difficulty, user_id)
-    await interaction.edit_original_response(embed=embed, view=play_again_view)
+    await interaction.edit_original_response(embed=embed, view=play_again_view, attachments=files)
 
 # HOUSE BALANCE
 @bot.tree.command(name="housebalance", description="Admin command to check house wallet balance")
@@ -3887,7 +3919,12 @@ async def housewithdraw(interaction: discord.Interaction, amount_ltc: float, ltc
         return
 
     # Withdraw from house wallet
-    tx_hash = await ltc_handler.withdraw_from_house_wallet(ltc_address, amount_ltc)
+    from crypto_handler import PayoutStatusUnknown
+    try:
+        tx_hash = await ltc_handler.withdraw_from_house_wallet(ltc_address, amount_ltc)
+    except PayoutStatusUnknown as e:
+        await interaction.followup.send(f"⚠️ The withdrawal may or may not have been broadcast ({e}). Check the house wallet on chain before retrying.", ephemeral=True)
+        return
 
     if tx_hash:
         # Update house balance stats
@@ -3921,8 +3958,9 @@ async def queue(interaction: discord.Interaction):
     global withdrawal_requests
     withdrawal_requests = load_withdrawal_requests()
 
-    # Filter pending withdrawals
-    pending = {wd_id: wd for wd_id, wd in withdrawal_requests.items() if wd.get("status") == "pending"}
+    # Everything still waiting on an admin: new, approved for the next batch, or left for review by a batch
+    pending = {wd_id: wd for wd_id, wd in withdrawal_requests.items()
+               if wd.get("status") in ("pending", "approved", "needs_review")}
 
     if not pending:
         embed = discord.Embed(
@@ -3947,14 +3985,15 @@ async def queue(interaction: discord.Interaction):
             value=f"**User:** {wd['username']}\n"
                   f"**Amount:** ${wd['amount_usd']:.2f} USD (~{wd['amount_ltc']:.8f} LTC)\n"
                   f"**Address:** `{wd['ltc_address'][:20]}...`\n"
+                  f"**Status:** {wd['status']}\n"
                   f"**Requested:** {created_time}",
             inline=False
         )
 
     if len(pending) > 10:
-        embed.set_footer(text="Showing 10 of {len(pending)} pending requests. Use /confirmwithdraw <id> to process.")
+        embed.set_footer(text=f"Showing 10 of {len(pending)} requests. /approvewithdraw <id> queues one for /batchwithdraw; /resolvewithdraw settles ones under review.")
     else:
-        embed.set_footer(text="Use /confirmwithdraw <id> to process a withdrawal.")
+        embed.set_footer(text="/approvewithdraw <id> queues one for /batchwithdraw; /resolvewithdraw settles ones under review.")
 
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -3976,7 +4015,7 @@ async def confirmwithdraw(interaction: discord.Interaction, withdrawal_id: str):
     wd = withdrawal_requests[withdrawal_id]
 
     # Check if already processed
-    if wd.get("status") != "pending":
+    if wd.get("status") not in ("pending", "approved"):
         await interaction.response.send_message(f"❌ Withdrawal `{withdrawal_id}` has already been {wd.get('status')}.", ephemeral=True)
         return
 
@@ -4014,27 +4053,19 @@ async def confirmwithdraw(interaction: discord.Interaction, withdrawal_id: str):
 
         await interaction.followup.send(embed=embed, ephemeral=True)
 
-        # Try to notify the user
-        try:
-            user = await bot.fetch_user(int(user_id))
-            if user:
-                user_embed = discord.Embed(
-                    title="✅ Withdrawal Approved!",
-                    description="Your withdrawal request has been approved and is being processed.",
-                    color=0x00ff00
-                )
-                user_embed.add_field(name="🆔 Request ID", value=f"`{withdrawal_id}`", inline=True)
-                user_embed.add_field(name="💵 Amount", value=f"${wd['amount_usd']:.2f} USD", inline=True)
-                user_embed.add_field(name="💰 LTC", value=f"~{wd['amount_ltc']:.8f} LTC", inline=True)
-                user_embed.add_field(name="📍 Destination", value=f"`{wd['ltc_address']}`", inline=False)
-                user_embed.set_footer(text="LTC will be sent to your address shortly.")
-                await user.send(embed=user_embed)
-        except Exception as e:
-            print(f"Could not notify user {user_id}: {e}")
+        # Notify the user
+        event_bus.publish(
+            "withdrawal_completed",
+            withdrawal_id=withdrawal_id,
+            user_id=user_id,
+            amount_usd=wd["amount_usd"],
+            amount_ltc=wd["amount_ltc"],
+            ltc_address=wd["ltc_address"]
+        )
 
         # Log the admin withdrawal confirmation
         try:
-            target_user = await bot.fetch_user(int(user_id))
+            target_user = await dm_dispatcher.get_user(user_id)
             await log_admin_withdraw(interaction.user, target_user, wd["amount_usd"], wd["ltc_address"], withdrawal_id)
         except Exception as e:
             print(f"Failed to log admin withdraw: {e}")
@@ -4043,6 +4074,202 @@ async def confirmwithdraw(interaction: discord.Interaction, withdrawal_id: str):
         print(f"Error confirming withdrawal: {e}")
         await interaction.followup.send(f"❌ Error processing withdrawal: {e}", ephemeral=True)
 
+async def settle_paid_withdrawals(paid: dict, admin, tx_hash: str = None):
+    """Book already-recorded payouts: user and house stats, then a DM and an admin log entry per request"""
+    total_usd = 0.0
+    for wd in paid.values():
+        user_id = wd["user_id"]
+        if user_id in balances:
+            balances[user_id]["withdrawn"] += wd["amount_usd"]
+        total_usd += wd["amount_usd"]
+    save_balances(balances)
+
+    house_stats = load_house_balance()
+    house_stats['total_withdrawals'] += total_usd
+    save_house_balance(house_stats)
+
+    for wd_id, wd in paid.items():
+        user_id = wd["user_id"]
+        event_bus.publish(
+            "withdrawal_completed",
+            withdrawal_id=wd_id,
+            user_id=user_id,
+            amount_usd=wd["amount_usd"],
+            amount_ltc=wd["amount_ltc"],
+            ltc_address=wd["ltc_address"],
+            tx_hash=tx_hash
+        )
+        try:
+            target_user = await dm_dispatcher.get_user(user_id)
+            await log_admin_withdraw(admin, target_user, wd["amount_usd"], wd["ltc_address"], wd_id)
+        except Exception as e:
+            print(f"Failed to log admin withdraw: {e}")
+
+# APPROVE WITHDRAW - Admin command to approve a request for the next batch payout
+@bot.tree.command(name="approvewithdraw", description="Admin command to approve a withdrawal request for /batchwithdraw")
+async def approvewithdraw(interaction: discord.Interaction, withdrawal_id: str):
+    if not is_admin(interaction.user.id):
+        await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+        return
+
+    global withdrawal_requests
+    withdrawal_requests = load_withdrawal_requests()
+
+    if withdrawal_id not in withdrawal_requests:
+        await interaction.response.send_message(f"❌ Withdrawal request `{withdrawal_id}` not found.", ephemeral=True)
+        return
+
+    wd = withdrawal_requests[withdrawal_id]
+    if wd.get("status") != "pending":
+        await interaction.response.send_message(f"❌ Withdrawal `{withdrawal_id}` is {wd.get('status')}, not pending.", ephemeral=True)
+        return
+
+    withdrawal_requests[withdrawal_id]["status"] = "approved"
+    withdrawal_requests[withdrawal_id]["approved_at"] = int(time.time())
+    withdrawal_requests[withdrawal_id]["approved_by"] = str(interaction.user.id)
+    save_withdrawal_requests(withdrawal_requests)
+
+    await interaction.response.send_message(
+        f"✅ Withdrawal `{withdrawal_id}` (${wd['amount_usd']:.2f} USD to `{wd['ltc_address']}`) approved for the next /batchwithdraw.",
+        ephemeral=True
+    )
+
+# BATCH WITHDRAW - Admin command to pay out every approved withdrawal in one transaction
+@bot.tree.command(name="batchwithdraw", description="Admin command to pay all approved withdrawals in a single transaction")
+async def batchwithdraw(interaction: discord.Interaction):
+    if not is_admin(interaction.user.id):
+        await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+        return
+
+    if not ltc_handler or not ltc_handler.house_wallet_address:
+        await interaction.response.send_message("❌ House wallet not initialized!", ephemeral=True)
+        return
+
+    from crypto_handler import PayoutStatusUnknown
+    global withdrawal_requests
+
+    # Only one batch at a time: a second run must not see the same approved requests
+    if batch_withdraw_lock.locked():
+        await interaction.response.send_message("⏳ A batch withdrawal is already running.", ephemeral=True)
+        return
+
+    async with batch_withdraw_lock:
+        withdrawal_requests = load_withdrawal_requests()
+
+        approved = {wd_id: wd for wd_id, wd in withdrawal_requests.items() if wd.get("status") == "approved"}
+
+        if not approved:
+            await interaction.response.send_message("📋 No approved withdrawal requests to pay out. Use /approvewithdraw first.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+
+        # Move the batch in flight before anything is broadcast, so neither a retry nor
+        # /confirmwithdraw or /cancelwithdraw can pick these requests up again
+        for wd_id in approved:
+            withdrawal_requests[wd_id]["status"] = "processing"
+        save_withdrawal_requests(withdrawal_requests)
+
+        # One multi-output transaction: a single txs/new + txs/send round trip and one network fee
+        payouts = [(wd["ltc_address"], wd["amount_ltc"]) for wd in approved.values()]
+        try:
+            tx_hash = await ltc_handler.send_house_payouts(payouts)
+        except PayoutStatusUnknown as e:
+            # The transaction may be on chain - these must be checked by hand, never paid again blindly
+            for wd_id in approved:
+                withdrawal_requests[wd_id]["status"] = "needs_review"
+                withdrawal_requests[wd_id]["review_reason"] = str(e)
+            save_withdrawal_requests(withdrawal_requests)
+            await interaction.followup.send(
+                f"⚠️ The batch payout may or may not have been broadcast ({e}). {len(approved)} request(s) are marked "
+                "for review: check the house wallet on chain, then use /resolvewithdraw for each.",
+                ephemeral=True
+            )
+            return
+
+        if not tx_hash:
+            # send_house_payouts only returns None when nothing reached the network
+            for wd_id in approved:
+                withdrawal_requests[wd_id]["status"] = "approved"
+            save_withdrawal_requests(withdrawal_requests)
+            await interaction.followup.send("❌ Failed to broadcast the batch payout. No withdrawals were marked as complete.", ephemeral=True)
+            return
+
+        # Record the payout before any other bookkeeping so nothing below can leave it unpaid on disk
+        completed_at = int(time.time())
+        for wd_id in approved:
+            withdrawal_requests[wd_id]["status"] = "completed"
+            withdrawal_requests[wd_id]["completed_at"] = completed_at
+            withdrawal_requests[wd_id]["completed_by"] = str(interaction.user.id)
+            withdrawal_requests[wd_id]["tx_hash"] = tx_hash
+        save_withdrawal_requests(withdrawal_requests)
+
+    total_usd = sum(wd["amount_usd"] for wd in approved.values())
+    total_ltc = sum(wd["amount_ltc"] for wd in approved.values())
+
+    embed = discord.Embed(
+        title="✅ Batch Withdrawal Sent",
+        description=f"Paid **{len(approved)}** withdrawal request(s) in a single transaction.",
+        color=0x00ff00
+    )
+    embed.add_field(name="💵 Total USD", value=f"${total_usd:.2f} USD", inline=True)
+    embed.add_field(name="💰 Total LTC", value=f"~{total_ltc:.8f} LTC", inline=True)
+    embed.add_field(name="🔗 Transaction", value=f"`{tx_hash}`", inline=False)
+    embed.set_footer(text="All included users have been notified.")
+
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+    # Book the payouts, notify users and log each one
+    await settle_paid_withdrawals(approved, interaction.user, tx_hash)
+
+# RESOLVE WITHDRAW - Admin command to settle a request a batch left in flight
+@bot.tree.command(name="resolvewithdraw", description="Admin command to settle a withdrawal stuck in processing or review")
+async def resolvewithdraw(interaction: discord.Interaction, withdrawal_id: str, outcome: str, tx_hash: str = None):
+    """outcome "paid" (tx_hash required) if the payout is on chain, "unpaid" to return it to the approved queue"""
+    if not is_admin(interaction.user.id):
+        await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+        return
+
+    global withdrawal_requests
+
+    outcome = outcome.lower().strip()
+    if outcome not in ("paid", "unpaid"):
+        await interaction.response.send_message("❌ Outcome must be `paid` or `unpaid`.", ephemeral=True)
+        return
+    if outcome == "paid" and not tx_hash:
+        await interaction.response.send_message("❌ Give the on-chain tx_hash when marking a withdrawal as paid.", ephemeral=True)
+        return
+
+    # A running batch owns its requests until it has recorded the outcome
+    async with batch_withdraw_lock:
+        withdrawal_requests = load_withdrawal_requests()
+
+        if withdrawal_id not in withdrawal_requests:
+            await interaction.response.send_message(f"❌ Withdrawal request `{withdrawal_id}` not found.", ephemeral=True)
+            return
+
+        wd = withdrawal_requests[withdrawal_id]
+        if wd.get("status") not in ("processing", "needs_review"):
+            await interaction.response.send_message(f"❌ Withdrawal `{withdrawal_id}` is {wd.get('status')}, nothing to resolve.", ephemeral=True)
+            return
+
+        if outcome == "unpaid":
+            withdrawal_requests[withdrawal_id]["status"] = "approved"
+            withdrawal_requests[withdrawal_id].pop("review_reason", None)
+            save_withdrawal_requests(withdrawal_requests)
+            await interaction.response.send_message(f"↩️ Withdrawal `{withdrawal_id}` returned to the approved queue.", ephemeral=True)
+            return
+
+        withdrawal_requests[withdrawal_id]["status"] = "completed"
+        withdrawal_requests[withdrawal_id]["completed_at"] = int(time.time())
+        withdrawal_requests[withdrawal_id]["completed_by"] = str(interaction.user.id)
+        withdrawal_requests[withdrawal_id]["tx_hash"] = tx_hash
+        withdrawal_requests[withdrawal_id].pop("review_reason", None)
+        save_withdrawal_requests(withdrawal_requests)
+
+    await interaction.response.send_message(f"✅ Withdrawal `{withdrawal_id}` marked as paid in `{tx_hash}`.", ephemeral=True)
+    await settle_paid_withdrawals({withdrawal_id: wd}, interaction.user, tx_hash)
+
 # CANCEL WITHDRAW - Admin command to cancel/reject a withdrawal
 @bot.tree.command(name="cancelwithdraw", description="Admin command to cancel/reject a withdrawal request")
 async def cancelwithdraw(interaction: discord.Interaction, withdrawal_id: str, reason: str = "No reason provided"):
@@ -4061,7 +4288,7 @@ async def cancelwithdraw(interaction: discord.Interaction, withdrawal_id: str, r
     wd = withdrawal_requests[withdrawal_id]
 
     # Check if already processed
-    if wd.get("status") != "pending":
+    if wd.get("status") not in ("pending", "approved"):
         await interaction.response.send_message(f"❌ Withdrawal `{withdrawal_id}` has already been {wd.get('status')}.", ephemeral=True)
         return
 
@@ -4090,22 +4317,17 @@ async def cancelwithdraw(interaction: discord.Interaction, withdrawal_id: str, r
 
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    # Try to notify the user
-    try:
-        user = await bot.fetch_user(int(user_id))
-        if user:
-            user_embed = discord.Embed(
-                title="❌ Withdrawal Request Cancelled",
-                description="Your withdrawal request has been cancelled by an administrator.",
-                color=0xff0000
-            )
-            user_embed.add_field(name="🆔 Request ID", value=f"`{withdrawal_id}`", inline=True)
-            user_embed.add_field(name="💵 Amount Refunded", value=f"${wd['amount_usd']:.2f} USD", inline=True)
-            user_embed.add_field(name="📝 Reason", value=reason, inline=False)
-            user_embed.set_footer(text="Your funds have been returned to your balance.")
-            await user.send(embed=user_embed)
-    except Exception as e:
-        print(f"Could not notify user {user_id}: {e}")
+    # Notify the user
+    user_embed = discord.Embed(
+        title="❌ Withdrawal Request Cancelled",
+        description="Your withdrawal request has been cancelled by an administrator.",
+        color=0xff0000
+    )
+    user_embed.add_field(name="🆔 Request ID", value=f"`{withdrawal_id}`", inline=True)
+    user_embed.add_field(name="💵 Amount Refunded", value=f"${wd['amount_usd']:.2f} USD", inline=True)
+    user_embed.add_field(name="📝 Reason", value=reason, inline=False)
+    user_embed.set_footer(text="Your funds have been returned to your balance.")
+    dm_dispatcher.send(user_id, embed=user_embed)
 
 # HOUSE DEPOSIT
 @bot.tree.command(name="housedosit", description="Admin command to get house wallet deposit address")
@@ -4216,18 +4438,14 @@ async def start_baccarat_game(interaction, bet_on, wager_usd, user_id):
     add_rakeback(user_id, wager_usd)
     save_balances(balances)
 
-    # Deal cards
-    deck = list(range(1, 14)) * 4  # A-K, 4 suits
-    random.shuffle(deck)
-
-    player_cards = [deck.pop(), deck.pop()]
-    banker_cards = [deck.pop(), deck.pop()]
+    # Deal cards from the player's shoe
+    shoe = get_shoe(baccarat_shoes, user_id, BACCARAT_DECKS)
 
-    def card_value(card):
-        return min(card, 10)
+    player_cards = [shoe.deal(), shoe.deal()]
+    banker_cards = [shoe.deal(), shoe.deal()]
 
     def hand_total(cards):
-        return sum(card_value(c) for c in cards) % 10
+        return sum(baccarat_points(c) for c in cards) % 10
 
     player_total = hand_total(player_cards)
     banker_total = hand_total(banker_cards)
@@ -4237,25 +4455,28 @@ async def start_baccarat_game(interaction, bet_on, wager_usd, user_id):
     banker_drew = False
 
     if player_total <= 5 and banker_total < 8:
-        player_cards.append(deck.pop())
+        player_cards.append(shoe.deal())
         player_drew = True
         player_total = hand_total(player_cards)
 
     if not player_drew and banker_total <= 5:
-        banker_cards.append(deck.pop())
+        banker_cards.append(shoe.deal())
         banker_drew = True
         banker_total = hand_total(banker_cards)
     elif player_drew:
-        third_card = player_cards[2]
+        third_card = baccarat_points(player_cards[2])
         if (banker_total <= 2) or \
            (banker_total == 3 and third_card != 8) or \
            (banker_total == 4 and 2 <= third_card <= 7) or \
            (banker_total == 5 and 4 <= third_card <= 7) or \
            (banker_total == 6 and 6 <= third_card <= 7):
-            banker_cards.append(deck.pop())
+            banker_cards.append(shoe.deal())
             banker_drew = True
             banker_total = hand_total(banker_cards)
 
+    # Every card of the round is out
+    shoe.end_round()
+
     # Determine winner
     bet = bet_on.lower()
     if player_total > banker_total:
@@ -4286,31 +4507,26 @@ async def start_baccarat_game(interaction, bet_on, wager_usd, user_id):
     new_balance_usd = balances[user_id]["balance"]
 
     embed = discord.Embed(title=title, color=color)
-    embed.add_field(name="👤 Player Hand", value=f"{player_cards} = **{player_total}**", inline=True)
-    embed.add_field(name="🏦 Banker Hand", value=f"{banker_cards} = **{banker_total}**", inline=True)
+    embed.add_field(name="👤 Player Hand", value=f"{format_hand(player_cards)} = **{player_total}**", inline=True)
+    embed.add_field(name="🏦 Banker Hand", value=f"{format_hand(banker_cards)} = **{banker_total}**", inline=True)
     embed.add_field(name="🏆 Winner", value=winner.title(), inline=True)
     embed.add_field(name="🎯 Your Bet", value=bet_on.title(), inline=True)
     embed.add_field(name="💰 Wagered", value=f"${wager_usd:.2f} USD", inline=True)
     embed.add_field(name="💳 New Balance", value=f"${format_number(new_balance_usd)} USD", inline=True)
 
+    await interaction.response.defer()
+
     # Create baccarat image using game image generator
-    baccarat_img_path = f"baccarat_{user_id}_{time.time()}.png"
     files = []
     try:
-        game_img_gen.create_baccarat_image(player_cards, banker_cards, player_total, banker_total, baccarat_img_path)
+        baccarat_image = await render_service.render("game", "create_baccarat_image", player_cards, banker_cards, player_total, banker_total)
 
-        files.append(discord.File(baccarat_img_path, filename="baccarat.png"))
-        embed.set_image(url="attachment://baccarat.png")
-        await interaction.response.send_message(embed=embed, files=files)
-
-        # Clean up
-        try:
-            os.remove(baccarat_img_path)
-        except:
-            pass
+        files.append(discord.File(baccarat_image, filename=image_filename("baccarat")))
+        embed.set_image(url=f"attachment://{image_filename('baccarat')}")
+        await interaction.edit_original_response(embed=embed, attachments=files)
     except Exception as e:
         print(f"Error creating baccarat image: {e}")
-        await interaction.response.send_message(embed=embed)
+        await interaction.edit_original_response(embed=embed)
 
 # BALLOON PUMP
 @bot.tree.command(name="balloon", description="Pump the balloon without popping it! (in USD)")
@@ -4376,6 +4592,9 @@ async def balloon(interaction: discord.Interaction, wager_amount: str):
                 await interaction.response.send_message("This is not your game!", ephemeral=True)
                 return
 
+            # Both outcomes render the balloon, which can outlast Discord's 3 second response window
+            await interaction.response.defer()
+
             self.pumps += 1
             self.current_multiplier = round(self.current_multiplier * (1 + self.multiplier_increase), 2)
             self.current_winnings = round(self.wager_usd * self.current_multiplier, 2)
@@ -4396,22 +4615,16 @@ async def balloon(interaction: discord.Interaction, wager_amount: str):
                 embed.add_field(name="💳 New Balance", value=f"${format_number(new_balance_usd)} USD", inline=True)
 
                 # Create balloon popped image
-                balloon_img_path = f"balloon_{self.user_id}_{time.time()}.png"
                 files = []
                 try:
-                    game_img_gen.create_balloon_image(self.pumps, True, balloon_img_path)
-                    files.append(discord.File(balloon_img_path, filename="balloon.png"))
-                    embed.set_image(url="attachment://balloon.png")
+                    balloon_image = await render_service.render("game", "create_balloon_image", self.pumps, True)
+                    files.append(discord.File(balloon_image, filename=image_filename("balloon")))
+                    embed.set_image(url=f"attachment://{image_filename('balloon')}")
                 except Exception as e:
                     print(f"Error creating balloon image: {e}")
 
-                await interaction.response.edit_message(embed=embed, view=self, attachments=files)
+                await interaction.edit_original_response(embed=embed, view=self, attachments=files)
 
-                if os.path.exists(balloon_img_path):
-                    try:
-                        os.remove(balloon_img_path)
-                    except:
-                        pass
             else:
                 balloon_size = "🎈" * min(self.pumps, 10)
 
@@ -4423,23 +4636,15 @@ async def balloon(interaction: discord.Interaction, wager_amount: str):
                 embed.set_footer(text="Keep pumping or cash out before it pops!")
 
                 # Create balloon image
-                balloon_img_path = f"balloon_{self.user_id}_{time.time()}.png"
                 files = []
                 try:
-                    game_img_gen.create_balloon_image(self.pumps, False, balloon_img_path)
-                    files.append(discord.File(balloon_img_path, filename="balloon.png"))
-                    embed.set_image(url="attachment://balloon.png")
+                    balloon_image = await render_service.render("game", "create_balloon_image", self.pumps, False)
+                    files.append(discord.File(balloon_image, filename=image_filename("balloon")))
+                    embed.set_image(url=f"attachment://{image_filename('balloon')}")
                 except Exception as e:
                     print(f"Error creating balloon image: {e}")
 
-                await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-
-                # Clean up
-                if os.path.exists(balloon_img_path):
-                    try:
-                        os.remove(balloon_img_path)
-                    except:
-                        pass
+                await interaction.edit_original_response(embed=embed, view=self, attachments=files)
 
         @discord.ui.button(label="💰 Cash Out", style=discord.ButtonStyle.green)
         async def cashout_button(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -4451,6 +4656,8 @@ async def balloon(interaction: discord.Interaction, wager_amount: str):
                 await interaction.response.send_message("You need to pump at least once before cashing out!", ephemeral=True)
                 return
 
+            await interaction.response.defer()
+
             self.game_over = True
             self.clear_items()
 
@@ -4469,22 +4676,15 @@ async def balloon(interaction: discord.Interaction, wager_amount: str):
             embed.add_field(name="🎈 Final Balloon", value=balloon_size, inline=False)
 
             # Create balloon cashout image
-            balloon_img_path = f"balloon_{self.user_id}_{time.time()}.png"
             files = []
             try:
-                game_img_gen.create_balloon_image(self.pumps, False, balloon_img_path)
-                files.append(discord.File(balloon_img_path, filename="balloon.png"))
-                embed.set_image(url="attachment://balloon.png")
+                balloon_image = await render_service.render("game", "create_balloon_image", self.pumps, False)
+                files.append(discord.File(balloon_image, filename=image_filename("balloon")))
+                embed.set_image(url=f"attachment://{image_filename('balloon')}")
             except Exception as e:
                 print(f"Error creating balloon image: {e}")
 
-            await interaction.response.edit_message(embed=embed, view=self, attachments=files)
-
-            if os.path.exists(balloon_img_path):
-                try:
-                    os.remove(balloon_img_path)
-                except:
-                    pass
+            await interaction.edit_original_response(embed=embed, view=self, attachments=files)
 
     embed = discord.Embed(title="🎈 Balloon Pump", color=0xff6600)
     embed.add_field(name="💰 Wager", value=f"${wager_usd:.2f} USD", inline=True)
@@ -4791,6 +4991,9 @@ async def help_command(interaction: discord.Interaction):
                 embed.add_field(name="🔄 Reset Stats", value="`/resetstats [user]` - Reset user's complete account", inline=False)
                 embed.add_field(name="🏦 House Balance", value="`/housebalance` - Check house wallet balance", inline=False)
                 embed.add_field(name="📤 House Withdraw", value="`/housewithdraw [ltc] [address]` - Withdraw from house", inline=False)
+                embed.add_field(name="✅ Approve Withdraw", value="`/approvewithdraw [id]` - Approve a request for the next batch", inline=False)
+                embed.add_field(name="📦 Batch Withdraw", value="`/batchwithdraw` - Pay all approved withdrawals in one transaction", inline=False)
+                embed.add_field(name="🔍 Resolve Withdraw", value="`/resolvewithdraw [id] [paid|unpaid] [tx_hash]` - Settle a request left under review", inline=False)
                 embed.add_field(name="💰 House Deposit", value="`/housedosit` - Get house deposit address", inline=False)
                 embed.set_footer(text="⚠️ Use admin commands responsibly")
 
@@ -1,10 +1,12 @@
 
-import os
-from PIL import Image, ImageDraw, ImageFont
-import requests
-from io import BytesIO
-import asyncio
-import aiohttp
+from PIL import Image, ImageDraw
+from collections import OrderedDict
+from font_registry import get_font
+from image_encoder import encode_image
+from cards import Hand, card_rank, card_suit, format_hand
+
+# Green felt background for tables and hands
+FELT_COLOR = (34, 87, 45)
 
 class CardImageGenerator:
     def __init__(self):
@@ -12,6 +14,25 @@ class CardImageGenerator:
         self.card_height = 200
         self.card_spacing = 10
 
+        # Sprite atlas: each of the 52 faces (indexed by card int) plus the back is drawn once, then pasted
+        self.card_sprites = [None] * 52
+        self.back_sprite = None
+
+        # Shared fonts, parsed once instead of on every card render
+        self.font_rank = get_font("card_rank", 36)
+        self.font_suit_corner = get_font("regular", 32)
+        self.font_suit_center = get_font("regular", 70)
+        self.font_title = get_font("label", 18)
+        self.font_value = get_font("label", 16)
+
+        # Encodes finished tables and hands (format set by IMAGE_FORMAT / PNG_COMPRESS_LEVEL)
+        self.encoder = encode_image
+
+        # Live blackjack tables keyed by table id, least recently used first.
+        # The render service sends every frame of a table to the same worker, so each worker holds only its share.
+        self.tables = OrderedDict()
+        self.max_tables = 16
+
     def get_card_color(self, suit):
         """Get color for the card suit"""
         if suit in ['♥️', '♦️']:
@@ -19,30 +40,15 @@ class CardImageGenerator:
         else:
             return (0, 0, 0)  # Black
 
-    def card_value(self, card):
-        """Calculate the value of a single card"""
-        rank = card[0]
-        if rank in ['J', 'Q', 'K']:
-            return 10
-        elif rank == 'A':
-            return 11
-        else:
-            return int(rank)
-
     def hand_value(self, hand):
-        """Calculate the total value of a hand of cards"""
-        value = sum(self.card_value(card) for card in hand)
-        aces = sum(1 for card in hand if card[0] == 'A')
-        while value > 21 and aces:
-            value -= 10
-            aces -= 1
-        return value
+        """Calculate the total value of a hand of cards (a Hand already knows it)"""
+        if not isinstance(hand, Hand):
+            hand = Hand(hand)
+        return hand.total
 
     def format_hand(self, hand, hide_first=False):
         """Format a hand for display"""
-        if hide_first:
-            return f"🂠 {hand[1][0]}{hand[1][1]}"
-        return " ".join(f"{card[0]}{card[1]}" for card in hand)
+        return format_hand(hand, hide_first)
 
     def create_card_image(self, rank, suit):
         """Create a premium playing card with enhanced styling"""
@@ -62,20 +68,9 @@ class CardImageGenerator:
         # Get colors
         color = self.get_card_color(suit)
 
-        try:
-            # Try to load fonts with better sizing
-            font_rank = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 36)
-            font_suit_corner = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 32)
-            font_suit_center = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 70)
-        except:
-            try:
-                font_rank = ImageFont.truetype("arial.ttf", 36)
-                font_suit_corner = ImageFont.truetype("arial.ttf", 32)
-                font_suit_center = ImageFont.truetype("arial.ttf", 70)
-            except:
-                font_rank = ImageFont.load_default()
-                font_suit_corner = ImageFont.load_default()
-                font_suit_center = ImageFont.load_default()
+        font_rank = self.font_rank
+        font_suit_corner = self.font_suit_corner
+        font_suit_center = self.font_suit_center
 
         # Clean suit symbol
         suit_symbol = suit.replace('️', '').strip()
@@ -123,6 +118,26 @@ class CardImageGenerator:
 
         return img
 
+    def get_card_sprite(self, card):
+        """Return the pre-rendered face for a card int, drawing it on first use"""
+        sprite = self.card_sprites[card]
+        if sprite is None:
+            sprite = self.create_card_image(card_rank(card), card_suit(card))
+            self.card_sprites[card] = sprite
+        return sprite
+
+    def get_back_sprite(self):
+        """Return the pre-rendered face-down card"""
+        if self.back_sprite is None:
+            self.back_sprite = self.create_back_card()
+        return self.back_sprite
+
+    def build_card_atlas(self):
+        """Render all 53 card images up front so no table render draws a card"""
+        for card in range(52):
+            self.get_card_sprite(card)
+        self.get_back_sprite()
+
     def draw_pips_betrush_style(self, draw, rank, suit_symbol, color, font):
         """Draw pips for number cards in BetRush style with better spacing"""
         try:
@@ -221,94 +236,18 @@ class CardImageGenerator:
         """Create a comprehensive blackjack game image showing all hands in BetRush style"""
         if not player_hands or not dealer_hand:
             return None
-
-        # Calculate dimensions
-        max_cards_in_hand = max(len(hand) for hand in player_hands + [dealer_hand])
-        total_width = max_cards_in_hand * (self.card_width + self.card_spacing) + 40
-        
-        # Height for dealer + player sections
-        dealer_height = self.card_height + 80
-        if len(player_hands) > 1:
-            player_height = len(player_hands) * (self.card_height + 80)
-        else:
-            player_height = self.card_height + 80
-        
-        total_height = dealer_height + player_height + 40
-
-        # Create canvas with green felt background like BetRush
-        canvas = Image.new('RGB', (total_width, total_height), (34, 87, 45))
-        draw = ImageDraw.Draw(canvas)
-
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 18)
-            value_font = ImageFont.truetype("arial.ttf", 16)
-        except:
-            title_font = ImageFont.load_default()
-            value_font = ImageFont.load_default()
-
-        # Calculate hand values
-        def hand_value(hand):
-            value = 0
-            aces = 0
-            for rank, suit in hand:
-                if rank in ['J', 'Q', 'K']:
-                    value += 10
-                elif rank == 'A':
-                    aces += 1
-                    value += 11
-                else:
-                    value += int(rank)
-            while value > 21 and aces:
-                value -= 10
-                aces -= 1
-            return value
-
-        # Draw dealer section
-        dealer_value = hand_value(dealer_hand) if not hide_dealer_first else "?"
-        draw.text((20, 20), f"Dealer cards: {dealer_value}", fill='white', font=title_font)
-        
-        dealer_y = 50
-        for i, (rank, suit) in enumerate(dealer_hand):
-            if i == 0 and hide_dealer_first:
-                card_img = self.create_back_card()
-            else:
-                card_img = self.create_card_image(rank, suit)
-
-            x_pos = 20 + i * (self.card_width + self.card_spacing)
-            canvas.paste(card_img, (x_pos, dealer_y))
-
-        # Draw player section
-        player_y_start = dealer_y + self.card_height + 60
-
-        if len(player_hands) == 1:
-            # Single hand
-            hand = player_hands[0]
-            player_value = hand_value(hand)
-            draw.text((20, player_y_start - 30), f"Your cards: {player_value}", fill='white', font=title_font)
-            
-            for i, (rank, suit) in enumerate(hand):
-                card_img = self.create_card_image(rank, suit)
-                x_pos = 20 + i * (self.card_width + self.card_spacing)
-                canvas.paste(card_img, (x_pos, player_y_start))
-        else:
-            # Multiple hands (split)
-            for hand_idx, hand in enumerate(player_hands):
-                hand_y = player_y_start + hand_idx * (self.card_height + 80)
-                hand_value_calc = hand_value(hand)
-                
-                is_current = hand_idx == current_hand_index
-                indicator = "👉 " if is_current else ""
-                label_color = (255, 255, 0) if is_current else (255, 255, 255)
-                
-                draw.text((20, hand_y - 30), f"{indicator}Hand {hand_idx + 1}: {hand_value_calc}", 
-                         fill=label_color, font=title_font)
-                
-                for card_idx, (rank, suit) in enumerate(hand):
-                    card_img = self.create_card_image(rank, suit)
-                    x_pos = 20 + card_idx * (self.card_width + self.card_spacing)
-                    canvas.paste(card_img, (x_pos, hand_y))
-
-        return canvas
+        return BlackjackTableImage(self).update(player_hands, dealer_hand, current_hand_index, hide_dealer_first)
+
+    def get_blackjack_table(self, table_id):
+        """Return the render state for a table, creating it on first use and evicting the least recently used"""
+        table = self.tables.get(table_id)
+        if table is None:
+            table = BlackjackTableImage(self)
+            self.tables[table_id] = table
+            if len(self.tables) > self.max_tables:
+                self.tables.popitem(last=False)
+        self.tables.move_to_end(table_id)
+        return table
 
     def create_hand_image(self, hand, hide_first=False):
         """Create an image showing a hand of cards"""
@@ -319,31 +258,134 @@ class CardImageGenerator:
         total_width = num_cards * (self.card_width + self.card_spacing) + 40
 
         # Create canvas with green background
-        img = Image.new('RGB', (total_width, self.card_height + 40), (34, 87, 45))
+        img = Image.new('RGB', (total_width, self.card_height + 40), FELT_COLOR)
 
-        for i, (rank, suit) in enumerate(hand):
+        for i, card in enumerate(hand):
             if i == 0 and hide_first:
-                card_img = self.create_back_card()
+                card_img = self.get_back_sprite()
             else:
-                card_img = self.create_card_image(rank, suit)
+                card_img = self.get_card_sprite(card)
 
             x_pos = 20 + i * (self.card_width + self.card_spacing)
             img.paste(card_img, (x_pos, 20))
 
         return img
 
-    def save_hand_image(self, hand, filename, hide_first=False):
-        """Save hand image to file"""
+    def encode_hand_image(self, hand, hide_first=False):
+        """Render a hand and return it as an encoded in-memory image"""
         img = self.create_hand_image(hand, hide_first)
         if img:
-            img.save(filename)
-            return True
-        return False
+            return self.encoder(img)
+        return None
 
-    def save_blackjack_game_image(self, player_hands, dealer_hand, filename, current_hand_index=0, hide_dealer_first=True):
-        """Save comprehensive blackjack game image to file"""
+    def encode_blackjack_game_image(self, player_hands, dealer_hand, current_hand_index=0, hide_dealer_first=True):
+        """Render the full blackjack table and return it as an encoded in-memory image"""
         img = self.create_blackjack_game_image(player_hands, dealer_hand, current_hand_index, hide_dealer_first)
         if img:
-            img.save(filename)
-            return True
-        return False
+            return self.encoder(img)
+        return None
+
+    def encode_blackjack_table(self, table_id, player_hands, dealer_hand, current_hand_index=0, hide_dealer_first=True):
+        """Update a live table's canvas with only what changed and return it as an encoded in-memory image"""
+        if not player_hands or not dealer_hand:
+            return None
+        table = self.get_blackjack_table(table_id)
+        table.update(player_hands, dealer_hand, current_hand_index, hide_dealer_first)
+        buffer = table.encode()
+
+        # The dealer reveal is the last frame of a round
+        if not hide_dealer_first:
+            self.tables.pop(table_id, None)
+        return buffer
+
+
+class BlackjackTableImage:
+    """Render state for one blackjack table: keeps the canvas and repaints only the rows an action changed"""
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.img = None
+        self.draw = None
+        # (cards, label, label colour) per row as currently drawn, dealer first
+        self.rows = []
+
+    def _layout(self, player_hands, dealer_hand, current_hand_index, hide_dealer_first):
+        """What each row should show: dealer, then one row per player hand"""
+        gen = self.generator
+        white = (255, 255, 255)
+
+        # None marks the face-down hole card
+        dealer_cards = tuple(None if i == 0 and hide_dealer_first else card for i, card in enumerate(dealer_hand))
+        dealer_value = gen.hand_value(dealer_hand) if not hide_dealer_first else "?"
+        rows = [(dealer_cards, f"Dealer cards: {dealer_value}", white)]
+
+        if len(player_hands) == 1:
+            # Single hand
+            hand = player_hands[0]
+            rows.append((tuple(hand), f"Your cards: {gen.hand_value(hand)}", white))
+        else:
+            # Multiple hands (split)
+            for hand_idx, hand in enumerate(player_hands):
+                is_current = hand_idx == current_hand_index
+                indicator = "👉 " if is_current else ""
+                label_color = (255, 255, 0) if is_current else white
+                rows.append((tuple(hand), f"{indicator}Hand {hand_idx + 1}: {gen.hand_value(hand)}", label_color))
+        return rows
+
+    def row_y(self, row):
+        """Top of a row's cards: the dealer row, then each player hand below it"""
+        gen = self.generator
+        dealer_y = 50
+        if row == 0:
+            return dealer_y
+        return dealer_y + gen.card_height + 60 + (row - 1) * (gen.card_height + 80)
+
+    def _canvas_size(self, rows):
+        gen = self.generator
+        max_cards_in_hand = max(len(cards) for cards, _, _ in rows)
+        total_width = max_cards_in_hand * (gen.card_width + gen.card_spacing) + 40
+        total_height = len(rows) * (gen.card_height + 80) + 40
+        return total_width, total_height
+
+    def _resize(self, size):
+        """Grow or crop the canvas, keeping everything already drawn"""
+        canvas = Image.new('RGB', size, FELT_COLOR)
+        if self.img is not None:
+            canvas.paste(self.img, (0, 0))
+        self.img = canvas
+        self.draw = ImageDraw.Draw(canvas)
+
+    def update(self, player_hands, dealer_hand, current_hand_index=0, hide_dealer_first=True):
+        """Bring the canvas up to date: new cards are pasted, changed labels redrawn, changed rows reflowed"""
+        gen = self.generator
+        rows = self._layout(player_hands, dealer_hand, current_hand_index, hide_dealer_first)
+        size = self._canvas_size(rows)
+        if self.img is None or self.img.size != size:
+            self._resize(size)
+        width = size[0]
+
+        for index, (cards, label, label_color) in enumerate(rows):
+            drawn_cards, drawn_label, drawn_color = self.rows[index] if index < len(self.rows) else ((), None, None)
+            y = self.row_y(index)
+
+            if cards[:len(drawn_cards)] != drawn_cards:
+                # A card was removed or replaced (split, dealer reveal): reflow the whole row
+                self.draw.rectangle([0, y, width, y + gen.card_height], fill=FELT_COLOR)
+                drawn_cards = ()
+
+            # Paste only the cards that aren't on the canvas yet
+            for card_idx in range(len(drawn_cards), len(cards)):
+                card = cards[card_idx]
+                card_img = gen.get_back_sprite() if card is None else gen.get_card_sprite(card)
+                self.img.paste(card_img, (20 + card_idx * (gen.card_width + gen.card_spacing), y))
+
+            if (label, label_color) != (drawn_label, drawn_color):
+                self.draw.rectangle([0, y - 30, width, y - 1], fill=FELT_COLOR)
+                self.draw.text((20, y - 30), label, fill=label_color, font=gen.font_title)
+
+        self.rows = rows
+        return self.img
+
+    def encode(self):
+        """Encode the current canvas with the generator's encoder"""
+        return self.generator.encoder(self.img)
@@ -0,0 +1,140 @@
+import random
+from array import array
+
+SUITS = ['♠️', '♥️', '♦️', '♣️']
+RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+
+# A card is a small int: suit index * 13 + rank index (0-51). Everything about it is a table lookup.
+CARD_RANKS = [RANKS[card % 13] for card in range(52)]
+CARD_SUITS = [SUITS[card // 13] for card in range(52)]
+CARD_LABELS = [f"{CARD_RANKS[card]}{CARD_SUITS[card]}" for card in range(52)]
+
+# Blackjack points with aces counted as 1; Hand adds the soft 10 when it fits
+CARD_POINTS = [min(card % 13 + 1, 10) for card in range(52)]
+
+def make_card(rank: str, suit: str) -> int:
+    """Card int for a rank and suit emoji, e.g. ("A", "♠️") -> 0"""
+    return SUITS.index(suit) * 13 + RANKS.index(rank)
+
+def card_rank(card: int) -> str:
+    return CARD_RANKS[card]
+
+def card_suit(card: int) -> str:
+    return CARD_SUITS[card]
+
+def card_is_red(card: int) -> bool:
+    return 13 <= card < 39
+
+def is_three_card_straight(cards) -> bool:
+    """Three consecutive ranks; the ace plays low (A-2-3) or high (Q-K-A)"""
+    ranks = sorted(card % 13 for card in cards)
+    return (ranks[1] == ranks[0] + 1 and ranks[2] == ranks[1] + 1) or ranks == [0, 11, 12]
+
+def baccarat_points(card: int) -> int:
+    """Baccarat value: ace 1, two to nine face value, tens and court cards 0"""
+    return CARD_POINTS[card] % 10
+
+def format_hand(hand, hide_first=False) -> str:
+    """Format a hand for display"""
+    if hide_first:
+        return f"🂠 {CARD_LABELS[hand[1]]}"
+    return " ".join(CARD_LABELS[card] for card in hand)
+
+
+class Hand:
+    """A blackjack hand of card ints whose hard total and ace count are kept current as cards are added"""
+
+    __slots__ = ("cards", "hard_total", "aces")
+
+    def __init__(self, cards=()):
+        self.cards = []
+        self.hard_total = 0
+        self.aces = 0
+        for card in cards:
+            self.append(card)
+
+    def append(self, card: int):
+        self.cards.append(card)
+        self.hard_total += CARD_POINTS[card]
+        if card % 13 == 0:
+            self.aces += 1
+
+    def pop(self) -> int:
+        card = self.cards.pop()
+        self.hard_total -= CARD_POINTS[card]
+        if card % 13 == 0:
+            self.aces -= 1
+        return card
+
+    @property
+    def total(self) -> int:
+        """Best total: one ace counts 11 when that doesn't bust"""
+        if self.aces and self.hard_total <= 11:
+            return self.hard_total + 10
+        return self.hard_total
+
+    @property
+    def is_soft(self) -> bool:
+        return bool(self.aces) and self.hard_total <= 11
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __getitem__(self, index):
+        return self.cards[index]
+
+    def __repr__(self):
+        return f"Hand({format_hand(self.cards)} = {self.total})"
+
+
+class Shoe:
+    """A multi-deck shoe shuffled once and dealt by index; the cut card triggers a reshuffle between rounds.
+
+    A shoe is held by one round at a time, from start_round until end_round, so a reshuffle
+    for another game can never put cards that are still on a table back into play.
+    """
+
+    def __init__(self, decks: int = 6, penetration: float = 0.75, rng=None):
+        self.decks = decks
+        self.penetration = penetration
+        self.rng = rng or random.Random()
+        # One byte per card, so even an eight-deck shoe is a 416-byte array
+        self.cards = array('B', range(52)) * decks
+        self.position = 0
+        self.cut_card = 0
+        self.shuffles = 0
+        self.in_round = False
+        self.shuffle()
+
+    def shuffle(self):
+        """Shuffle every card back into the shoe and place the cut card"""
+        self.rng.shuffle(self.cards)
+        self.position = 0
+        self.cut_card = int(len(self.cards) * self.penetration)
+        self.shuffles += 1
+
+    def start_round(self):
+        """Call before dealing a round: reshuffles if the cut card came out during the last one"""
+        if self.position >= self.cut_card:
+            self.shuffle()
+        self.in_round = True
+
+    def end_round(self):
+        """Release the shoe once every card of the round is settled"""
+        self.in_round = False
+
+    def deal(self) -> int:
+        """Next card in the shoe"""
+        if self.position >= len(self.cards):
+            # Only reachable with a penetration near 1.0 - never run a round dry
+            self.shuffle()
+        card = self.cards[self.position]
+        self.position += 1
+        return card
+
+    @property
+    def remaining(self) -> int:
+        return len(self.cards) - self.position
@@ -4,27 +4,222 @@ import asyncio
 import json
 import hashlib
 import hmac
-import discord
+import multiprocessing
 import os
+import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, Any, List
-from bitcoinlib.keys import Key
-from bitcoinlib.transactions import Transaction
-import hashlib
+
+# Signing key held by an isolated signer process (set by _init_signer_process)
+_process_signing_key = None
+
+# Digest signed when a signer is loaded, so a bad key fails at startup instead of on the first payout
+_SELF_TEST_DIGEST = hashlib.sha256(b"house signer self-test").hexdigest()
+
+def _build_signing_key(private_key_hex: str):
+    """Parse the house private key into an ecdsa SigningKey"""
+    from ecdsa import SigningKey, NIST256p
+    return SigningKey.from_string(bytes.fromhex(private_key_hex), curve=NIST256p)
+
+def _sign_digest_batch(signing_key, tosign_list: List[str]) -> List[str]:
+    """Sign a batch of tosign digests, keeping empty entries as empty signatures"""
+    from ecdsa.util import sigencode_der
+
+    signatures = []
+    for tosign_hex in tosign_list:
+        if not tosign_hex:
+            print(f"⚠️ Empty tosign hex, skipping")
+            signatures.append("")
+            continue
+        # sign_digest takes the already-hashed data and signs it
+        signature = signing_key.sign_digest(bytes.fromhex(tosign_hex), sigencode=sigencode_der)
+        signatures.append(signature.hex())
+    return signatures
+
+def _is_int(value) -> bool:
+    """Strict JSON integer check: bool is an int subclass but never a valid amount"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _write_json_atomic(path: str, data):
+    """Write JSON to a temp file and swap it in, so a crash never leaves a half-written ledger"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _init_signer_process(key_file: str):
+    """Read and parse the signing key inside the isolated signer process; the bot process never reads it"""
+    global _process_signing_key
+    with open(key_file, "r") as f:
+        private_key_hex = json.load(f).get("private_key")
+    # A wallet file without a key still starts the process so its public fields can be read; signing fails instead
+    _process_signing_key = _build_signing_key(private_key_hex) if private_key_hex else None
+
+def _sign_in_process(tosign_list: List[str]) -> List[str]:
+    if _process_signing_key is None:
+        raise ValueError("house wallet file has no private key")
+    return _sign_digest_batch(_process_signing_key, tosign_list)
+
+def _read_public_wallet_fields(key_file: str) -> dict:
+    """Return the house wallet file minus its private key, read inside the signer process"""
+    with open(key_file, "r") as f:
+        house_data = json.load(f)
+    public_data = {key: value for key, value in house_data.items() if key != "private_key"}
+    public_data["has_private_key"] = bool(house_data.get("private_key"))
+    return public_data
+
+class PayoutStatusUnknown(Exception):
+    """The payout may have been broadcast but we can't confirm it - it must be checked on chain, never retried blindly"""
+
+class HouseSigner:
+    """Keeps the house wallet signing key parsed in memory and signs digests in batches"""
+
+    def __init__(self, private_key_hex: str = None, isolated: bool = False, key_file: str = "house_wallet.json"):
+        self.isolated = isolated
+        self.key_file = key_file
+        self._signing_key = None
+        self._executor = None
+
+        if isolated:
+            # A spawned (not forked) child reads the key file itself, so the key never enters the bot process
+            self._executor = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_signer_process,
+                initargs=(key_file,)
+            )
+        else:
+            self._signing_key = _build_signing_key(private_key_hex)
+
+    async def self_test(self, timeout: float = 30.0):
+        """Sign a fixed digest; raises if the key can't be loaded or can't sign"""
+        if self._executor:
+            # The first call waits for the process to spawn and parse the key, so never block the loop on it
+            future = asyncio.wrap_future(self._executor.submit(_sign_in_process, [_SELF_TEST_DIGEST]))
+            signatures = await asyncio.wait_for(future, timeout)
+        else:
+            signatures = _sign_digest_batch(self._signing_key, [_SELF_TEST_DIGEST])
+        if not signatures or not signatures[0]:
+            raise ValueError("house signer produced no signature")
+
+    async def read_wallet_fields(self, timeout: float = 30.0) -> dict:
+        """Read the house wallet's public fields through the isolated signer process"""
+        future = asyncio.wrap_future(self._executor.submit(_read_public_wallet_fields, self.key_file))
+        return await asyncio.wait_for(future, timeout)
+
+    async def sign_digests(self, tosign_list: List[str]) -> List[str]:
+        """Sign every tosign digest of a transaction in one call"""
+        if self._executor:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, _sign_in_process, list(tosign_list))
+        return _sign_digest_batch(self._signing_key, tosign_list)
+
+    def close(self):
+        """Shut down the isolated signer process, if any"""
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 class LitecoinHandler:
-    def __init__(self, api_key: str, webhook_secret: str = None, bot_instance=None, main_wallet_id: str = None):
+    def __init__(self, api_key: str, webhook_secret: str = None, bot_instance=None, main_wallet_id: str = None, event_bus=None):
+        if not webhook_secret:
+            # Callback signatures are keyed by this secret; a guessable default would let anyone forge deposits
+            raise ValueError("WEBHOOK_SECRET must be set to accept Apirone callbacks")
         self.api_key = api_key
         self.webhook_secret = webhook_secret
         self.apirone_url = "https://apirone.com/api/v2"
         self.bot = bot_instance
+        self.event_bus = event_bus
         self.main_wallet_id = main_wallet_id or "ltc-5561e2f4f79ea23ac688c64fa9760bf2"
         self.house_wallet_address = None
         self.house_wallet_id = None
         self.scan_running = False
-        self.balance_cache = None
-        self.balance_cache_time = 0
-        self.balance_cache_ttl = 30
+        self.utxos = {}
+        self.utxo_synced_at = 0
+        self.utxo_reconcile_interval = 300
+        # Headroom above the payout amounts that selected inputs must cover for the network fee
+        self.utxo_fee_reserve_satoshi = int(os.getenv("UTXO_FEE_RESERVE_SATOSHI", "100000"))
+        # Outpoints picked for a payout that hasn't been broadcast yet; no other payout may select them
+        self.reserved_outpoints = set()
+        # Bumped on every broadcast so a reconcile fetched before it can't restore spent outputs
+        self.utxo_broadcast_count = 0
+        self.utxo_refresh_jitter = 0.2
+        self.utxo_refresh_task = None
+        self.utxo_refresh_dirty = False
+        self.signer = None
+        self.callback_key = webhook_secret.encode()
+        self.processed_tx_hashes = self._load_processed_tx_hashes()
+        self.legacy_callback_addresses = self._load_legacy_callback_addresses()
+        self.signer_isolated = os.getenv("HOUSE_SIGNER_ISOLATED", "").lower() in ("1", "true", "yes")
+
+    def _load_processed_tx_hashes(self) -> set:
+        """Load credited transaction hashes once so replayed callbacks are rejected without I/O"""
+        try:
+            with open("processed_deposits.json", "r") as f:
+                return set(json.load(f).keys())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return set()
+
+    def _load_legacy_callback_addresses(self) -> Dict[str, str]:
+        """Deposit addresses registered before callbacks were signed, mapped to their user id"""
+        try:
+            with open("crypto_addresses.json", "r") as f:
+                mappings = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return {address: data.get("user_id") for address, data in mappings.items() if not data.get("signed_callback")}
+
+    def callback_signature(self, subject: str) -> str:
+        """HMAC token embedded in callback data for a user id (or "house_wallet")"""
+        return hmac.new(self.callback_key, subject.encode(), hashlib.sha256).hexdigest()
+
+    def validate_apirone_callback(self, callback_data: Any) -> Optional[str]:
+        """Cheap pre-validation run before any I/O; returns a rejection reason or None if the callback should be processed"""
+        if not isinstance(callback_data, dict):
+            return "invalid_schema"
+
+        data = callback_data.get("data")
+        value = callback_data.get("value")
+        confirmations = callback_data.get("confirmations", 0)
+        tx_hash = callback_data.get("input_transaction_hash")
+        if (not isinstance(data, dict) or not _is_int(value) or value <= 0
+                or not _is_int(confirmations) or not isinstance(tx_hash, str) or len(tx_hash) != 64):
+            return "invalid_schema"
+
+        if data.get("type") == "house_wallet":
+            subject = "house_wallet"
+            # House wallets created before signing were registered with {"type": "house_wallet"} and no secret.
+            # Those callbacks only trigger a UTXO resync, so the legacy shape is accepted for our own address.
+            if ("secret" not in data and self.house_wallet_address
+                    and callback_data.get("input_address") == self.house_wallet_address):
+                return None
+        else:
+            subject = data.get("user_id")
+            if not isinstance(subject, str) or not subject.isdigit():
+                return "invalid_schema"
+
+        # Constant-time check against the per-subject HMAC. Addresses issued before signing were
+        # registered with the plain secret; that is still honoured, but only for those addresses
+        # and only for the user they were issued to.
+        secret = data.get("secret")
+        if not isinstance(secret, str):
+            return "bad_signature"
+        secret = secret.encode()
+        if not hmac.compare_digest(secret, self.callback_signature(subject).encode()):
+            legacy_owner = self.legacy_callback_addresses.get(callback_data.get("input_address"))
+            if legacy_owner != subject or not hmac.compare_digest(secret, self.callback_key):
+                return "bad_signature"
+
+        if subject != "house_wallet":
+            if confirmations < 1:
+                return "unconfirmed"
+            if tx_hash in self.processed_tx_hashes:
+                return "duplicate"
+
+        return None
 
     async def generate_deposit_address(self, user_id: str) -> Optional[str]:
         """Generate a new Litecoin deposit address via Apirone Wallet"""
@@ -34,7 +229,8 @@ class LitecoinHandler:
                 with open("crypto_addresses.json", "r") as f:
                     mappings = json.load(f)
                 for address, data in mappings.items():
-                    if data.get("user_id") == user_id:
+                    # Addresses registered before callbacks were signed are still credited, but new deposits get a signed one
+                    if data.get("user_id") == user_id and data.get("signed_callback"):
                         print(f"Returning existing address for user {user_id}: {address}")
                         return address
             except FileNotFoundError:
@@ -48,7 +244,7 @@ class LitecoinHandler:
                         "method": "POST",
                         "data": {
                             "user_id": user_id,
-                            "secret": self.webhook_secret or "default_secret"
+                            "secret": self.callback_signature(user_id)
                         }
                     }
                 }
@@ -85,7 +281,8 @@ class LitecoinHandler:
         mappings[address] = {
             "user_id": user_id,
             "wallet_id": wallet_id,
-            "created_at": time.time()
+            "created_at": time.time(),
+            "signed_callback": True
         }
 
         with open("crypto_addresses.json", "w") as f:
@@ -94,11 +291,15 @@ class LitecoinHandler:
     async def initialize_house_wallet(self):
         """Initialize or load the house wallet"""
         try:
+            if self.signer_isolated:
+                return await self.load_isolated_house_wallet()
             with open("house_wallet.json", "r") as f:
                 house_data = json.load(f)
                 self.house_wallet_address = house_data["address"]
                 self.house_wallet_id = house_data.get("wallet_id")
                 print(f"Loaded existing house wallet: {self.house_wallet_address}")
+                if house_data.get("private_key"):
+                    await self.load_signer(house_data["private_key"])
                 return True
         except FileNotFoundError:
             try:
@@ -109,7 +310,7 @@ class LitecoinHandler:
                         "callback": {
                             "url": f"https://{os.getenv('REPLIT_DEV_DOMAIN', 'localhost')}/webhook/apirone",
                             "method": "POST",
-                            "data": {"type": "house_wallet"}
+                            "data": {"type": "house_wallet", "secret": self.callback_signature("house_wallet")}
                         }
                     }
                     
@@ -143,71 +344,226 @@ class LitecoinHandler:
                 print(f"Error creating house wallet: {e}")
                 return False
 
-    async def get_ltc_to_usd_rate(self) -> float:
-        """Get current LTC to USD exchange rate"""
+    async def load_isolated_house_wallet(self) -> bool:
+        """Load the house wallet in isolated mode; the signer process reads the file and hands back only public fields"""
+        if not os.path.exists("house_wallet.json"):
+            raise FileNotFoundError("house_wallet.json")
+
+        signer = HouseSigner(isolated=True)
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://api.coingecko.com/api/v3/simple/price?ids=litecoin&vs_currencies=usd"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data["litecoin"]["usd"]
-                    else:
-                        return 100.0
+            house_data = await signer.read_wallet_fields()
+        except Exception:
+            signer.close()
+            raise
+        self.house_wallet_address = house_data["address"]
+        self.house_wallet_id = house_data.get("wallet_id")
+        print(f"Loaded existing house wallet: {self.house_wallet_address}")
+        if house_data.get("has_private_key"):
+            # The process that read the file already holds the key, so it becomes the signer
+            await self.load_signer(signer=signer)
+        else:
+            signer.close()
+        return True
+
+    async def load_signer(self, private_key_hex: str = None, signer: HouseSigner = None) -> bool:
+        """Parse the house private key once and keep it in a HouseSigner, checking it can sign"""
+        try:
+            if self.signer:
+                self.signer.close()
+                self.signer = None
+            if signer is None:
+                signer = HouseSigner(private_key_hex, isolated=self.signer_isolated)
+            try:
+                await signer.self_test()
+            except Exception:
+                signer.close()
+                raise
+            self.signer = signer
+            mode = "isolated process" if self.signer_isolated else "in-memory"
+            print(f"🔑 House signer loaded ({mode})")
+            return True
         except Exception as e:
-            print(f"Error getting exchange rate: {e}")
-            return 100.0
+            print(f"❌ Failed to load house signer: {e}")
+            self.signer = None
+            return False
 
-    async def get_house_balance(self) -> float:
-        """Get the current house wallet balance in LTC from blockchain (real-time confirmed balance only)"""
+    async def get_signer(self) -> Optional[HouseSigner]:
+        """Return the house signer, loading it from house_wallet.json on first use"""
+        if self.signer:
+            return self.signer
+
+        if self.signer_isolated:
+            # Never read the key into this process; the signer's self-test reports a missing key
+            if await self.load_signer():
+                return self.signer
+            return None
+
+        try:
+            with open("house_wallet.json", "r") as f:
+                private_key_hex = json.load(f).get("private_key")
+        except:
+            print("❌ Could not load house wallet private key")
+            return None
+
+        if not private_key_hex:
+            print("❌ No private key found in house wallet")
+            return None
+
+        if await self.load_signer(private_key_hex):
+            return self.signer
+        return None
+
+    async def get_ltc_to_usd_rate(self) -> float:
+        """Get current LTC to USD exchange rate; raises rather than guessing when the price is unavailable"""
+        async with aiohttp.ClientSession() as session:
+            url = "https://api.coingecko.com/api/v3/simple/price?ids=litecoin&vs_currencies=usd"
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"Exchange rate request failed: {response.status}")
+                data = await response.json()
+                return float(data["litecoin"]["usd"])
+
+    async def reconcile_utxos(self) -> bool:
+        """Rebuild the local house wallet UTXO set from BlockCypher"""
         if not self.house_wallet_address:
-            return 0.0
-        
-        # Check cache first - only hit API once per 30 seconds
-        current_time = time.time()
-        if self.balance_cache is not None and (current_time - self.balance_cache_time) < self.balance_cache_ttl:
-            return self.balance_cache
-        
-        # Use BlockCypher API to get confirmed balance with retry logic for rate limiting
+            return False
+
+        # Retry logic for rate limiting
         max_retries = 3
         retry_delay = 2
-        
+
         try:
             async with aiohttp.ClientSession() as session:
                 for attempt in range(max_retries):
-                    url = f"https://api.blockcypher.com/v1/ltc/main/addrs/{self.house_wallet_address}/balance"
+                    broadcast_count = self.utxo_broadcast_count
+                    url = f"https://api.blockcypher.com/v1/ltc/main/addrs/{self.house_wallet_address}?unspentOnly=true&limit=2000"
                     async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                         if response.status == 200:
                             data = await response.json()
-                            balance_satoshi = data.get('final_balance', 0)
-                            balance_ltc = balance_satoshi / 100000000
-                            self.balance_cache = balance_ltc
-                            self.balance_cache_time = current_time
-                            print(f"💰 House Balance from BlockCypher: {balance_ltc:.8f} LTC confirmed")
-                            return balance_ltc
+                            if broadcast_count != self.utxo_broadcast_count:
+                                # We broadcast while this was in flight; the snapshot may still list spent inputs
+                                print("⚠️ Discarding UTXO snapshot fetched before our last broadcast")
+                                self.request_utxo_refresh()
+                                return False
+                            utxos = {}
+                            for txref in data.get("txrefs", []) + data.get("unconfirmed_txrefs", []):
+                                # Unconfirmed spends of ours are listed with output index -1
+                                if txref.get("spent") or txref.get("tx_output_index", -1) < 0:
+                                    continue
+                                outpoint = f"{txref['tx_hash']}:{txref['tx_output_index']}"
+                                utxos[outpoint] = {
+                                    "tx_hash": txref["tx_hash"],
+                                    "output_index": txref["tx_output_index"],
+                                    "value": txref.get("value", 0)
+                                }
+                            self.utxos = utxos
+                            self.utxo_synced_at = time.time()
+                            print(f"💰 House UTXO set reconciled: {len(utxos)} output(s), {self.get_local_balance():.8f} LTC")
+                            return True
                         elif response.status == 429:
                             # Rate limited - retry with exponential backoff
                             if attempt < max_retries - 1:
-                                print(f"⏳ Rate limited on balance check, retrying in {retry_delay} seconds...")
+                                print(f"⏳ Rate limited on UTXO reconcile, retrying in {retry_delay} seconds...")
                                 await asyncio.sleep(retry_delay)
                                 retry_delay *= 2
                             else:
-                                print(f"❌ Rate limited on balance check after {max_retries} attempts")
-                                # Return cached value if available
-                                if self.balance_cache is not None:
-                                    print(f"📊 Using cached balance: {self.balance_cache:.8f} LTC")
-                                    return self.balance_cache
-                                return 0.0
+                                print(f"❌ Rate limited on UTXO reconcile after {max_retries} attempts")
+                                return False
                         else:
                             print(f"⚠️ BlockCypher returned status {response.status}")
-                            return 0.0
+                            return False
         except Exception as e:
             print(f"⚠️ BlockCypher API error: {e}")
-        
-        # If blockchain API fails, return cached value if available
-        if self.balance_cache is not None:
-            return self.balance_cache
-        return 0.0
+        return False
+
+    async def utxo_reconcile_loop(self):
+        """Periodically reconcile the local UTXO set with the blockchain (jittered to avoid lockstep polling)"""
+        while True:
+            jitter = random.uniform(1 - self.utxo_refresh_jitter, 1 + self.utxo_refresh_jitter)
+            await asyncio.sleep(self.utxo_reconcile_interval * jitter)
+            try:
+                await self.reconcile_utxos()
+            except Exception as e:
+                print(f"❌ Error reconciling house UTXO set: {e}")
+
+    def request_utxo_refresh(self, delay: float = 0):
+        """Schedule a background reconcile without making the caller wait on the network"""
+        if self.utxo_refresh_task and not self.utxo_refresh_task.done():
+            # The running reconcile may have fetched before this event; run once more when it finishes
+            self.utxo_refresh_dirty = True
+            return
+
+        async def refresh():
+            if delay:
+                await asyncio.sleep(delay * random.uniform(1, 1 + self.utxo_refresh_jitter))
+            while True:
+                self.utxo_refresh_dirty = False
+                try:
+                    await self.reconcile_utxos()
+                except Exception as e:
+                    print(f"❌ Error refreshing house UTXO set: {e}")
+                if not self.utxo_refresh_dirty:
+                    break
+
+        self.utxo_refresh_task = asyncio.create_task(refresh())
+
+    def get_local_balance(self) -> float:
+        """House wallet balance in LTC computed from the local UTXO set"""
+        return sum(utxo["value"] for utxo in self.utxos.values()) / 100000000
+
+    def select_utxos(self, amount_satoshi: int) -> Optional[List[Dict]]:
+        """Pick and reserve unreserved local UTXOs (largest first) covering the amount plus the fee reserve"""
+        target = amount_satoshi + self.utxo_fee_reserve_satoshi
+        selected = []
+        total = 0
+        for outpoint, utxo in sorted(self.utxos.items(), key=lambda item: item[1]["value"], reverse=True):
+            if outpoint in self.reserved_outpoints:
+                continue
+            selected.append(utxo)
+            total += utxo["value"]
+            if total >= target:
+                self.reserved_outpoints.update(f"{u['tx_hash']}:{u['output_index']}" for u in selected)
+                return selected
+        return None
+
+    def release_utxos(self, selected: Optional[List[Dict]]):
+        """Return outpoints reserved by select_utxos once their payout is broadcast or abandoned"""
+        for utxo in selected or []:
+            self.reserved_outpoints.discard(f"{utxo['tx_hash']}:{utxo['output_index']}")
+
+    def apply_broadcast_to_utxos(self, tx: Dict):
+        """Update the local UTXO set from a transaction we broadcast ourselves"""
+        self.utxo_broadcast_count += 1
+        for tx_input in tx.get("inputs", []):
+            self.utxos.pop(f"{tx_input.get('prev_hash')}:{tx_input.get('output_index')}", None)
+
+        tx_hash = tx.get("hash")
+        if not tx_hash:
+            # Can't tell which outputs are ours - resync in the background instead
+            self.request_utxo_refresh()
+            return
+        for index, output in enumerate(tx.get("outputs", [])):
+            if self.house_wallet_address in output.get("addresses", []):
+                self.utxos[f"{tx_hash}:{index}"] = {
+                    "tx_hash": tx_hash,
+                    "output_index": index,
+                    "value": output.get("value", 0)
+                }
+
+    async def get_house_balance(self) -> float:
+        """Get the current house wallet balance in LTC from the local UTXO set"""
+        if not self.house_wallet_address:
+            return 0.0
+
+        # Only the very first lookup waits on the network; afterwards the local set is
+        # adjusted by our own deposits/withdrawals and refreshed in the background
+        if not self.utxo_synced_at:
+            if not await self.reconcile_utxos():
+                return 0.0
+        elif time.time() - self.utxo_synced_at >= self.utxo_reconcile_interval:
+            self.request_utxo_refresh()
+
+        return self.get_local_balance()
 
     async def process_apirone_callback(self, callback_data: Dict) -> bool:
         """Process an Apirone callback for deposit detection"""
@@ -218,6 +574,12 @@ class LitecoinHandler:
             tx_hash = callback_data.get('input_transaction_hash')
             input_address = callback_data.get('input_address')
             
+            # Deposits to the house wallet only move the house balance - resync it shortly
+            if callback_data.get('data', {}).get('type') == 'house_wallet':
+                print(f"🏦 House wallet deposit seen: {amount_ltc:.8f} LTC ({confirmations} confirmations)")
+                self.request_utxo_refresh(delay=5)
+                return True
+            
             # Only credit on 1+ confirmations
             if confirmations < 1:
                 # Silently wait for confirmation - don't spam console
@@ -242,7 +604,21 @@ class LitecoinHandler:
                 print(f"❌ No user_id in callback for address {input_address}")
                 return False
             
-            # Load and update user balance
+            # Convert to USD before touching the ledgers so the update below has no await in it
+            ltc_price = await self.get_ltc_to_usd_rate()
+            amount_usd = amount_ltc * ltc_price
+            
+            # Re-read and update both files without yielding, so concurrent queue workers
+            # can't interleave and lose a credit or double-credit a transaction
+            try:
+                with open("processed_deposits.json", "r") as f:
+                    processed = json.load(f)
+            except FileNotFoundError:
+                processed = {}
+            
+            if tx_hash in processed:
+                return False
+            
             try:
                 with open("balances.json", "r") as f:
                     balances = json.load(f)
@@ -252,17 +628,10 @@ class LitecoinHandler:
             if user_id not in balances:
                 balances[user_id] = {"balance": 0.0, "deposited": 0.0, "withdrawn": 0.0, "wagered": 0.0}
             
-            # Convert to USD
-            ltc_price = await self.get_ltc_to_usd_rate()
-            amount_usd = amount_ltc * ltc_price
-            
             balances[user_id]["balance"] += amount_usd
             balances[user_id]["deposited"] += amount_usd
             
-            with open("balances.json", "w") as f:
-                json.dump(balances, f, indent=2)
-            
-            # Mark as processed
+            # Mark as processed before crediting: a failed write can then never be credited twice on retry
             processed[tx_hash] = {
                 "user_id": user_id,
                 "amount_ltc": amount_ltc,
@@ -270,53 +639,63 @@ class LitecoinHandler:
                 "timestamp": time.time(),
                 "confirmations": confirmations
             }
-            with open("processed_deposits.json", "w") as f:
-                json.dump(processed, f, indent=2)
+            _write_json_atomic("processed_deposits.json", processed)
+            
+            try:
+                _write_json_atomic("balances.json", balances)
+            except Exception:
+                # Undo the marker so the queued retry credits it; if that fails too the marker holds the details
+                del processed[tx_hash]
+                _write_json_atomic("processed_deposits.json", processed)
+                raise
+            self.processed_tx_hashes.add(tx_hash)
             
             print(f"✅ Credited {amount_ltc:.8f} LTC (${amount_usd:.2f} USD) to user {user_id}")
             
-            # Send notification to user
-            if self.bot:
-                try:
-                    user = await self.bot.fetch_user(int(user_id))
-                    if user:
-                        embed = discord.Embed(
-                            title="✅ Deposit Confirmed & Credited!",
-                            description="Your Litecoin deposit has been automatically processed",
-                            color=0x00ff00
-                        )
-                        embed.add_field(name="💰 Amount", value=f"{amount_ltc:.8f} LTC", inline=True)
-                        embed.add_field(name="💵 USD Value", value=f"${amount_usd:.2f} USD", inline=True)
-                        embed.add_field(name="🔗 Transaction", value=f"`{tx_hash[:16]}...`", inline=False)
-                        embed.add_field(name="✅ Confirmations", value=f"{confirmations}", inline=True)
-                        embed.add_field(name="🎮 Status", value="Balance updated - ready to play!", inline=True)
-                        embed.set_footer(text="Your deposit has been credited automatically!")
-                        
-                        await user.send(embed=embed)
-                        
-                        # Call log_deposit function from bot if available
-                        if hasattr(self.bot, 'get_cog'):
-                            from_module = __import__('bot', fromlist=['log_deposit_webhook'])
-                            if hasattr(from_module, 'log_deposit_webhook'):
-                                try:
-                                    await from_module.log_deposit_webhook(user, amount_ltc, amount_usd, tx_hash, input_address)
-                                except Exception as e:
-                                    print(f"Failed to log deposit: {e}")
-                except Exception as e:
-                    print(f"Error notifying user {user_id}: {e}")
+            # Notify subscribers (user DM, deposit log) without waiting on Discord here; the event is
+            # journaled first so a crash before delivery replays it on the next start
+            if self.event_bus:
+                self.event_bus.publish_durable(
+                    "deposit_confirmed",
+                    user_id=user_id,
+                    amount_ltc=amount_ltc,
+                    amount_usd=amount_usd,
+                    tx_hash=tx_hash,
+                    confirmations=confirmations,
+                    input_address=input_address
+                )
             
             return True
         
         except Exception as e:
+            # Re-raise so the webhook queue retries the callback; duplicates are skipped above
             print(f"Error processing Apirone callback: {e}")
-            return False
+            raise
 
     async def withdraw_from_house_wallet(self, to_address: str, amount_ltc: float) -> Optional[str]:
-        """Withdraw funds from house wallet to specified address using signed transaction"""
+        """Withdraw funds from house wallet to specified address; raises PayoutStatusUnknown like send_house_payouts"""
+        return await self.send_house_payouts([(to_address, amount_ltc)])
+
+    async def send_house_payouts(self, payouts: List[tuple]) -> Optional[str]:
+        """Pay one or more (address, amount_ltc) pairs from the house wallet in a single signed transaction.
+
+        Returns the tx hash, or None when the payout certainly was not broadcast. Raises
+        PayoutStatusUnknown when the send request may have reached the network.
+        """
         if not self.house_wallet_address:
             print("❌ House wallet not initialized")
             return None
 
+        if not payouts:
+            print("❌ No payouts to send")
+            return None
+
+        # Merge payouts going to the same address into one output
+        outputs_satoshi = {}
+        for to_address, amount_ltc in payouts:
+            outputs_satoshi[to_address] = outputs_satoshi.get(to_address, 0) + int(amount_ltc * 100000000)
+        amount_ltc = sum(outputs_satoshi.values()) / 100000000
+
         try:
             # Check house balance first
             house_balance = await self.get_house_balance()
@@ -324,135 +703,142 @@ class LitecoinHandler:
                 print(f"❌ Insufficient house balance: {house_balance:.8f} LTC < {amount_ltc:.8f} LTC")
                 return None
             
-            # Load house wallet private key
-            try:
-                with open("house_wallet.json", "r") as f:
-                    wallet_data = json.load(f)
-                    private_key_hex = wallet_data.get("private_key")
-            except:
-                print("❌ Could not load house wallet private key")
+            # Signing key is parsed once and reused across withdrawals
+            signer = await self.get_signer()
+            if not signer:
                 return None
             
-            if not private_key_hex:
-                print("❌ No private key found in house wallet")
+            # Coin selection from the local UTXO set; the picked outputs stay reserved until this payout ends
+            selected = self.select_utxos(sum(outputs_satoshi.values()))
+            if selected:
+                inputs = [{"prev_hash": utxo["tx_hash"], "output_index": utxo["output_index"]} for utxo in selected]
+            elif self.utxos and not self.reserved_outpoints:
+                # Fee reserve not covered by explicit inputs - let BlockCypher pick from the address,
+                # holding every output back from other payouts since any of them may be spent
+                selected = list(self.utxos.values())
+                self.reserved_outpoints.update(self.utxos)
+                inputs = [{"addresses": [self.house_wallet_address]}]
+            elif self.utxos:
+                # BlockCypher could pick outputs another payout is about to spend
+                print("❌ House wallet outputs are reserved by a payout in progress")
                 return None
-            
-            # Create key from private key hex
-            key = Key(private_key_hex, network="litecoin")
-            
-            # Convert amount to satoshis
-            amount_satoshi = int(amount_ltc * 100000000)
-            
-            # Use BlockCypher API to sign and broadcast transaction
-            async with aiohttp.ClientSession() as session:
-                # Get unspent outputs for the house wallet
-                url = f"https://api.blockcypher.com/v1/ltc/main/addrs/{self.house_wallet_address}?unspentOnly=true"
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status != 200:
-                        print(f"❌ Failed to get unspent outputs: {response.status}")
-                        return None
-                    
-                    addr_data = await response.json()
-                    txrefs = addr_data.get("txrefs", [])
-                    
-                    if not txrefs:
-                        print(f"❌ No unspent outputs found for house wallet")
-                        return None
-                    
-                    # Build simplified transaction and let BlockCypher calculate fees/change
-                    tx_payload = {
-                        "inputs": [{"addresses": [self.house_wallet_address]}],
-                        "outputs": [{"addresses": [to_address], "value": amount_satoshi}]
-                    }
-                    
-                    # Create transaction
-                    url = "https://api.blockcypher.com/v1/ltc/main/txs/new"
-                    async with session.post(url, json=tx_payload, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                        error_text = await response.text()
-                        if response.status != 201:
-                            print(f"❌ Failed to create transaction: {response.status} - {error_text}")
-                            return None
-                        
-                        try:
-                            tx_data = json.loads(error_text)
-                        except:
-                            print(f"❌ Invalid transaction response: {error_text}")
-                            return None
-                        
-                        # Sign inputs with private key
-                        if "tosign" not in tx_data:
-                            print(f"❌ No tosign field in transaction response: {tx_data}")
-                            return None
-                        
-                        tosign_list = tx_data.get("tosign", [])
-                        if not tosign_list or all(not s for s in tosign_list):
-                            print(f"❌ Empty tosign data: {tosign_list}")
-                            return None
-                        
-                        signatures = []
-                        for tosign_hex in tosign_list:
-                            try:
-                                if not tosign_hex:
-                                    print(f"⚠️ Empty tosign hex, skipping")
-                                    signatures.append("")
-                                    continue
-                                
-                                # Sign the tosign data with the private key
-                                tosign_bytes = bytes.fromhex(tosign_hex)
-                                from ecdsa import SigningKey, NIST256p
-                                from ecdsa.util import sigencode_der
-                                
-                                # Create signing key from private key hex
-                                sk = SigningKey.from_string(bytes.fromhex(private_key_hex), curve=NIST256p)
-                                # sign_digest takes the already-hashed data and signs it
-                                signature = sk.sign_digest(tosign_bytes, sigencode=sigencode_der)
-                                signatures.append(signature.hex())
-                            except Exception as sign_err:
-                                print(f"❌ Failed to sign transaction: {sign_err}")
-                                import traceback
-                                traceback.print_exc()
-                                return None
-                        
-                        if signatures:
-                            tx_data["signatures"] = signatures
-                        
-                        # Send signed transaction with retry logic for rate limiting
-                        url = "https://api.blockcypher.com/v1/ltc/main/txs/send"
-                        max_retries = 3
-                        retry_delay = 2  # Start with 2 second delay
-                        
-                        for attempt in range(max_retries):
-                            async with session.post(url, json=tx_data, timeout=aiohttp.ClientTimeout(total=10)) as send_response:
-                                send_text = await send_response.text()
-                                
-                                if send_response.status == 201:
-                                    try:
-                                        result = json.loads(send_text)
-                                        tx_hash = result.get("hash")
-                                        print(f"✅ Withdrawal of {amount_ltc:.8f} LTC sent with tx: {tx_hash[:16]}...")
-                                        return tx_hash
-                                    except:
-                                        print(f"❌ Invalid send response: {send_text}")
-                                        return None
-                                elif send_response.status == 429:
-                                    # Rate limited - retry with exponential backoff
-                                    if attempt < max_retries - 1:
-                                        print(f"⏳ Rate limited, retrying in {retry_delay} seconds... (attempt {attempt + 1}/{max_retries})")
-                                        await asyncio.sleep(retry_delay)
-                                        retry_delay *= 2  # Exponential backoff
-                                    else:
-                                        print(f"❌ Failed to broadcast transaction after {max_retries} attempts: Rate limit exceeded")
-                                        return None
-                                else:
-                                    print(f"❌ Failed to broadcast transaction: {send_response.status} - {send_text}")
-                                    return None
+            else:
+                print(f"❌ No unspent outputs found for house wallet")
+                return None
+
+            try:
+                return await self._broadcast_payout(inputs, outputs_satoshi, signer)
+            except PayoutStatusUnknown:
+                # The inputs may be spent now - drop snapshots taken before and resync from the chain
+                self.utxo_broadcast_count += 1
+                self.request_utxo_refresh()
+                raise
+            finally:
+                self.release_utxos(selected)
 
+        except PayoutStatusUnknown:
+            raise
         except Exception as e:
             print(f"❌ Error withdrawing from house wallet: {e}")
             import traceback
             traceback.print_exc()
             return None
 
+    async def _broadcast_payout(self, inputs: List[Dict], outputs_satoshi: Dict[str, int], signer) -> Optional[str]:
+        """Create, sign and send a payout transaction through BlockCypher; returns the tx hash"""
+        amount_ltc = sum(outputs_satoshi.values()) / 100000000
+        # Use BlockCypher API to sign and broadcast transaction
+        async with aiohttp.ClientSession() as session:
+            # Build transaction from locally selected inputs and let BlockCypher calculate fees/change
+            tx_payload = {
+                "inputs": inputs,
+                "outputs": [
+                    {"addresses": [to_address], "value": value}
+                    for to_address, value in outputs_satoshi.items()
+                ]
+            }
+            
+            # Create transaction
+            url = "https://api.blockcypher.com/v1/ltc/main/txs/new"
+            async with session.post(url, json=tx_payload, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                error_text = await response.text()
+                if response.status != 201:
+                    print(f"❌ Failed to create transaction: {response.status} - {error_text}")
+                    return None
+                
+                try:
+                    tx_data = json.loads(error_text)
+                except:
+                    print(f"❌ Invalid transaction response: {error_text}")
+                    return None
+                
+                # Sign inputs with private key
+                if "tosign" not in tx_data:
+                    print(f"❌ No tosign field in transaction response: {tx_data}")
+                    return None
+                
+                tosign_list = tx_data.get("tosign", [])
+                if not tosign_list or all(not s for s in tosign_list):
+                    print(f"❌ Empty tosign data: {tosign_list}")
+                    return None
+                
+                # Sign all inputs in one batch
+                try:
+                    signatures = await signer.sign_digests(tosign_list)
+                except Exception as sign_err:
+                    print(f"❌ Failed to sign transaction: {sign_err}")
+                    import traceback
+                    traceback.print_exc()
+                    return None
+                
+                if signatures:
+                    tx_data["signatures"] = signatures
+                
+                # Send signed transaction with retry logic for rate limiting
+                url = "https://api.blockcypher.com/v1/ltc/main/txs/send"
+                max_retries = 3
+                retry_delay = 2  # Start with 2 second delay
+                
+                for attempt in range(max_retries):
+                    try:
+                        async with session.post(url, json=tx_data, timeout=aiohttp.ClientTimeout(total=10)) as send_response:
+                            send_status = send_response.status
+                            send_text = await send_response.text()
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                        # The request may have reached BlockCypher before the connection dropped
+                        raise PayoutStatusUnknown(f"txs/send did not answer: {e!r}")
+                    
+                    if send_status == 201:
+                        # txs/send answers with the TXSkeleton; the hash lives on its tx
+                        try:
+                            result = json.loads(send_text)
+                            tx_hash = result["tx"]["hash"]
+                        except (ValueError, KeyError, TypeError):
+                            raise PayoutStatusUnknown(f"txs/send accepted the transaction but returned no hash: {send_text[:200]}")
+                        print(f"✅ Withdrawal of {amount_ltc:.8f} LTC to {len(outputs_satoshi)} address(es) sent with tx: {tx_hash[:16]}...")
+                        # The transaction is out: local UTXO bookkeeping must never turn that into a failure
+                        try:
+                            self.apply_broadcast_to_utxos(result.get("tx", {}))
+                        except Exception as e:
+                            print(f"⚠️ Failed to apply broadcast to local UTXO set: {e}")
+                            self.request_utxo_refresh()
+                        return tx_hash
+                    elif send_status == 429:
+                        # Rate limited - retry with exponential backoff
+                        if attempt < max_retries - 1:
+                            print(f"⏳ Rate limited, retrying in {retry_delay} seconds... (attempt {attempt + 1}/{max_retries})")
+                            await asyncio.sleep(retry_delay)
+                            retry_delay *= 2  # Exponential backoff
+                        else:
+                            print(f"❌ Failed to broadcast transaction after {max_retries} attempts: Rate limit exceeded")
+                            return None
+                    elif send_status >= 500:
+                        # A server error can come after the transaction was already relayed
+                        raise PayoutStatusUnknown(f"txs/send failed with {send_status}: {send_text[:200]}")
+                    else:
+                        print(f"❌ Failed to broadcast transaction: {send_status} - {send_text}")
+                        return None
+
     def set_bot_instance(self, bot_instance):
         """Set the Discord bot instance for sending notifications"""
         self.bot = bot_instance
@@ -460,7 +846,7 @@ class LitecoinHandler:
 # Global handler instance
 ltc_handler = None
 
-def init_litecoin_handler(api_key: str, webhook_secret: str = None, bot_instance=None, main_wallet_id: str = None):
+def init_litecoin_handler(api_key: str, webhook_secret: str = None, bot_instance=None, main_wallet_id: str = None, event_bus=None):
     global ltc_handler
-    ltc_handler = LitecoinHandler(api_key, webhook_secret, bot_instance, main_wallet_id)
+    ltc_handler = LitecoinHandler(api_key, webhook_secret, bot_instance, main_wallet_id, event_bus)
     return ltc_handler
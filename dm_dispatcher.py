@@ -0,0 +1,143 @@
+import asyncio
+from collections import OrderedDict
+
+import discord
+
+# Discord allows at most 10 embeds and 6000 embed characters in total per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+def chunk_embeds(embeds: list) -> list:
+    """Split embeds into message-sized chunks that respect both the count and the combined length limit"""
+    chunks = []
+    chunk = []
+    chunk_chars = 0
+    for embed in embeds:
+        length = len(embed)
+        if chunk and (len(chunk) >= MAX_EMBEDS_PER_MESSAGE or chunk_chars + length > MAX_EMBED_CHARS_PER_MESSAGE):
+            chunks.append(chunk)
+            chunk = []
+            chunk_chars = 0
+        chunk.append(embed)
+        chunk_chars += length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class DMDispatcher:
+    """Outbound DM worker: queues messages, coalesces them per user and paces sends under Discord's rate limits"""
+
+    def __init__(self, bot, rate_per_second: float = 5.0, user_cache_size: int = 1000):
+        self.bot = bot
+        self.min_interval = 1.0 / rate_per_second
+        self.user_cache_size = user_cache_size
+        self.user_cache = OrderedDict()
+        self.pending = {}
+        self.queue = asyncio.Queue()
+        self.worker_task = None
+
+    def start(self):
+        """Start the delivery worker (safe to call again after reconnects)"""
+        if not self.worker_task:
+            self.worker_task = asyncio.create_task(self._worker())
+
+    async def get_user(self, user_id):
+        """Resolve a user, hitting the API only on a cache miss"""
+        user_id = int(user_id)
+        user = self.user_cache.get(user_id)
+        if user:
+            self.user_cache.move_to_end(user_id)
+            return user
+
+        user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+        self.user_cache[user_id] = user
+        if len(self.user_cache) > self.user_cache_size:
+            self.user_cache.popitem(last=False)
+        return user
+
+    def send(self, user_id, content: str = None, embed: discord.Embed = None,
+             fallback_channel=None, fallback_embed: discord.Embed = None):
+        """Queue a DM without waiting on Discord; messages for the same user are merged into one send.
+
+        Returns a future that resolves once delivery has been attempted, for callers that must know
+        the DM left the process (True if sent, False if Discord refused it or the user is unreachable).
+        """
+        user_id = int(user_id)
+        message = {
+            "content": content,
+            "embed": embed,
+            "fallback_channel": fallback_channel,
+            "fallback_embed": fallback_embed,
+            "delivered": asyncio.get_running_loop().create_future()
+        }
+        if user_id in self.pending:
+            # Already queued - ride along with the pending delivery
+            self.pending[user_id].append(message)
+        else:
+            self.pending[user_id] = [message]
+            self.queue.put_nowait(user_id)
+        return message["delivered"]
+
+    async def _worker(self):
+        while True:
+            user_id = await self.queue.get()
+            messages = self.pending.pop(user_id, [])
+            sent = False
+            try:
+                if messages:
+                    sent = await self._deliver(user_id, messages)
+            except Exception as e:
+                print(f"❌ Error delivering DM to user {user_id}: {e}")
+            finally:
+                self.queue.task_done()
+                for m in messages:
+                    if not m["delivered"].done():
+                        m["delivered"].set_result(bool(sent))
+            # Global pacing - lets bursts for the same user coalesce while we wait
+            await asyncio.sleep(self.min_interval)
+
+    async def _deliver(self, user_id: int, messages: list) -> bool:
+        user = await self.get_user(user_id)
+        if not user:
+            return False
+
+        content = "\n".join(m["content"] for m in messages if m["content"]) or None
+        embeds = [m["embed"] for m in messages if m["embed"]]
+
+        try:
+            if not embeds:
+                await user.send(content=content)
+            for i, chunk in enumerate(chunk_embeds(embeds)):
+                await self._send_chunk(user, content if i == 0 else None, chunk)
+            return True
+        except discord.Forbidden:
+            print(f"⚠️ Could not send DM to user {user_id} - DMs disabled")
+            for m in messages:
+                if m["fallback_channel"] and m["fallback_embed"]:
+                    try:
+                        await m["fallback_channel"].send(embed=m["fallback_embed"], delete_after=10)
+                    except Exception:
+                        pass
+            return False
+
+    async def _send_chunk(self, user, content, embeds: list):
+        """Send one coalesced message; if Discord rejects it, retry each embed alone so one bad DM can't sink the rest"""
+        try:
+            await user.send(content=content, embeds=embeds)
+            return
+        except discord.Forbidden:
+            raise
+        except discord.HTTPException as e:
+            if len(embeds) == 1:
+                print(f"❌ Failed to send DM to user {user.id}: {e}")
+                return
+            print(f"⚠️ Batched DM to user {user.id} rejected, retrying {len(embeds)} embed(s) one by one: {e}")
+
+        for i, embed in enumerate(embeds):
+            try:
+                await user.send(content=content if i == 0 else None, embed=embed)
+            except discord.Forbidden:
+                raise
+            except discord.HTTPException as e:
+                print(f"❌ Failed to send DM to user {user.id}: {e}")
@@ -0,0 +1,132 @@
+import asyncio
+import json
+import os
+import uuid
+
+
+class EventBus:
+    """In-process async pub/sub: publish() hands events straight to subscribers, no polling"""
+
+    def __init__(self, spool_path: str = None):
+        self.subscribers = {}
+        # Journal of durable events: each is appended before delivery and acked once its handlers return,
+        # so a durable handler should only return after its side effects have left the process
+        self.spool_path = spool_path
+        self.unacked = {}
+        self.tasks = set()
+        self.started = False
+
+    def subscribe(self, event_type: str, handler):
+        """Register an async handler(event) for an event type"""
+        self.subscribers.setdefault(event_type, []).append(handler)
+        return handler
+
+    def on(self, event_type: str):
+        """Decorator form of subscribe()"""
+        def decorator(handler):
+            return self.subscribe(event_type, handler)
+        return decorator
+
+    def publish(self, event_type: str, **payload) -> int:
+        """Deliver an event to every subscriber as its own task; returns the number of handlers scheduled"""
+        event = {"type": event_type, **payload}
+        handlers = self.subscribers.get(event_type, [])
+        for handler in handlers:
+            self._track(asyncio.create_task(self._dispatch(handler, event)))
+        return len(handlers)
+
+    def publish_durable(self, event_type: str, **payload) -> int:
+        """Like publish(), but the event is spooled first and replayed on the next start if the bot dies before delivery"""
+        if not self.spool_path:
+            return self.publish(event_type, **payload)
+
+        event = {"id": uuid.uuid4().hex, "type": event_type, **payload}
+        try:
+            self._append(event)
+        except Exception as e:
+            # Still deliver it now; only the crash protection is lost
+            print(f"❌ Error spooling {event_type} event: {e}")
+            return self.publish(event_type, **payload)
+
+        self.unacked[event["id"]] = event
+        handlers = self.subscribers.get(event_type, [])
+        self._track(asyncio.create_task(self._deliver_durable(event, handlers)))
+        return len(handlers)
+
+    def _track(self, task):
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+    async def _dispatch(self, handler, event: dict):
+        try:
+            await handler(event)
+        except Exception as e:
+            print(f"❌ Error handling {event['type']} event: {e}")
+
+    async def _deliver_durable(self, event: dict, handlers: list):
+        event_id = event["id"]
+        handler_event = {key: value for key, value in event.items() if key != "id"}
+        await asyncio.gather(*(self._dispatch(handler, handler_event) for handler in handlers))
+        self.unacked.pop(event_id, None)
+        try:
+            self._append({"ack": event_id})
+            if not self.unacked:
+                self._compact()
+        except Exception as e:
+            print(f"❌ Error acknowledging {event['type']} event: {e}")
+
+    def _append(self, record: dict):
+        """Append a record to the spool and flush it to disk before returning"""
+        with open(self.spool_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_spool(self) -> list:
+        """Return spooled events whose delivery was never acknowledged"""
+        if not os.path.exists(self.spool_path):
+            return []
+
+        events = {}
+        with open(self.spool_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-append
+                    continue
+                if "ack" in record:
+                    events.pop(record["ack"], None)
+                elif "id" in record and "type" in record:
+                    events[record["id"]] = record
+        return list(events.values())
+
+    def _compact(self):
+        """Rewrite the spool with only the events that are still undelivered"""
+        tmp_path = f"{self.spool_path}.tmp"
+        with open(tmp_path, "w") as f:
+            for event in self.unacked.values():
+                f.write(json.dumps(event) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.spool_path)
+
+    async def start(self):
+        """Redeliver durable events that were spooled but not acknowledged before the last shutdown (once per process)"""
+        if self.started or not self.spool_path:
+            return
+        self.started = True
+        try:
+            replayed = self._load_spool()
+            for event in replayed:
+                self.unacked[event["id"]] = event
+            self._compact()
+            for event in replayed:
+                self._track(asyncio.create_task(self._deliver_durable(event, self.subscribers.get(event["type"], []))))
+            if replayed:
+                print(f"✅ Redelivering {len(replayed)} spooled event(s)")
+        except Exception as e:
+            print(f"❌ Error replaying event spool: {e}")
@@ -0,0 +1,56 @@
+from PIL import ImageFont
+
+# Candidate font files per face, tried in order
+FONT_FACES = {
+    "bold": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+        "/System/Library/Fonts/Helvetica.ttc"
+    ],
+    "regular": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "arial.ttf"
+    ],
+    # Game symbols and the limbo multiplier only use DejaVu; callers pass their own fallback font
+    "emoji": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+    ],
+    "multiplier": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+    ],
+    "card_rank": [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "arial.ttf"
+    ],
+    "label": [
+        "arial.ttf"
+    ]
+}
+
+_fonts = {}
+
+def get_font(face, size, fallback=None):
+    """Return a font for (face, size), parsing the font file only the first time it is requested.
+
+    If none of the face's files load, ``fallback`` is used when given, otherwise PIL's default font.
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is not None:
+        return font
+
+    for font_path in FONT_FACES[face]:
+        try:
+            font = ImageFont.truetype(font_path, size)
+            break
+        except OSError:
+            continue
+    else:
+        if fallback is not None:
+            font = fallback
+        else:
+            print(f"⚠️ Using default font for {face} {size}px - text may look basic")
+            font = ImageFont.load_default()
+
+    _fonts[key] = font
+    return font
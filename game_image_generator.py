@@ -1,9 +1,60 @@
 
-from PIL import Image, ImageDraw, ImageFont
-import os
+from PIL import Image, ImageDraw
+import math
 import random
+from font_registry import get_font
+from card_generator import CardImageGenerator
+from image_encoder import encode_image, encode_animation
+
+# NumPy is listed in requirements.txt; installs without it fall back to stamping sprites with one paste each
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bump whenever a generator's output changes so cached renders are invalidated
+RENDER_VERSION = 1
+
+# Animated results: delay per frame, how long the final frame is held, and frame counts per game
+ANIMATION_FRAME_MS = 80
+ANIMATION_HOLD_MS = 10000
+COINFLIP_SPIN_FRAMES = 14
+DICE_ROLL_FRAMES = 10
+SLOTS_SPIN_FRAMES = 12
+LIMBO_COUNT_FRAMES = 16
+PLINKO_FRAMES_PER_ROW = 2
+
+def animation_seconds(frame_count):
+    """How long an animation plays before it reaches its final frame"""
+    return frame_count * ANIMATION_FRAME_MS / 1000
+
+def stamp_sprites(img, sprite, positions):
+    """Paste an opaque sprite at every (x, y) position, in one array write when NumPy is available"""
+    if not positions:
+        return img
+
+    if np is None:
+        for position in positions:
+            img.paste(sprite, position)
+        return img
+
+    canvas = np.array(img)
+    tile = np.asarray(sprite.convert(img.mode))
+    xs = np.array([x for x, _ in positions])
+    ys = np.array([y for _, y in positions])
+    rows = ys[:, None] + np.arange(tile.shape[0])
+    cols = xs[:, None] + np.arange(tile.shape[1])
+    canvas[rows[:, :, None], cols[:, None, :]] = tile
+    img.paste(Image.fromarray(canvas, img.mode))
+    return img
 
 class GameImageGenerator:
+    # Coin face colours: main, highlight, rim shadow
+    COIN_COLORS = {
+        "heads": ((247, 147, 26), (255, 180, 100), (180, 100, 0)),  # Bitcoin orange
+        "tails": ((52, 116, 190), (100, 150, 220), (30, 70, 130))  # Litecoin blue
+    }
+
     def __init__(self):
         self.width = 800
         self.height = 600
@@ -14,180 +65,435 @@ class GameImageGenerator:
         self.orange_color = (251, 146, 60)
         self.white_color = (255, 255, 255)
         
-        # Try multiple font paths
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc"
-        ]
-        
-        font_loaded = False
-        for font_path in font_paths:
-            try:
-                self.font_large = ImageFont.truetype(font_path, 48)
-                self.font_medium = ImageFont.truetype(font_path, 32)
-                self.font_small = ImageFont.truetype(font_path, 24)
-                font_loaded = True
-                print(f"✅ Loaded font from: {font_path}")
-                break
-            except:
-                continue
-        
-        if not font_loaded:
-            print("⚠️ Using default font - text may look basic")
-            self.font_large = ImageFont.load_default()
-            self.font_medium = ImageFont.load_default()
-            self.font_small = ImageFont.load_default()
-
-    def create_coinflip_image(self, result, choice, save_path):
+        # Fonts come from the shared registry - each face/size is parsed once per process
+        self.font_large = get_font("bold", 48)
+        self.font_medium = get_font("bold", 32)
+        self.font_small = get_font("bold", 24)
+        self.font_multiplier = get_font("multiplier", 72, fallback=self.font_large)
+        self.font_emoji_large = get_font("emoji", 90, fallback=self.font_large)
+        self.font_emoji_medium = get_font("emoji", 50, fallback=self.font_large)
+        self.font_tiny = get_font("bold", 16)
+
+        self.card_generator = None
+
+        # Encodes finished frames; IMAGE_FORMAT / PNG_COMPRESS_LEVEL pick PNG, palette PNG or WebP
+        self.encoder = encode_image
+        self.animation_encoder = encode_animation
+
+        # Static per-game layers (background, borders, titles, boards), drawn once and copied per round
+        self.base_layers = {}
+
+        # Pre-rendered mines tiles: hidden, diamond, mine
+        self.mines_tile_size = 100
+        self.mines_tile_sprites = {}
+
+        # Pre-rendered tower level boxes keyed by style
+        self.tower_level_sprites = {}
+
+        # Plinko boards (pegs + buckets) keyed by rows and multipliers, i.e. one per rows/difficulty
+        self.plinko_boards = {}
+
+    def get_card_generator(self):
+        """Lazily create the card generator used for card-based games"""
+        if self.card_generator is None:
+            self.card_generator = CardImageGenerator()
+        return self.card_generator
+
+    def get_base_layer(self, game):
+        """Return a fresh copy of a game's static layer, drawing it only the first time"""
+        base = self.base_layers.get(game)
+        if base is None:
+            base = getattr(self, f"_build_{game}_base")()
+            self.base_layers[game] = base
+        return base.copy()
+
+    def build_base_layers(self):
+        """Draw every game's static layer up front so no round pays for it"""
+        for name in dir(self):
+            if name.startswith("_build_") and name.endswith("_base"):
+                self.get_base_layer(name[len("_build_"):-len("_base")])
+
+    def _draw_glow_title(self, draw, title_text, y, fill, glow_fill, passes=3):
+        """Draw a centered title with offset glow passes"""
+        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
+        text_width = bbox[2] - bbox[0]
+        title_x = self.width//2 - text_width//2
+
+        for offset in range(passes, 0, -1):
+            draw.text((title_x + offset, y + offset), title_text, fill=glow_fill, font=self.font_large)
+        draw.text((title_x, y), title_text, fill=fill, font=self.font_large)
+
+    def _build_coinflip_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border with gradient effect
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
+
+        # Draw title with glow effect
+        self._draw_glow_title(draw, "COINFLIP", 50, self.white_color, (20, 150, 170, 100))
+        return img
+
+    def _build_dice_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
+
+        # Draw title
+        draw.text((self.width//2 - 80, 50), "DICE ROLL", fill=self.white_color, font=self.font_large)
+        return img
+
+    def _build_slots_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border with vegas style
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=(255, 215, 0), width=6)
+        draw.rectangle([16, 16, self.width-16, self.height-16], outline=self.border_color, width=3)
+
+        # Draw title with glow
+        self._draw_glow_title(draw, "🎰 SLOTS 🎰", 40, (255, 215, 0), (255, 215, 0, 80), passes=4)
+
+        # Machine outer body with metallic look
+        frame_x, frame_y, frame_width, frame_height = self._slots_frame()
+        draw.rectangle([frame_x - 10, frame_y - 10, frame_x + frame_width + 10, frame_y + frame_height + 10],
+                      fill=(60, 60, 70), outline=(150, 150, 160), width=8)
+        draw.rectangle([frame_x, frame_y, frame_x + frame_width, frame_y + frame_height],
+                      fill=(40, 40, 50), outline=(100, 100, 110), width=5)
+        return img
+
+    def _slots_frame(self):
+        """Slot machine frame geometry: x, y, width, height"""
+        frame_width = 650
+        frame_height = 280
+        return (self.width - frame_width) // 2, self.height // 2 - 80, frame_width, frame_height
+
+    def _build_rps_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border with gradient
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
+
+        # Draw title with glow
+        self._draw_glow_title(draw, "🤜 ROCK PAPER SCISSORS 🤛", 30, self.white_color, (20, 100, 120))
+
+        center_y = self.height // 2
+
+        # Side labels
+        for label_x, label_text in ((150, "YOU"), (self.width - 150, "BOT")):
+            bbox = draw.textbbox((0, 0), label_text, font=self.font_medium)
+            text_w = bbox[2] - bbox[0]
+            draw.text((label_x - text_w//2, center_y - 160), label_text,
+                     fill=self.white_color, font=self.font_medium)
+
+        # VS text in center with circle
+        vs_x = self.width // 2
+        draw.ellipse([vs_x - 50, center_y - 50, vs_x + 50, center_y + 50],
+                    fill=(100, 50, 0), outline=self.orange_color, width=4)
+        bbox = draw.textbbox((0, 0), "VS", font=self.font_large)
+        text_w = bbox[2] - bbox[0]
+        text_h = bbox[3] - bbox[1]
+        draw.text((vs_x - text_w//2, center_y - text_h//2), "VS",
+                 fill=self.orange_color, font=self.font_large)
+        return img
+
+    def _build_mines_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
+
+        # Draw title
+        draw.text((self.width//2 - 80, 30), "MINES", fill=self.white_color, font=self.font_large)
+
+        # Draw the 5x5 grid with every tile hidden
+        hidden = self.get_mines_tile_sprite("hidden")
+        stamp_sprites(img, hidden, [self.mines_tile_origin(tile_idx) for tile_idx in range(25)])
+        return img
+
+    def mines_tile_origin(self, tile_idx):
+        """Top-left pixel of a tile in the 5x5 mines grid"""
+        grid_start_x = (self.width - 5 * self.mines_tile_size) // 2
+        grid_start_y = 100
+        return (grid_start_x + (tile_idx % 5) * self.mines_tile_size,
+                grid_start_y + (tile_idx // 5) * self.mines_tile_size)
+
+    def get_mines_tile_sprite(self, kind):
+        """Return the cached "hidden", "diamond" or "mine" tile, drawing it on first use"""
+        sprite = self.mines_tile_sprites.get(kind)
+        if sprite is not None:
+            return sprite
+
+        styles = {
+            "hidden": ((60, 60, 60), (120, 120, 120), None),
+            "diamond": ((0, 100, 0), (0, 255, 0), "💎"),
+            "mine": ((150, 0, 0), (255, 0, 0), "💣")
+        }
+        fill, outline, symbol = styles[kind]
+        side = self.mines_tile_size - 4
+        sprite = Image.new('RGB', (side, side), self.bg_color)
+        draw = ImageDraw.Draw(sprite)
+        draw.rectangle([0, 0, side - 1, side - 1], fill=fill, outline=outline, width=2)
+        if symbol:
+            draw.text((30, 25), symbol, fill=self.white_color, font=self.font_medium)
+
+        self.mines_tile_sprites[kind] = sprite
+        return sprite
+
+    def _build_plinko_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border with gradient
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.orange_color, width=5)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(200, 100, 0), width=2)
+
+        # Draw title with glow
+        self._draw_glow_title(draw, "🏀 PLINKO 🏀", 25, self.white_color, (150, 70, 0))
+        return img
+
+    def _build_peg_sprite(self):
+        """A single peg with its drop shadow on the board background"""
+        sprite = Image.new('RGB', (11, 11), self.bg_color)
+        draw = ImageDraw.Draw(sprite)
+        # Peg shadow
+        draw.ellipse([2, 2, 10, 10], fill=(30, 30, 30))
+        # Peg
+        draw.ellipse([0, 0, 8, 8], fill=(200, 200, 200), outline=(150, 150, 150), width=1)
+        return sprite
+
+    def _build_tower_level_sprite(self, color, border_color, level_width, level_height):
+        """A tower level box with its depth shadow on the board background"""
+        sprite = Image.new('RGB', (level_width + 4, level_height - 1), self.bg_color)
+        draw = ImageDraw.Draw(sprite)
+        draw.rectangle([3, 3, level_width + 3, level_height - 2], fill=(30, 30, 30))
+        draw.rectangle([0, 0, level_width, level_height - 5], fill=color, outline=border_color, width=3)
+        return sprite
+
+    def _build_limbo_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border with cosmic gradient
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=(147, 51, 234), width=5)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(100, 30, 180), width=2)
+
+        # Draw title with glow
+        self._draw_glow_title(draw, "🌌 LIMBO 🌌", 30, (147, 51, 234), (100, 30, 180, 100), passes=4)
+        return img
+
+    def _build_balloon_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
+
+        # Draw title at top with glow - always visible
+        self._draw_glow_title(draw, "🎈 BALLOON PUMP 🎈", 25, self.white_color, (100, 50, 50))
+        return img
+
+    def _build_dice_battle_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
+
+        # Draw title
+        draw.text((self.width//2 - 120, 30), "DICE BATTLE", fill=self.white_color, font=self.font_large)
+
+        # Side labels
+        draw.text((self.width // 4 - 40, self.height // 2 - 120), "YOU", fill=self.white_color, font=self.font_medium)
+        draw.text((3 * self.width // 4 - 40, self.height // 2 - 120), "BOT", fill=self.white_color, font=self.font_medium)
+
+        # VS text
+        draw.text((self.width//2 - 30, self.height//2 - 20), "VS",
+                 fill=self.orange_color, font=self.font_large)
+        return img
+
+    def _build_baccarat_base(self):
+        # Create canvas with green felt background
+        img = Image.new('RGB', (self.width, self.height), (34, 87, 45))
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=4)
+
+        # Title with glow
+        self._draw_glow_title(draw, "🎴 BACCARAT 🎴", 30, (255, 215, 0), (20, 60, 30))
+        return img
+
+    def _build_towers_base(self):
+        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        draw = ImageDraw.Draw(img)
+
+        # Draw border
+        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=4)
+        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
+
+        # Draw title with glow
+        self._draw_glow_title(draw, "🏗️ TOWERS 🏗️", 25, self.white_color, (20, 100, 120))
+        return img
+
+    def create_coinflip_image(self, result, choice):
         """Create enhanced coinflip image with Bitcoin/Litecoin logos"""
         try:
-            img = Image.new('RGB', (self.width, self.height), self.bg_color)
-            draw = ImageDraw.Draw(img)
-            
-            # Draw border with gradient effect
-            draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
-            draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
-            
-            # Draw title with glow effect
-            title_text = "COINFLIP"
-            bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-            text_width = bbox[2] - bbox[0]
-            title_x = self.width//2 - text_width//2
-            
-            # Glow effect
-            for offset in range(3, 0, -1):
-                draw.text((title_x + offset, 50 + offset), title_text, fill=(20, 150, 170, 100), font=self.font_large)
-            draw.text((title_x, 50), title_text, fill=self.white_color, font=self.font_large)
-            
-            # Draw coin with 3D effect
-            center_x, center_y = self.width // 2, self.height // 2
-            coin_radius = 140
-            
-            if result == "heads":
-                coin_color = (247, 147, 26)  # Bitcoin orange
-                coin_highlight = (255, 180, 100)
-                coin_shadow_color = (180, 100, 0)
-            else:
-                coin_color = (52, 116, 190)  # Litecoin blue
-                coin_highlight = (100, 150, 220)
-                coin_shadow_color = (30, 70, 130)
-            
-            # Multiple shadow layers for depth
-            for i in range(8, 0, -1):
-                shadow_alpha = 30 - i * 3
-                draw.ellipse([center_x - coin_radius + i*2, center_y - coin_radius + i*2, 
-                             center_x + coin_radius + i*2, center_y + coin_radius + i*2], 
-                            fill=(0, 0, 0))
-            
-            # Coin base
-            draw.ellipse([center_x - coin_radius, center_y - coin_radius, 
-                         center_x + coin_radius, center_y + coin_radius], 
-                        fill=coin_shadow_color)
-            
-            # Coin main body
-            draw.ellipse([center_x - coin_radius + 5, center_y - coin_radius + 5, 
-                         center_x + coin_radius - 5, center_y + coin_radius - 5], 
-                        fill=coin_color, outline=(255, 255, 255), width=8)
-            
-            # Highlight for 3D effect
-            draw.ellipse([center_x - coin_radius//2, center_y - coin_radius + 20, 
-                         center_x + coin_radius//3, center_y - coin_radius//3], 
-                        fill=coin_highlight)
-            
-            # Inner ring detail
-            draw.ellipse([center_x - coin_radius + 20, center_y - coin_radius + 20, 
-                         center_x + coin_radius - 20, center_y + coin_radius - 20], 
-                        outline=coin_highlight, width=3)
-            
-            # Draw crypto logos as simple geometric shapes
-            if result == "heads":
-                # Bitcoin logo - stylized B with two vertical lines
-                logo_size = 80
-                
-                # Outer circle for B
-                draw.ellipse([center_x - logo_size//2, center_y - logo_size//2,
-                             center_x + logo_size//2, center_y + logo_size//2],
-                            outline=self.white_color, width=8)
-                
-                # Vertical line on left
-                draw.line([(center_x - logo_size//4, center_y - logo_size//2 - 15),
-                          (center_x - logo_size//4, center_y + logo_size//2 + 15)],
-                         fill=self.white_color, width=6)
-                
-                # Top curve of B
-                draw.arc([center_x - logo_size//4, center_y - logo_size//3,
-                         center_x + logo_size//2, center_y],
-                        start=270, end=90, fill=self.white_color, width=8)
-                
-                # Bottom curve of B
-                draw.arc([center_x - logo_size//4, center_y,
-                         center_x + logo_size//2, center_y + logo_size//3],
-                        start=270, end=90, fill=self.white_color, width=8)
-                
-                # Middle horizontal line
-                draw.line([(center_x - logo_size//4, center_y),
-                          (center_x + logo_size//3, center_y)],
-                         fill=self.white_color, width=8)
-                
-            else:
-                # Litecoin logo - stylized L
-                logo_size = 80
-                
-                # Outer circle for L
-                draw.ellipse([center_x - logo_size//2, center_y - logo_size//2,
-                             center_x + logo_size//2, center_y + logo_size//2],
-                            outline=self.white_color, width=8)
-                
-                # Vertical line of L
-                draw.line([(center_x - logo_size//4, center_y - logo_size//3),
-                          (center_x - logo_size//4, center_y + logo_size//3)],
-                         fill=self.white_color, width=10)
-                
-                # Bottom horizontal of L
-                draw.line([(center_x - logo_size//4, center_y + logo_size//3),
-                          (center_x + logo_size//3, center_y + logo_size//3)],
-                         fill=self.white_color, width=10)
-                
-                # Diagonal slash through L
-                draw.line([(center_x - logo_size//2 + 10, center_y + 10),
-                          (center_x, center_y - 10)],
-                         fill=self.white_color, width=8)
-            
-            # Draw choice with better styling - fix clipping by adjusting position
-            result_color = self.green_color if result == choice else self.red_color
-            result_text = "✓ WINNER!" if result == choice else "✗ LOST"
-            
-            draw.text((50, self.height - 120), f"Your Call: {choice.upper()}", 
-                     fill=(200, 200, 200), font=self.font_medium)
-            draw.text((50, self.height - 80), f"Result: {result.upper()}", 
-                     fill=self.white_color, font=self.font_medium)
-            
-            # Fix winner text clipping - calculate width and position properly
-            bbox = draw.textbbox((0, 0), result_text, font=self.font_large)
-            result_text_width = bbox[2] - bbox[0]
-            # Position it with margin from right edge
-            result_x = self.width - result_text_width - 60
-            draw.text((result_x, self.height - 100), result_text, 
-                     fill=result_color, font=self.font_large)
-            
-            img.save(save_path)
-            print(f"✅ Created coinflip image: {save_path}")
-            return True
+            return self.encoder(self._draw_coinflip(result, choice))
         except Exception as e:
             print(f"❌ Error creating coinflip image: {e}")
-            return False
+            return None
 
-    def create_dice_image(self, roll, save_path):
-        """Create dice roll image"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+    def _draw_coinflip(self, result, choice):
+        """Draw the final coinflip frame"""
+        img = self.get_base_layer("coinflip")
         draw = ImageDraw.Draw(img)
         
-        # Draw border
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
+        # Draw coin with 3D effect
+        center_x, center_y = self.width // 2, self.height // 2
+        coin_radius = 140
         
-        # Draw title
-        draw.text((self.width//2 - 80, 50), "DICE ROLL", fill=self.white_color, font=self.font_large)
+        coin_color, coin_highlight, coin_shadow_color = self.COIN_COLORS["heads" if result == "heads" else "tails"]
+        
+        # Multiple shadow layers for depth
+        for i in range(8, 0, -1):
+            shadow_alpha = 30 - i * 3
+            draw.ellipse([center_x - coin_radius + i*2, center_y - coin_radius + i*2, 
+                         center_x + coin_radius + i*2, center_y + coin_radius + i*2], 
+                        fill=(0, 0, 0))
+        
+        # Coin base
+        draw.ellipse([center_x - coin_radius, center_y - coin_radius, 
+                     center_x + coin_radius, center_y + coin_radius], 
+                    fill=coin_shadow_color)
+        
+        # Coin main body
+        draw.ellipse([center_x - coin_radius + 5, center_y - coin_radius + 5, 
+                     center_x + coin_radius - 5, center_y + coin_radius - 5], 
+                    fill=coin_color, outline=(255, 255, 255), width=8)
+        
+        # Highlight for 3D effect
+        draw.ellipse([center_x - coin_radius//2, center_y - coin_radius + 20, 
+                     center_x + coin_radius//3, center_y - coin_radius//3], 
+                    fill=coin_highlight)
+        
+        # Inner ring detail
+        draw.ellipse([center_x - coin_radius + 20, center_y - coin_radius + 20, 
+                     center_x + coin_radius - 20, center_y + coin_radius - 20], 
+                    outline=coin_highlight, width=3)
+        
+        # Draw crypto logos as simple geometric shapes
+        if result == "heads":
+            # Bitcoin logo - stylized B with two vertical lines
+            logo_size = 80
+        
+            # Outer circle for B
+            draw.ellipse([center_x - logo_size//2, center_y - logo_size//2,
+                         center_x + logo_size//2, center_y + logo_size//2],
+                        outline=self.white_color, width=8)
+        
+            # Vertical line on left
+            draw.line([(center_x - logo_size//4, center_y - logo_size//2 - 15),
+                      (center_x - logo_size//4, center_y + logo_size//2 + 15)],
+                     fill=self.white_color, width=6)
+        
+            # Top curve of B
+            draw.arc([center_x - logo_size//4, center_y - logo_size//3,
+                     center_x + logo_size//2, center_y],
+                    start=270, end=90, fill=self.white_color, width=8)
+        
+            # Bottom curve of B
+            draw.arc([center_x - logo_size//4, center_y,
+                     center_x + logo_size//2, center_y + logo_size//3],
+                    start=270, end=90, fill=self.white_color, width=8)
+        
+            # Middle horizontal line
+            draw.line([(center_x - logo_size//4, center_y),
+                      (center_x + logo_size//3, center_y)],
+                     fill=self.white_color, width=8)
+        
+        else:
+            # Litecoin logo - stylized L
+            logo_size = 80
+        
+            # Outer circle for L
+            draw.ellipse([center_x - logo_size//2, center_y - logo_size//2,
+                         center_x + logo_size//2, center_y + logo_size//2],
+                        outline=self.white_color, width=8)
+        
+            # Vertical line of L
+            draw.line([(center_x - logo_size//4, center_y - logo_size//3),
+                      (center_x - logo_size//4, center_y + logo_size//3)],
+                     fill=self.white_color, width=10)
+        
+            # Bottom horizontal of L
+            draw.line([(center_x - logo_size//4, center_y + logo_size//3),
+                      (center_x + logo_size//3, center_y + logo_size//3)],
+                     fill=self.white_color, width=10)
+        
+            # Diagonal slash through L
+            draw.line([(center_x - logo_size//2 + 10, center_y + 10),
+                      (center_x, center_y - 10)],
+                     fill=self.white_color, width=8)
+        
+        # Draw choice with better styling - fix clipping by adjusting position
+        result_color = self.green_color if result == choice else self.red_color
+        result_text = "✓ WINNER!" if result == choice else "✗ LOST"
+        
+        draw.text((50, self.height - 120), f"Your Call: {choice.upper()}", 
+                 fill=(200, 200, 200), font=self.font_medium)
+        draw.text((50, self.height - 80), f"Result: {result.upper()}", 
+                 fill=self.white_color, font=self.font_medium)
+        
+        # Fix winner text clipping - calculate width and position properly
+        bbox = draw.textbbox((0, 0), result_text, font=self.font_large)
+        result_text_width = bbox[2] - bbox[0]
+        # Position it with margin from right edge
+        result_x = self.width - result_text_width - 60
+        draw.text((result_x, self.height - 100), result_text, 
+                 fill=result_color, font=self.font_large)
+        
+        return img
+
+    def create_coinflip_animation(self, result, choice):
+        """Toss and spin the coin, then land on the final result frame"""
+        center_x, center_y = self.width // 2, self.height // 2
+        coin_radius = 140
+
+        frames = []
+        for i in range(COINFLIP_SPIN_FRAMES):
+            frame = self.get_base_layer("coinflip")
+            draw = ImageDraw.Draw(frame)
+
+            # Three full turns while the coin rises and falls
+            progress = i / COINFLIP_SPIN_FRAMES
+            turn = math.cos(progress * 6 * math.pi)
+            coin_color, coin_highlight, coin_shadow_color = self.COIN_COLORS["heads" if turn >= 0 else "tails"]
+            half_width = max(6, int(coin_radius * abs(turn)))
+            inset = max(1, int(5 * abs(turn)))
+            y = center_y - int(120 * math.sin(math.pi * progress))
+
+            draw.ellipse([center_x - half_width, y - coin_radius, center_x + half_width, y + coin_radius],
+                        fill=coin_shadow_color)
+            draw.ellipse([center_x - half_width + inset, y - coin_radius + 5, center_x + half_width - inset, y + coin_radius - 5],
+                        fill=coin_color, outline=(255, 255, 255), width=8 if half_width > 30 else 2)
+            frames.append(frame)
+
+        frames.append(self._draw_coinflip(result, choice))
+        durations = [ANIMATION_FRAME_MS] * COINFLIP_SPIN_FRAMES + [ANIMATION_HOLD_MS]
+        return self.animation_encoder(frames, durations)
+
+    def create_dice_image(self, roll):
+        """Create dice roll image"""
+        img = self.get_base_layer("dice")
+        draw = ImageDraw.Draw(img)
         
         # Draw dice
         center_x, center_y = self.width // 2, self.height // 2
@@ -210,8 +516,7 @@ class GameImageGenerator:
         draw.text((50, self.height - 60), f"Rolled: {roll}", 
                  fill=self.green_color, font=self.font_medium)
         
-        img.save(save_path)
-        return True
+        return self.encoder(img)
     
     def _draw_dice_pips(self, draw, center_x, center_y, size, number):
         """Draw pips on dice"""
@@ -237,94 +542,98 @@ class GameImageGenerator:
             draw.ellipse([x - pip_radius, y - pip_radius, x + pip_radius, y + pip_radius],
                         fill=(0, 0, 0))
 
-    def create_slots_image(self, result, save_path):
+    def create_slots_image(self, result):
         """Create enhanced slots result image with casino styling"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        return self.encoder(self._draw_slots(result))
+
+    def _draw_slots(self, result):
+        img = self.get_base_layer("slots")
         draw = ImageDraw.Draw(img)
         
-        # Draw border with vegas style
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=(255, 215, 0), width=6)
-        draw.rectangle([16, 16, self.width-16, self.height-16], outline=self.border_color, width=3)
-        
-        # Draw title with glow
-        title_text = "🎰 SLOTS 🎰"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        # Glow effect
-        for offset in range(4, 0, -1):
-            draw.text((title_x + offset, 40 + offset), title_text, fill=(255, 215, 0, 80), font=self.font_large)
-        draw.text((title_x, 40), title_text, fill=(255, 215, 0), font=self.font_large)
-        
-        # Draw slot machine frame with gradient effect
-        frame_width = 650
-        frame_height = 280
-        frame_x = (self.width - frame_width) // 2
-        frame_y = self.height // 2 - 80
+        # Check if jackpot
+        is_jackpot = len(set(result)) == 1
         
-        # Machine outer body with metallic look
-        draw.rectangle([frame_x - 10, frame_y - 10, frame_x + frame_width + 10, frame_y + frame_height + 10],
-                      fill=(60, 60, 70), outline=(150, 150, 160), width=8)
-        draw.rectangle([frame_x, frame_y, frame_x + frame_width, frame_y + frame_height],
-                      fill=(40, 40, 50), outline=(100, 100, 110), width=5)
+        for i, symbol in enumerate(result):
+            self._draw_slots_reel(draw, i, symbol, is_jackpot)
+        self._draw_slots_verdict(draw, result)
+        return img
+
+    def create_slots_animation(self, result, symbols):
+        """Spin the reels through the symbol strip, stopping them left to right on the result"""
+        frames = []
+        for i in range(SLOTS_SPIN_FRAMES):
+            frame = self.get_base_layer("slots")
+            draw = ImageDraw.Draw(frame)
+            for reel, symbol in enumerate(result):
+                # Reel n stops after (n + 1) thirds of the spin
+                if i >= SLOTS_SPIN_FRAMES * (reel + 1) // len(result):
+                    self._draw_slots_reel(draw, reel, symbol, False)
+                else:
+                    self._draw_slots_reel(draw, reel, symbols[(i + reel * 2) % len(symbols)], False)
+            frames.append(frame)
+
+        frames.append(self._draw_slots(result))
+
+        durations = [ANIMATION_FRAME_MS] * SLOTS_SPIN_FRAMES + [ANIMATION_HOLD_MS]
+        return self.animation_encoder(frames, durations)
+
+    def _draw_slots_reel(self, draw, i, symbol, is_jackpot):
+        """One reel window with its symbol"""
+        frame_x, frame_y, frame_width, frame_height = self._slots_frame()
         
         # Draw reels with better styling
         reel_width = 170
         reel_spacing = 35
         start_x = frame_x + 40
         
-        # Check if jackpot
-        is_jackpot = len(set(result)) == 1
+        # Larger emoji font for symbols
+        emoji_font = self.font_emoji_large
         
-        # Load larger emoji font for symbols
-        try:
-            emoji_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 90)
-        except:
-            emoji_font = self.font_large
+        reel_x = start_x + i * (reel_width + reel_spacing)
+        reel_y = frame_y + 50
+        reel_h = 180
         
-        for i, symbol in enumerate(result):
-            reel_x = start_x + i * (reel_width + reel_spacing)
-            reel_y = frame_y + 50
-            reel_h = 180
-            
-            # Reel shadow
-            draw.rectangle([reel_x + 5, reel_y + 5, reel_x + reel_width + 5, reel_y + reel_h + 5],
-                          fill=(20, 20, 20))
-            
-            # Reel background with gradient effect
-            if is_jackpot:
-                # Gold background for jackpot
-                draw.rectangle([reel_x, reel_y, reel_x + reel_width, reel_y + reel_h],
-                              fill=(255, 235, 180), outline=(255, 215, 0), width=5)
-            else:
-                # Normal white background
-                draw.rectangle([reel_x, reel_y, reel_x + reel_width, reel_y + reel_h],
-                              fill=(245, 245, 250), outline=(180, 180, 190), width=4)
-            
-            # Inner border for depth
-            draw.rectangle([reel_x + 5, reel_y + 5, reel_x + reel_width - 5, reel_y + reel_h - 5],
-                          outline=(200, 200, 210), width=2)
-            
-            # Draw emoji symbol larger and centered
-            # Get text bounding box for accurate centering
-            bbox = draw.textbbox((0, 0), symbol, font=emoji_font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            # Calculate center position
-            symbol_x = reel_x + (reel_width // 2) - text_width // 2
-            symbol_y = reel_y + (reel_h // 2) - text_height // 2
-            
-            # Draw shadow for depth
-            draw.text((symbol_x + 2, symbol_y + 2), symbol, font=emoji_font, fill=(100, 100, 100), embedded_color=True)
-            # Main symbol - use embedded_color=True to preserve emoji colors
-            draw.text((symbol_x, symbol_y), symbol, font=emoji_font, fill=self.white_color, embedded_color=True)
-            
-            # Shine effect on reel
-            draw.polygon([(reel_x + 10, reel_y + 10), (reel_x + 40, reel_y + 10), 
-                         (reel_x + 10, reel_y + 40)], fill=(255, 255, 255, 100))
+        # Reel shadow
+        draw.rectangle([reel_x + 5, reel_y + 5, reel_x + reel_width + 5, reel_y + reel_h + 5],
+                      fill=(20, 20, 20))
+        
+        # Reel background with gradient effect
+        if is_jackpot:
+            # Gold background for jackpot
+            draw.rectangle([reel_x, reel_y, reel_x + reel_width, reel_y + reel_h],
+                          fill=(255, 235, 180), outline=(255, 215, 0), width=5)
+        else:
+            # Normal white background
+            draw.rectangle([reel_x, reel_y, reel_x + reel_width, reel_y + reel_h],
+                          fill=(245, 245, 250), outline=(180, 180, 190), width=4)
+        
+        # Inner border for depth
+        draw.rectangle([reel_x + 5, reel_y + 5, reel_x + reel_width - 5, reel_y + reel_h - 5],
+                      outline=(200, 200, 210), width=2)
+        
+        # Draw emoji symbol larger and centered
+        # Get text bounding box for accurate centering
+        bbox = draw.textbbox((0, 0), symbol, font=emoji_font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+        
+        # Calculate center position
+        symbol_x = reel_x + (reel_width // 2) - text_width // 2
+        symbol_y = reel_y + (reel_h // 2) - text_height // 2
+        
+        # Draw shadow for depth
+        draw.text((symbol_x + 2, symbol_y + 2), symbol, font=emoji_font, fill=(100, 100, 100), embedded_color=True)
+        # Main symbol - use embedded_color=True to preserve emoji colors
+        draw.text((symbol_x, symbol_y), symbol, font=emoji_font, fill=self.white_color, embedded_color=True)
         
+        # Shine effect on reel
+        draw.polygon([(reel_x + 10, reel_y + 10), (reel_x + 40, reel_y + 10), 
+                     (reel_x + 10, reel_y + 40)], fill=(255, 255, 255, 100))
+
+    def _draw_slots_verdict(self, draw, result):
+        """Jackpot / win / try-again banner under the reels"""
+        is_jackpot = len(set(result)) == 1
+
         # Result indicator
         if is_jackpot:
             result_text = "🎉 JACKPOT! 🎉"
@@ -345,29 +654,12 @@ class GameImageGenerator:
             draw.text((result_x + offset, self.height - 90 + offset), result_text, 
                      fill=(result_color[0]//2, result_color[1]//2, result_color[2]//2), font=self.font_medium)
         draw.text((result_x, self.height - 90), result_text, fill=result_color, font=self.font_medium)
-        
-        img.save(save_path)
-        return True
 
-    def create_rps_image(self, player_choice, bot_choice, save_path):
+    def create_rps_image(self, player_choice, bot_choice):
         """Create enhanced rock paper scissors image with proper symbols"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        img = self.get_base_layer("rps")
         draw = ImageDraw.Draw(img)
         
-        # Draw border with gradient
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
-        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
-        
-        # Draw title with glow
-        title_text = "🤜 ROCK PAPER SCISSORS 🤛"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        for offset in range(3, 0, -1):
-            draw.text((title_x + offset, 30 + offset), title_text, fill=(20, 100, 120), font=self.font_large)
-        draw.text((title_x, 30), title_text, fill=self.white_color, font=self.font_large)
-        
         center_y = self.height // 2
         
         def draw_choice_symbol(x, y, choice, color, is_player=True):
@@ -411,13 +703,6 @@ class GameImageGenerator:
         # Player side
         player_x = 150
         
-        # Label
-        label_text = "YOU"
-        bbox = draw.textbbox((0, 0), label_text, font=self.font_medium)
-        text_w = bbox[2] - bbox[0]
-        draw.text((player_x - text_w//2, center_y - 160), label_text, 
-                 fill=self.white_color, font=self.font_medium)
-        
         # Draw symbol
         draw_choice_symbol(player_x, center_y, player_choice, (0, 120, 0), True)
         
@@ -428,26 +713,9 @@ class GameImageGenerator:
         draw.text((player_x - text_w//2, center_y + 135), choice_text, 
                  fill=self.green_color, font=self.font_small)
         
-        # VS text in center with circle
-        vs_x = self.width // 2
-        draw.ellipse([vs_x - 50, center_y - 50, vs_x + 50, center_y + 50],
-                    fill=(100, 50, 0), outline=self.orange_color, width=4)
-        bbox = draw.textbbox((0, 0), "VS", font=self.font_large)
-        text_w = bbox[2] - bbox[0]
-        text_h = bbox[3] - bbox[1]
-        draw.text((vs_x - text_w//2, center_y - text_h//2), "VS", 
-                 fill=self.orange_color, font=self.font_large)
-        
         # Bot side
         bot_x = self.width - 150
         
-        # Label
-        label_text = "BOT"
-        bbox = draw.textbbox((0, 0), label_text, font=self.font_medium)
-        text_w = bbox[2] - bbox[0]
-        draw.text((bot_x - text_w//2, center_y - 160), label_text, 
-                 fill=self.white_color, font=self.font_medium)
-        
         # Draw symbol
         draw_choice_symbol(bot_x, center_y, bot_choice, (120, 0, 0), False)
         
@@ -458,101 +726,127 @@ class GameImageGenerator:
         draw.text((bot_x - text_w//2, center_y + 135), choice_text, 
                  fill=self.red_color, font=self.font_small)
         
-        img.save(save_path)
-        return True
+        return self.encoder(img)
 
-    def create_mines_grid_image(self, revealed_tiles, mine_positions, diamonds_found, save_path):
+    def create_mines_grid_image(self, revealed_tiles, mine_positions, diamonds_found):
         """Create mines game grid image"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        img = self.get_base_layer("mines")
         draw = ImageDraw.Draw(img)
-        
-        # Draw border
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
-        
-        # Draw title
-        draw.text((self.width//2 - 80, 30), "MINES", fill=self.white_color, font=self.font_large)
-        
-        # Draw grid (5x5)
-        tile_size = 100
-        grid_start_x = (self.width - 5 * tile_size) // 2
-        grid_start_y = 100
-        
-        for row in range(5):
-            for col in range(5):
-                tile_idx = row * 5 + col
-                x = grid_start_x + col * tile_size
-                y = grid_start_y + row * tile_size
-                
-                if tile_idx in revealed_tiles:
-                    if tile_idx in mine_positions:
-                        # Mine revealed
-                        draw.rectangle([x, y, x + tile_size - 5, y + tile_size - 5],
-                                     fill=(150, 0, 0), outline=(255, 0, 0), width=2)
-                        draw.text((x + 30, y + 25), "💣", fill=self.white_color, font=self.font_medium)
-                    else:
-                        # Diamond revealed
-                        draw.rectangle([x, y, x + tile_size - 5, y + tile_size - 5],
-                                     fill=(0, 100, 0), outline=(0, 255, 0), width=2)
-                        draw.text((x + 30, y + 25), "💎", fill=self.white_color, font=self.font_medium)
-                else:
-                    # Unrevealed tile
-                    draw.rectangle([x, y, x + tile_size - 5, y + tile_size - 5],
-                                 fill=(60, 60, 60), outline=(120, 120, 120), width=2)
-        
+
+        # Revealed tiles are stamped over the hidden grid from the cached sprites
+        mines = [self.mines_tile_origin(tile_idx) for tile_idx in revealed_tiles if tile_idx in mine_positions]
+        diamonds = [self.mines_tile_origin(tile_idx) for tile_idx in revealed_tiles if tile_idx not in mine_positions]
+        stamp_sprites(img, self.get_mines_tile_sprite("mine"), mines)
+        stamp_sprites(img, self.get_mines_tile_sprite("diamond"), diamonds)
+
         # Draw stats
-        draw.text((50, self.height - 50), f"💎 Diamonds Found: {diamonds_found}", 
+        draw.text((50, self.height - 50), f"💎 Diamonds Found: {diamonds_found}",
                  fill=self.green_color, font=self.font_small)
-        
-        img.save(save_path)
-        return True
 
-    def create_plinko_image(self, position, num_buckets, multipliers, save_path):
-        """Create enhanced plinko game image with pegs"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        return self.encoder(img)
+
+    def create_plinko_image(self, path, multipliers):
+        """Create the plinko result: the board for this row count with the ball's path traced to its bucket"""
+        img = self._draw_plinko_result(path, multipliers)
+        return self.encoder(img)
+
+    def create_plinko_animation(self, path, multipliers):
+        """Drop the ball along the recorded bounce path, ending on the result frame"""
+        board = self.get_plinko_board(len(path), multipliers)
+        points = self._plinko_path_points(path, len(multipliers))
+
+        frames = []
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            for step in range(PLINKO_FRAMES_PER_ROW):
+                t = step / PLINKO_FRAMES_PER_ROW
+                frame = board.copy()
+                self._draw_plinko_ball(ImageDraw.Draw(frame), int(x0 + (x1 - x0) * t), int(y0 + (y1 - y0) * t))
+                frames.append(frame)
+
+        frames.append(self._draw_plinko_result(path, multipliers))
+        durations = [ANIMATION_FRAME_MS] * (len(frames) - 1) + [ANIMATION_HOLD_MS]
+        return self.animation_encoder(frames, durations)
+
+    def _draw_plinko_result(self, path, multipliers):
+        """Board copy with the path polyline, winning bucket highlight and resting ball"""
+        num_buckets = len(multipliers)
+        img = self.get_plinko_board(len(path), multipliers).copy()
         draw = ImageDraw.Draw(img)
-        
-        # Draw border with gradient
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.orange_color, width=5)
-        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(200, 100, 0), width=2)
-        
-        # Draw title with glow
-        title_text = "🏀 PLINKO 🏀"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        for offset in range(3, 0, -1):
-            draw.text((title_x + offset, 25 + offset), title_text, fill=(150, 70, 0), font=self.font_large)
-        draw.text((title_x, 25), title_text, fill=self.white_color, font=self.font_large)
-        
-        # Draw pegs in triangular pattern
-        peg_rows = 10
+
+        # Path trail
+        draw.line(self._plinko_path_points(path, num_buckets), fill=(255, 120, 120), width=4, joint="curve")
+
+        # Highlight the winning bucket
+        start_x, bucket_width, bucket_spacing, bucket_y = self._plinko_bucket_layout(num_buckets)
+        x = start_x + path[-1] * (bucket_width + bucket_spacing)
+        draw.rectangle([x + 2, bucket_y + 2, x + bucket_width - 2, bucket_y + 58],
+                      outline=self.white_color, width=2)
+
+        self._draw_plinko_ball(draw, *self._plinko_rest_position(path[-1], num_buckets))
+        return img
+
+    def get_plinko_board(self, rows, multipliers):
+        """Pegs and buckets for a row count and multiplier set, drawn once and reused (callers must copy)"""
+        key = (rows, tuple(multipliers))
+        board = self.plinko_boards.get(key)
+        if board is None:
+            board = self._build_plinko_board(rows, multipliers)
+            self.plinko_boards[key] = board
+        return board
+
+    def _plinko_bucket_layout(self, num_buckets):
+        """Bucket geometry: start x, bucket width, spacing and top y - buckets narrow to fit high row counts"""
+        pitch = min(60, (self.width - 40) // num_buckets)
+        bucket_spacing = 5 if pitch == 60 else 4
+        bucket_width = pitch - bucket_spacing
+        total_width = num_buckets * pitch
+        return (self.width - total_width) // 2, bucket_width, bucket_spacing, self.height - 120
+
+    def _plinko_column_x(self, position, num_buckets):
+        """Centre x of a bucket column"""
+        start_x, bucket_width, bucket_spacing, bucket_y = self._plinko_bucket_layout(num_buckets)
+        return start_x + position * (bucket_width + bucket_spacing) + bucket_width // 2
+
+    def _plinko_row_y(self, row, rows):
+        """y of a peg row, spreading the rows between the title and the buckets"""
         peg_start_y = 100
-        peg_spacing_y = 35
-        peg_spacing_x = 50
-        
-        for row in range(peg_rows):
+        bucket_y = self._plinko_bucket_layout(rows + 1)[3]
+        return peg_start_y + row * (bucket_y - 50 - peg_start_y) // max(1, rows - 1)
+
+    def _plinko_rest_position(self, position, num_buckets):
+        """Where the ball sits above its bucket"""
+        bucket_y = self._plinko_bucket_layout(num_buckets)[3]
+        return self._plinko_column_x(position, num_buckets), bucket_y - 35
+
+    def _plinko_path_points(self, path, num_buckets):
+        """Ball centre at the drop point, after each row of the path, and at rest above its bucket"""
+        rows = len(path)
+        points = [(self._plinko_column_x(num_buckets // 2, num_buckets), 70)]
+        for row, position in enumerate(path):
+            points.append((self._plinko_column_x(position, num_buckets), self._plinko_row_y(row, rows) + 10))
+        points.append(self._plinko_rest_position(path[-1], num_buckets))
+        return points
+
+    def _build_plinko_board(self, rows, multipliers):
+        img = self.get_base_layer("plinko")
+        draw = ImageDraw.Draw(img)
+        num_buckets = len(multipliers)
+        start_x, bucket_width, bucket_spacing, bucket_y = self._plinko_bucket_layout(num_buckets)
+        pitch = bucket_width + bucket_spacing
+
+        # Draw pegs in triangular pattern; the last row's gaps line up with the buckets
+        positions = []
+        for row in range(rows):
             num_pegs = row + 3
-            row_width = num_pegs * peg_spacing_x
-            start_x = (self.width - row_width) // 2
-            y = peg_start_y + row * peg_spacing_y
-            
-            for peg in range(num_pegs):
-                x = start_x + peg * peg_spacing_x
-                # Peg shadow
-                draw.ellipse([x + 2, y + 2, x + 10, y + 10], fill=(30, 30, 30))
-                # Peg
-                draw.ellipse([x, y, x + 8, y + 8], fill=(200, 200, 200), outline=(150, 150, 150), width=1)
+            row_start_x = (self.width - (num_pegs - 1) * pitch) // 2
+            y = self._plinko_row_y(row, rows)
+            positions.extend((row_start_x + peg * pitch - 4, y) for peg in range(num_pegs))
+
+        stamp_sprites(img, self._build_peg_sprite(), positions)
         
         # Draw buckets
-        bucket_width = 55
-        bucket_spacing = 5
-        total_width = num_buckets * (bucket_width + bucket_spacing)
-        start_x = (self.width - total_width) // 2
-        bucket_y = self.height - 120
-        
         for i in range(num_buckets):
-            x = start_x + i * (bucket_width + bucket_spacing)
+            x = start_x + i * pitch
             
             # Bucket color based on multiplier
             mult = multipliers[i]
@@ -577,91 +871,105 @@ class GameImageGenerator:
             draw.rectangle([x, bucket_y, x + bucket_width, bucket_y + 60],
                           fill=bucket_color, outline=border_color, width=3)
             
-            # Highlight if this is the winning bucket
-            if position == i:
-                draw.rectangle([x + 2, bucket_y + 2, x + bucket_width - 2, bucket_y + 58],
-                              outline=self.white_color, width=2)
-            
-            # Multiplier text
+            # Multiplier text, dropping to the tiny font when it would overflow a narrow bucket
             mult_text = f"{mult}x"
-            bbox = draw.textbbox((0, 0), mult_text, font=self.font_small)
+            font = self.font_small
+            bbox = draw.textbbox((0, 0), mult_text, font=font)
+            if bbox[2] - bbox[0] > bucket_width - 4:
+                font = self.font_tiny
+                bbox = draw.textbbox((0, 0), mult_text, font=font)
             text_width = bbox[2] - bbox[0]
             text_x = x + (bucket_width - text_width) // 2
             # Shadow
-            draw.text((text_x + 1, bucket_y + 21), mult_text, fill=(0, 0, 0), font=self.font_small)
+            draw.text((text_x + 1, bucket_y + 21), mult_text, fill=(0, 0, 0), font=font)
             # Main text
-            draw.text((text_x, bucket_y + 20), mult_text, fill=(0, 0, 0), font=self.font_small)
+            draw.text((text_x, bucket_y + 20), mult_text, fill=(0, 0, 0), font=font)
         
-        # Draw ball position
-        if position is not None:
-            ball_x = start_x + position * (bucket_width + bucket_spacing) + bucket_width // 2
-            ball_y = bucket_y - 35
-            
-            # Ball shadow
-            draw.ellipse([ball_x - 17, ball_y - 13, ball_x + 17, ball_y + 17],
-                        fill=(50, 50, 50))
-            # Ball
-            draw.ellipse([ball_x - 18, ball_y - 18, ball_x + 18, ball_y + 18],
-                        fill=(255, 50, 50), outline=(200, 0, 0), width=3)
-            # Ball highlight
-            draw.ellipse([ball_x - 10, ball_y - 10, ball_x - 2, ball_y - 2],
-                        fill=(255, 150, 150))
-        
-        img.save(save_path)
-        return True
-
-    def create_limbo_image(self, target_multiplier, won, save_path):
+        return img
+
+    def _draw_plinko_ball(self, draw, ball_x, ball_y):
+        # Ball shadow
+        draw.ellipse([ball_x - 17, ball_y - 13, ball_x + 17, ball_y + 17],
+                    fill=(50, 50, 50))
+        # Ball
+        draw.ellipse([ball_x - 18, ball_y - 18, ball_x + 18, ball_y + 18],
+                    fill=(255, 50, 50), outline=(200, 0, 0), width=3)
+        # Ball highlight
+        draw.ellipse([ball_x - 10, ball_y - 10, ball_x - 2, ball_y - 2],
+                    fill=(255, 150, 150))
+
+    def create_limbo_image(self, target_multiplier, won):
         """Create enhanced limbo game image with cosmic effects"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        img = self._draw_limbo_background(target_multiplier, won)
+        self._draw_limbo_result(ImageDraw.Draw(img), target_multiplier, won)
+        return self.encoder(img)
+
+    def create_limbo_animation(self, target_multiplier, won):
+        """Count the multiplier up to the target, then reveal the result frame"""
+        background = self._draw_limbo_background(target_multiplier, won)
+        center_y = self.height // 2
+
+        frames = []
+        for i in range(LIMBO_COUNT_FRAMES):
+            # Ease in so the counter accelerates towards the target
+            value = 1 + (target_multiplier - 1) * (i / LIMBO_COUNT_FRAMES) ** 2
+            frame = background.copy()
+            draw = ImageDraw.Draw(frame)
+            count_text = f"{value:.2f}x"
+            bbox = draw.textbbox((0, 0), count_text, font=self.font_multiplier)
+            draw.text((self.width//2 - (bbox[2] - bbox[0])//2, center_y), count_text,
+                     fill=self.white_color, font=self.font_multiplier)
+            frames.append(frame)
+
+        final = background.copy()
+        self._draw_limbo_result(ImageDraw.Draw(final), target_multiplier, won)
+        frames.append(final)
+
+        durations = [ANIMATION_FRAME_MS] * LIMBO_COUNT_FRAMES + [ANIMATION_HOLD_MS]
+        return self.animation_encoder(frames, durations)
+
+    def _draw_limbo_background(self, target_multiplier, won):
+        """Base layer plus the starfield for this result"""
+        img = self.get_base_layer("limbo")
         draw = ImageDraw.Draw(img)
         
-        # Draw border with cosmic gradient
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=(147, 51, 234), width=5)
-        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(100, 30, 180), width=2)
-        
-        # Draw title with glow
-        title_text = "🌌 LIMBO 🌌"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        for offset in range(4, 0, -1):
-            draw.text((title_x + offset, 30 + offset), title_text, fill=(100, 30, 180, 100), font=self.font_large)
-        draw.text((title_x, 30), title_text, fill=(147, 51, 234), font=self.font_large)
+        # Seed the starfield from the inputs so the same result always renders identically (and can be cached)
+        rng = random.Random(f"{target_multiplier:.2f}:{won}")
         
         # Draw cosmic background elements - stars and nebula
         for _ in range(80):
-            x = random.randint(50, self.width - 50)
-            y = random.randint(100, self.height - 100)
-            size = random.randint(1, 4)
+            x = rng.randint(50, self.width - 50)
+            y = rng.randint(100, self.height - 100)
+            size = rng.randint(1, 4)
             # Random star colors
             star_colors = [(200, 200, 255), (255, 200, 255), (200, 255, 255), (255, 255, 200)]
-            color = random.choice(star_colors)
+            color = rng.choice(star_colors)
             draw.ellipse([x, y, x + size, y + size], fill=color)
             
             # Add glow to some stars
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 glow_size = size + 4
                 draw.ellipse([x - 2, y - 2, x + glow_size, y + glow_size], 
                            fill=(*color[:3], 50))
         
         # Draw cosmic swirls
         for _ in range(5):
-            x = random.randint(100, self.width - 100)
-            y = random.randint(150, self.height - 150)
-            radius = random.randint(30, 60)
+            x = rng.randint(100, self.width - 100)
+            y = rng.randint(150, self.height - 150)
+            radius = rng.randint(30, 60)
             draw.ellipse([x - radius, y - radius, x + radius, y + radius],
                         outline=(147, 51, 234, 80), width=2)
         
+        return img
+
+    def _draw_limbo_result(self, draw, target_multiplier, won):
+        """Multiplier and verdict text"""
         # Draw multiplier in center with glow effect
         center_y = self.height // 2
         mult_text = f"{target_multiplier:.2f}x"
         
         # Use larger font for multiplier
-        try:
-            mult_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 72)
-        except:
-            mult_font = self.font_large
+        mult_font = self.font_multiplier
         
         bbox = draw.textbbox((0, 0), mult_text, font=mult_font)
         text_width = bbox[2] - bbox[0]
@@ -691,30 +999,12 @@ class GameImageGenerator:
         
         draw.text((result_x, center_y + 100), result_text, 
                  fill=result_color, font=self.font_medium)
-        
-        img.save(save_path)
-        return True
 
-    def create_balloon_image(self, pumps, popped, save_path):
+    def create_balloon_image(self, pumps, popped):
         """Create enhanced balloon game image with proper sizing"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        img = self.get_base_layer("balloon")
         draw = ImageDraw.Draw(img)
         
-        # Draw border
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=5)
-        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
-        
-        # Draw title at top with glow - always visible
-        title_text = "🎈 BALLOON PUMP 🎈"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        # Glow effect
-        for offset in range(3, 0, -1):
-            draw.text((title_x + offset, 25 + offset), title_text, fill=(100, 50, 50), font=self.font_large)
-        draw.text((title_x, 25), title_text, fill=self.white_color, font=self.font_large)
-        
         # Calculate balloon position - keep it centered and sized properly
         center_x = self.width // 2
         # Move balloon down to leave space for title
@@ -789,61 +1079,39 @@ class GameImageGenerator:
         draw.text((self.width//2 - text_width//2, self.height - 60), pump_text, 
                  fill=self.white_color, font=self.font_medium)
         
-        img.save(save_path)
-        return True
+        return self.encoder(img)
 
-    def create_dice_battle_image(self, player_roll, bot_roll, save_path):
+    def create_dice_battle_image(self, player_roll, bot_roll):
         """Create dice battle image showing player vs bot"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        return self.encoder(self._draw_dice_battle(player_roll, bot_roll))
+
+    def create_dice_battle_animation(self, player_roll, bot_roll):
+        """Tumble both dice through random faces, then settle on the result frame"""
+        # Seeded by the outcome so the same result always renders the same clip
+        rng = random.Random(f"{player_roll}:{bot_roll}")
+        player_x, bot_x, dice_y = self.width // 4, 3 * self.width // 4, self.height // 2
+
+        frames = []
+        for _ in range(DICE_ROLL_FRAMES):
+            frame = self.get_base_layer("dice_battle")
+            draw = ImageDraw.Draw(frame)
+            self._draw_battle_die(draw, player_x + rng.randint(-15, 15), dice_y + rng.randint(-15, 15), rng.randint(1, 6))
+            self._draw_battle_die(draw, bot_x + rng.randint(-15, 15), dice_y + rng.randint(-15, 15), rng.randint(1, 6))
+            frames.append(frame)
+
+        frames.append(self._draw_dice_battle(player_roll, bot_roll))
+        durations = [ANIMATION_FRAME_MS] * DICE_ROLL_FRAMES + [ANIMATION_HOLD_MS]
+        return self.animation_encoder(frames, durations)
+
+    def _draw_dice_battle(self, player_roll, bot_roll):
+        img = self.get_base_layer("dice_battle")
         draw = ImageDraw.Draw(img)
         
-        # Draw border
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=3)
-        
-        # Draw title
-        draw.text((self.width//2 - 120, 30), "DICE BATTLE", fill=self.white_color, font=self.font_large)
-        
-        dice_size = 120
-        
-        # Player dice (left side)
+        # Player dice (left side), bot dice (right side)
         player_x = self.width // 4
-        player_y = self.height // 2
-        
-        draw.text((player_x - 40, player_y - 120), "YOU", fill=self.white_color, font=self.font_medium)
-        
-        # Player dice shadow
-        draw.rectangle([player_x - dice_size//2 + 5, player_y - dice_size//2 + 5,
-                       player_x + dice_size//2 + 5, player_y + dice_size//2 + 5],
-                      fill=(50, 50, 50))
-        
-        # Player dice
-        draw.rectangle([player_x - dice_size//2, player_y - dice_size//2,
-                       player_x + dice_size//2, player_y + dice_size//2],
-                      fill=self.white_color, outline=(100, 100, 100), width=5)
-        
-        self._draw_dice_pips(draw, player_x, player_y, dice_size, player_roll)
-        
-        # Bot dice (right side)
         bot_x = 3 * self.width // 4
-        bot_y = self.height // 2
-        
-        draw.text((bot_x - 40, bot_y - 120), "BOT", fill=self.white_color, font=self.font_medium)
-        
-        # Bot dice shadow
-        draw.rectangle([bot_x - dice_size//2 + 5, bot_y - dice_size//2 + 5,
-                       bot_x + dice_size//2 + 5, bot_y + dice_size//2 + 5],
-                      fill=(50, 50, 50))
-        
-        # Bot dice
-        draw.rectangle([bot_x - dice_size//2, bot_y - dice_size//2,
-                       bot_x + dice_size//2, bot_y + dice_size//2],
-                      fill=self.white_color, outline=(100, 100, 100), width=5)
-        
-        self._draw_dice_pips(draw, bot_x, bot_y, dice_size, bot_roll)
-        
-        # VS text
-        draw.text((self.width//2 - 30, self.height//2 - 20), "VS", 
-                 fill=self.orange_color, font=self.font_large)
+        self._draw_battle_die(draw, player_x, self.height // 2, player_roll)
+        self._draw_battle_die(draw, bot_x, self.height // 2, bot_roll)
         
         # Winner indicator
         if player_roll > bot_roll:
@@ -853,60 +1121,38 @@ class GameImageGenerator:
         else:
             draw.text((self.width//2 - 40, self.height - 100), "TIE!", fill=self.orange_color, font=self.font_medium)
         
-        img.save(save_path)
-        return True
+        return img
 
-    def create_baccarat_image(self, player_cards, banker_cards, player_total, banker_total, save_path):
-        """Create baccarat game image with actual card graphics"""
-        # Create canvas with green felt background
-        total_width = 800
-        total_height = 600
-        canvas = Image.new('RGB', (total_width, total_height), (34, 87, 45))
-        draw = ImageDraw.Draw(canvas)
+    def _draw_battle_die(self, draw, x, y, roll):
+        dice_size = 120
         
-        # Draw border
-        draw.rectangle([10, 10, total_width-10, total_height-10], outline=self.border_color, width=4)
+        # Dice shadow
+        draw.rectangle([x - dice_size//2 + 5, y - dice_size//2 + 5,
+                       x + dice_size//2 + 5, y + dice_size//2 + 5],
+                      fill=(50, 50, 50))
         
-        # Title with glow
-        title_text = "🎴 BACCARAT 🎴"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = total_width//2 - text_width//2
+        # Dice
+        draw.rectangle([x - dice_size//2, y - dice_size//2,
+                       x + dice_size//2, y + dice_size//2],
+                      fill=self.white_color, outline=(100, 100, 100), width=5)
         
-        for offset in range(3, 0, -1):
-            draw.text((title_x + offset, 30 + offset), title_text, fill=(20, 60, 30), font=self.font_large)
-        draw.text((title_x, 30), title_text, fill=(255, 215, 0), font=self.font_large)
-        
-        # Import card generator
-        from card_generator import CardImageGenerator
-        card_gen = CardImageGenerator()
-        
-        # Convert numeric cards to proper format
-        suits = ['♠️', '♥️', '♦️', '♣️']
-        
-        def convert_card(card_value):
-            """Convert numeric card to (rank, suit) tuple"""
-            suit = random.choice(suits)
-            if card_value <= 10:
-                rank = str(card_value)
-            elif card_value == 11:
-                rank = 'J'
-            elif card_value == 12:
-                rank = 'Q'
-            elif card_value == 13:
-                rank = 'K'
-            else:
-                rank = 'A'
-            return (rank, suit)
+        self._draw_dice_pips(draw, x, y, dice_size, roll)
+
+    def create_baccarat_image(self, player_cards, banker_cards, player_total, banker_total):
+        """Create baccarat game image with actual card graphics"""
+        canvas = self.get_base_layer("baccarat")
+        draw = ImageDraw.Draw(canvas)
+        
+        # Shared card generator so baccarat reuses the card sprite atlas
+        card_gen = self.get_card_generator()
         
         # Draw player section
         player_label = "PLAYER"
         draw.text((50, 100), f"{player_label}: {player_total}", fill=(255, 215, 0), font=self.font_medium)
         
         player_y = 130
-        for i, card_val in enumerate(player_cards):
-            rank, suit = convert_card(card_val)
-            card_img = card_gen.create_card_image(rank, suit)
+        for i, card in enumerate(player_cards):
+            card_img = card_gen.get_card_sprite(card)
             x_pos = 50 + i * (card_gen.card_width + 15)
             canvas.paste(card_img, (x_pos, player_y))
         
@@ -916,63 +1162,45 @@ class GameImageGenerator:
         draw.text((50, banker_y_label), f"{banker_label}: {banker_total}", fill=(34, 211, 238), font=self.font_medium)
         
         banker_y = 380
-        for i, card_val in enumerate(banker_cards):
-            rank, suit = convert_card(card_val)
-            card_img = card_gen.create_card_image(rank, suit)
+        for i, card in enumerate(banker_cards):
+            card_img = card_gen.get_card_sprite(card)
             x_pos = 50 + i * (card_gen.card_width + 15)
             canvas.paste(card_img, (x_pos, banker_y))
         
-        canvas.save(save_path)
-        return True
+        return self.encoder(canvas)
 
-    def create_towers_image(self, current_level, paths_count, correct_count, save_path):
+    def create_towers_image(self, current_level, paths_count, correct_count):
         """Create towers climbing image with path visualization"""
-        img = Image.new('RGB', (self.width, self.height), self.bg_color)
+        img = self.get_base_layer("towers")
         draw = ImageDraw.Draw(img)
         
-        # Draw border
-        draw.rectangle([10, 10, self.width-10, self.height-10], outline=self.border_color, width=4)
-        draw.rectangle([15, 15, self.width-15, self.height-15], outline=(20, 150, 170), width=2)
-        
-        # Draw title with glow
-        title_text = "🏗️ TOWERS 🏗️"
-        bbox = draw.textbbox((0, 0), title_text, font=self.font_large)
-        text_width = bbox[2] - bbox[0]
-        title_x = self.width//2 - text_width//2
-        
-        for offset in range(3, 0, -1):
-            draw.text((title_x + offset, 25 + offset), title_text, fill=(20, 100, 120), font=self.font_large)
-        draw.text((title_x, 25), title_text, fill=self.white_color, font=self.font_large)
-        
         # Draw tower levels
         level_height = 55
         level_width = 500
         start_y = 100
         center_x = self.width // 2
         
+        # Level boxes - green if completed, orange if current, gray if future - stamped per style
+        level_styles = {
+            "done": (self.green_color, (0, 180, 0)),
+            "current": (self.orange_color, (255, 180, 0)),
+            "future": ((60, 60, 70), (100, 100, 110))
+        }
+        level_positions = {style: [] for style in level_styles}
+        for level in range(8):
+            style = "done" if level < current_level else "current" if level == current_level else "future"
+            level_positions[style].append((center_x - level_width//2, start_y + level * level_height))
+
+        for style, positions in level_positions.items():
+            sprite = self.tower_level_sprites.get(style)
+            if sprite is None:
+                sprite = self._build_tower_level_sprite(*level_styles[style], level_width, level_height)
+                self.tower_level_sprites[style] = sprite
+            stamp_sprites(img, sprite, positions)
+        
         for level in range(8):
             y = start_y + level * level_height
             
-            # Level color - green if completed, orange if current, gray if future
-            if level < current_level:
-                color = self.green_color
-                border_color = (0, 180, 0)
-            elif level == current_level:
-                color = self.orange_color
-                border_color = (255, 180, 0)
-            else:
-                color = (60, 60, 70)
-                border_color = (100, 100, 110)
-            
-            # Draw level box with depth
-            draw.rectangle([center_x - level_width//2 + 3, y + 3, 
-                          center_x + level_width//2 + 3, y + level_height - 2],
-                          fill=(30, 30, 30))
-            
-            draw.rectangle([center_x - level_width//2, y, 
-                          center_x + level_width//2, y + level_height - 5],
-                          fill=color, outline=border_color, width=3)
-            
             # Level number
             level_num = f"Level {8-level}"
             draw.text((center_x - level_width//2 + 15, y + 18), level_num, 
@@ -988,10 +1216,7 @@ class GameImageGenerator:
         
         # Draw climber emoji at current level
         if current_level < 8:
-            try:
-                emoji_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 50)
-            except:
-                emoji_font = self.font_large
+            emoji_font = self.font_emoji_medium
             
             climber_y = start_y + (7 - current_level) * level_height + 5
             draw.text((center_x + level_width//2 + 30, climber_y), "🧗", 
@@ -1019,7 +1244,4 @@ class GameImageGenerator:
         draw.text((self.width//2 - text_w//2, self.height - 40), progress_text, 
                  fill=self.white_color, font=self.font_medium)
         
-        img.save(save_path)
-        return True
-
-    
+        return self.encoder(img)
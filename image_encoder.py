@@ -0,0 +1,117 @@
+import os
+import time
+from io import BytesIO
+
+from PIL import Image
+
+# Output format for game images: "png" (full colour), "png8" (palette-quantized PNG) or "webp" (lossless WebP)
+IMAGE_FORMAT = os.getenv("IMAGE_FORMAT", "png").lower()
+
+# zlib level for PNG output: 1 is fastest, 9 is smallest (Pillow's default is 6)
+PNG_COMPRESS_LEVEL = int(os.getenv("PNG_COMPRESS_LEVEL", "6"))
+
+IMAGE_EXTENSIONS = {
+    "png": "png",
+    "png8": "png",
+    "webp": "webp"
+}
+
+# Output format for animated results: "gif", "apng" or "webp"
+ANIMATION_FORMAT = os.getenv("ANIMATION_FORMAT", "gif").lower()
+
+ANIMATION_EXTENSIONS = {
+    "gif": "gif",
+    "apng": "png",
+    "webp": "webp"
+}
+
+def image_filename(name: str, image_format: str = None) -> str:
+    """Attachment filename for an encoded image, e.g. "coinflip" -> "coinflip.png" """
+    return f"{name}.{IMAGE_EXTENSIONS[image_format or IMAGE_FORMAT]}"
+
+def animation_filename(name: str, animation_format: str = None) -> str:
+    """Attachment filename for an encoded animation, e.g. "plinko" -> "plinko.gif" """
+    return f"{name}.{ANIMATION_EXTENSIONS[animation_format or ANIMATION_FORMAT]}"
+
+def encode_image(img, image_format: str = None, compress_level: int = None):
+    """Encode an image to an in-memory file that discord.File can send directly"""
+    image_format = image_format or IMAGE_FORMAT
+    compress_level = PNG_COMPRESS_LEVEL if compress_level is None else compress_level
+
+    buffer = BytesIO()
+    if image_format == "webp":
+        img.save(buffer, format="WEBP", lossless=True, method=4)
+    elif image_format == "png8":
+        # Game art is flat colour, so a 256-colour palette is usually indistinguishable and far smaller
+        palette_img = img.convert("RGB").quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+        palette_img.save(buffer, format="PNG", compress_level=compress_level)
+    else:
+        img.save(buffer, format="PNG", compress_level=compress_level)
+    buffer.seek(0)
+    return buffer
+
+def encode_animation(frames: list, durations: list, animation_format: str = None):
+    """Encode frames (with per-frame durations in ms) as a single animation that plays once"""
+    animation_format = animation_format or ANIMATION_FORMAT
+    first, rest = frames[0], frames[1:]
+
+    buffer = BytesIO()
+    if animation_format == "apng":
+        first.save(buffer, format="PNG", save_all=True, append_images=rest, duration=durations, loop=1)
+    elif animation_format == "webp":
+        first.save(buffer, format="WEBP", save_all=True, append_images=rest, duration=durations, loop=1, lossless=False, quality=80)
+    else:
+        # No loop count: GIF players run the animation once and stop on the last frame
+        first.save(buffer, format="GIF", save_all=True, append_images=rest, duration=durations, optimize=False)
+    buffer.seek(0)
+    return buffer
+
+def benchmark_encoders(repeats: int = 5):
+    """Print encoded size and encode time per game for every output format"""
+    from game_image_generator import GameImageGenerator
+    from cards import Hand, make_card
+
+    frames = {}
+    generator = GameImageGenerator()
+    card_generator = generator.get_card_generator()
+
+    # Capture the raw frames instead of encoding them
+    captured = []
+    generator.encoder = captured.append
+    samples = {
+        "coinflip": lambda: generator.create_coinflip_image("heads", "heads"),
+        "dice_battle": lambda: generator.create_dice_battle_image(6, 3),
+        "rps": lambda: generator.create_rps_image("rock", "scissors"),
+        "slots": lambda: generator.create_slots_image(["🍒", "🍒", "⭐"]),
+        "mines": lambda: generator.create_mines_grid_image({0, 6, 12}, {12, 20}, 2),
+        "plinko": lambda: generator.create_plinko_image([6, 7, 6, 5, 6, 7, 8, 7, 6, 5, 4], [50, 2, 2, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5, 2, 2, 50]),
+        "limbo": lambda: generator.create_limbo_image(2.5, True),
+        "balloon": lambda: generator.create_balloon_image(6, False),
+        "baccarat": lambda: generator.create_baccarat_image([make_card("9", "♠️"), make_card("K", "♥️")],
+                                                       [make_card("5", "♦️"), make_card("A", "♣️"), make_card("2", "♠️")], 9, 8),
+        "towers": lambda: generator.create_towers_image(3, 3, 2)
+    }
+    for game, render in samples.items():
+        render()
+        frames[game] = captured.pop()
+    frames["blackjack"] = card_generator.create_blackjack_game_image(
+        [Hand([make_card("A", "♠️"), make_card("K", "♥️")]),
+         Hand([make_card("8", "♦️"), make_card("3", "♣️"), make_card("9", "♠️")])],
+        Hand([make_card("Q", "♣️"), make_card("7", "♥️")]), 0, hide_dealer_first=False
+    )
+
+    configs = [("png", 6), ("png", 1), ("png", 9), ("png8", 6), ("webp", None)]
+    labels = [image_format if level is None else f"{image_format}/z{level}" for image_format, level in configs]
+    print(f"{'game':<12}" + "".join(f"{label:>19}" for label in labels))
+    for game, frame in frames.items():
+        row = f"{game:<12}"
+        for image_format, level in configs:
+            start = time.perf_counter()
+            for _ in range(repeats):
+                size = len(encode_image(frame, image_format, level).getvalue())
+            elapsed_ms = (time.perf_counter() - start) * 1000 / repeats
+            row += f"{size / 1024:>9.1f}KB {elapsed_ms:>5.1f}ms"
+        print(row)
+
+if __name__ == "__main__":
+    benchmark_encoders()
@@ -0,0 +1,73 @@
+import asyncio
+
+import discord
+
+from dm_dispatcher import chunk_embeds
+
+
+class LogSink:
+    """Buffers log embeds per channel and posts them in batched multi-embed messages"""
+
+    def __init__(self, bot, flush_interval: float = 2.0):
+        self.bot = bot
+        self.flush_interval = flush_interval
+        self.buffers = {}
+        self.flush_task = None
+        self.closing = asyncio.Event()
+
+    def start(self):
+        """Start the periodic flush loop (safe to call again after reconnects)"""
+        if not self.flush_task:
+            self.flush_task = asyncio.create_task(self._flush_loop())
+
+    def emit(self, channel_id: int, embed: discord.Embed):
+        """Queue an embed for a log channel; returns immediately"""
+        self.buffers.setdefault(channel_id, []).append(embed)
+
+    async def _flush_loop(self):
+        while not self.closing.is_set():
+            try:
+                # Wakes early on close() so the final flush happens here, never mid-send
+                await asyncio.wait_for(self.closing.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"❌ Error flushing log channels: {e}")
+
+    async def close(self):
+        """Stop the flush loop after sending everything still buffered"""
+        self.closing.set()
+        if self.flush_task:
+            await self.flush_task
+            self.flush_task = None
+        else:
+            await self.flush()
+
+    async def flush(self):
+        """Send everything buffered so far, split to fit Discord's per-message embed limits"""
+        buffers, self.buffers = self.buffers, {}
+        for channel_id, embeds in buffers.items():
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                continue
+            for chunk in chunk_embeds(embeds):
+                await self._send_chunk(channel, chunk)
+
+    async def _send_chunk(self, channel, embeds: list):
+        """Send one batch; if Discord rejects it, retry each entry alone so one bad embed can't drop the rest"""
+        try:
+            await channel.send(embeds=embeds)
+            return
+        except Exception as e:
+            if len(embeds) == 1:
+                print(f"Failed to send log entry to channel {channel.id}: {e}")
+                return
+            print(f"Failed to send log batch to channel {channel.id}, retrying {len(embeds)} entries one by one: {e}")
+
+        for embed in embeds:
+            try:
+                await channel.send(embed=embed)
+            except Exception as e:
+                print(f"Failed to send log entry to channel {channel.id}: {e}")
@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+
+class RenderCache:
+    """Content-addressed LRU of encoded images keyed on render inputs, optionally persisted to disk"""
+
+    def __init__(self, max_entries: int = 512, cache_dir: str = None, version: str = "", extension: str = "png",
+                 max_disk_entries: int = 2048, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.extension = extension
+        self.version = str(version)
+        self.entries = OrderedDict()
+        # Files on disk, least recently used first, with their sizes so the directory stays bounded
+        self.disk_entries = OrderedDict()
+        self.disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        # Assets live under a per-version directory so a generator change never serves stale images
+        self.root_dir = cache_dir
+        self.cache_dir = os.path.join(cache_dir, f"v{self.version}") if cache_dir else None
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._prune_stale_versions()
+            self._load_disk_index()
+
+    def _prune_stale_versions(self):
+        """Delete asset directories left behind by older generator versions"""
+        current = os.path.basename(self.cache_dir)
+        for name in os.listdir(self.root_dir):
+            path = os.path.join(self.root_dir, name)
+            if name.startswith("v") and name != current and os.path.isdir(path):
+                for file_name in os.listdir(path):
+                    os.remove(os.path.join(path, file_name))
+                os.rmdir(path)
+
+    def _load_disk_index(self):
+        """Index the current version's files, oldest first, and trim them to the disk limits"""
+        suffix = f".{self.extension}"
+        files = []
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if not name.endswith(suffix):
+                # Leftover temp file from a crash mid-write
+                os.remove(path)
+                continue
+            stat = os.stat(path)
+            files.append((stat.st_mtime, name[:-len(suffix)], stat.st_size))
+        for _, key, size in sorted(files):
+            self.disk_entries[key] = size
+            self.disk_bytes += size
+        self._evict_disk()
+
+    def _evict_disk(self):
+        """Delete least recently used files until the disk tier is within its entry and byte limits"""
+        while self.disk_entries and (len(self.disk_entries) > self.max_disk_entries
+                                     or self.disk_bytes > self.max_disk_bytes):
+            key, size = self.disk_entries.popitem(last=False)
+            self.disk_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def key(self, generator: str, method: str, args: tuple, kwargs: dict) -> str:
+        """Hash the generator version and call inputs into a stable cache key"""
+        payload = json.dumps([self.version, generator, method, list(args), kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
+
+    def get(self, key: str):
+        """Return cached bytes for a key, checking memory then disk; None on a miss"""
+        data = self.entries.get(key)
+        if data is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = None
+            if data:
+                if key in self.disk_entries:
+                    self.disk_entries.move_to_end(key)
+                self._remember(key, data)
+                self.hits += 1
+                return data
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, data: bytes):
+        """Store encoded bytes in memory and, if configured, on disk"""
+        self._remember(key, data)
+        if self.cache_dir:
+            if key in self.disk_entries:
+                self.disk_entries.move_to_end(key)
+                return
+            path = self._path(key)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self.disk_entries[key] = len(data)
+            self.disk_bytes += len(data)
+            self._evict_disk()
+
+    def _remember(self, key: str, data: bytes):
+        self.entries[key] = data
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
@@ -0,0 +1,172 @@
+import asyncio
+import multiprocessing
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+# Generators owned by a render worker process (set by _init_render_process)
+_process_generators = None
+
+def _init_render_process():
+    """Build the generators, fonts, card atlas and static layers once per render worker"""
+    global _process_generators
+    from game_image_generator import GameImageGenerator
+    from card_generator import CardImageGenerator
+
+    card_generator = CardImageGenerator()
+    card_generator.build_card_atlas()
+    game_generator = GameImageGenerator()
+    game_generator.build_base_layers()
+    _process_generators = {
+        "game": game_generator,
+        "card": card_generator
+    }
+
+def _render_in_process(generator: str, method: str, args: tuple, kwargs: dict):
+    """Run one generator method in the worker and hand back the encoded bytes"""
+    buffer = getattr(_process_generators[generator], method)(*args, **kwargs)
+    return buffer.getvalue() if buffer else None
+
+def _ping_render_process():
+    return True
+
+
+class RenderService:
+    """Runs image generator calls in worker processes so drawing and encoding never block the event loop"""
+
+    # Deterministic renders with a small outcome space - repeat outcomes are served from the cache.
+    # Limbo is left out: its target is a user-chosen float, so nearly every render would be a new entry.
+    CACHEABLE_METHODS = {
+        "create_coinflip_image",
+        "create_coinflip_animation",
+        "create_dice_battle_image",
+        "create_dice_battle_animation",
+        "create_rps_image",
+        "create_slots_image",
+        "create_slots_animation"
+    }
+
+    # Methods that keep per-table state in the worker; their first argument is the table id
+    AFFINITY_METHODS = {
+        "encode_blackjack_table"
+    }
+
+    def __init__(self, workers: int = 2, max_pending: int = 32, timeout: float = 10.0, cache=None):
+        self.worker_count = max(1, workers)
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.cache = cache
+        self.pending = 0
+        # One single-process executor per worker, so a table's jobs can always reach the worker holding its canvas
+        self._executors = []
+        self._worker_pending = []
+
+    def start(self):
+        """Start the worker processes (safe to call again after reconnects)"""
+        if self._executors:
+            return
+        # Spawned, not forked: by now the parent has discord.py and aiohttp threads a fork would copy mid-state
+        context = multiprocessing.get_context("spawn")
+        self._executors = [
+            ProcessPoolExecutor(max_workers=1, mp_context=context, initializer=_init_render_process)
+            for _ in range(self.worker_count)
+        ]
+        self._worker_pending = [0] * self.worker_count
+        # Spin every worker up now so the first round doesn't pay for process start and atlas build
+        for executor in self._executors:
+            executor.submit(_ping_render_process)
+        print(f"✅ Render service started with {self.worker_count} worker processes")
+
+    def _pick_worker(self, method: str, args: tuple) -> int:
+        """Stateful table jobs always go to the table's worker; everything else to the least busy one"""
+        if method in self.AFFINITY_METHODS and args:
+            return zlib.crc32(str(args[0]).encode()) % self.worker_count
+        return min(range(self.worker_count), key=self._worker_pending.__getitem__)
+
+    def _submit(self, generator: str, method: str, args: tuple, kwargs: dict):
+        """Queue a job on its worker and count it until the worker has actually finished it.
+
+        Done callbacks run on the executor's thread; the counters are only touched on the loop.
+        """
+        loop = asyncio.get_running_loop()
+        worker = self._pick_worker(method, args)
+        future = self._executors[worker].submit(_render_in_process, generator, method, args, kwargs)
+        self.pending += 1
+        self._worker_pending[worker] += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_pending, worker))
+        return future
+
+    async def render(self, generator: str, method: str, *args, **kwargs):
+        """Render with generator "game" or "card" and return a BytesIO, or None if the job was shed or failed"""
+        cache_key = None
+        if self.cache and method in self.CACHEABLE_METHODS:
+            cache_key = self.cache.key(generator, method, args, kwargs)
+            data = self.cache.get(cache_key)
+            if data:
+                return BytesIO(data)
+
+        if self.pending >= self.max_pending:
+            print(f"⚠️ Render queue full, skipping {method}")
+            return None
+
+        self.start()
+        # A timed-out job keeps its worker busy, so it stays counted until the worker is done with it
+        try:
+            future = self._submit(generator, method, args, kwargs)
+        except Exception as e:
+            print(f"❌ Error rendering {method}: {e}")
+            return None
+        try:
+            data = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            print(f"⚠️ Render timed out after {self.timeout}s: {method}")
+            return None
+        except Exception as e:
+            print(f"❌ Error rendering {method}: {e}")
+            return None
+
+        if not data:
+            return None
+        if cache_key:
+            try:
+                self.cache.put(cache_key, data)
+            except Exception as e:
+                print(f"⚠️ Could not cache {method} render: {e}")
+        return BytesIO(data)
+
+    def _release_pending(self, worker: int):
+        self.pending -= 1
+        self._worker_pending[worker] -= 1
+
+    async def warm_up(self, jobs: list) -> int:
+        """Render every (generator, method, args) job missing from the cache in parallel across the worker pool"""
+        if not self.cache:
+            return 0
+
+        self.start()
+        keys = []
+        futures = []
+        for generator, method, args in jobs:
+            key = self.cache.key(generator, method, args, {})
+            if self.cache.get(key) is None:
+                keys.append(key)
+                futures.append(asyncio.wrap_future(self._submit(generator, method, args, {})))
+
+        rendered = 0
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for key, data in zip(keys, results):
+            if isinstance(data, Exception):
+                print(f"❌ Error during render warm-up: {data}")
+            elif data:
+                self.cache.put(key, data)
+                rendered += 1
+
+        print(f"✅ Render warm-up: {len(jobs) - len(keys)} loaded from cache, {rendered} rendered")
+        return rendered
+
+    def close(self):
+        """Shut down the worker processes"""
+        for executor in self._executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._executors = []
+        self._worker_pending = []
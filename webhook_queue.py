@@ -0,0 +1,151 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+
+
+class WebhookQueue:
+    """Durable callback queue: persisted to a local spool on receipt and drained by a fixed pool of workers"""
+
+    def __init__(self, processor, spool_path: str = "webhook_queue.jsonl", workers: int = 4,
+                 max_pending: int = 500, max_attempts: int = 3, retry_interval: float = 300,
+                 max_rounds: int = 12, dead_letter_path: str = "webhook_dead_letter.jsonl",
+                 compact_every: int = 200):
+        self.processor = processor
+        self.spool_path = spool_path
+        self.worker_count = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        # Callbacks that used up their attempts are requeued every retry_interval seconds;
+        # after max_rounds failed rounds they are moved to the dead-letter file for manual review
+        self.retry_interval = retry_interval
+        self.max_rounds = max_rounds
+        self.dead_letter_path = dead_letter_path
+        # Acks written since the last rewrite; the spool is compacted after this many even while callbacks are pending
+        self.compact_every = compact_every
+        self.acks_since_compact = 0
+        self.queue = None
+        self.pending = {}
+        self.failed = {}
+        self.worker_tasks = []
+        self.retry_task = None
+
+    def _append(self, record: dict, path: str = None):
+        """Append a record to the spool (or another journal) and flush it to disk before returning"""
+        with open(path or self.spool_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_spool(self) -> list:
+        """Return spooled callbacks that were never acknowledged"""
+        if not os.path.exists(self.spool_path):
+            return []
+
+        entries = {}
+        with open(self.spool_path, "r") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-append
+                    continue
+                if "ack" in record:
+                    entries.pop(record["ack"], None)
+                else:
+                    entries[record["id"]] = record
+        return list(entries.values())
+
+    def _compact(self):
+        """Rewrite the spool with only the callbacks that still need processing"""
+        remaining = list(self.pending.values()) + list(self.failed.values())
+        tmp_path = f"{self.spool_path}.tmp"
+        with open(tmp_path, "w") as f:
+            for entry in remaining:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.spool_path)
+        self.acks_since_compact = 0
+
+    async def start(self):
+        """Replay unacknowledged callbacks from the spool and start the workers"""
+        if self.worker_tasks:
+            return
+
+        self.queue = asyncio.Queue()
+        replayed = self._load_spool()
+        for entry in replayed:
+            self.pending[entry["id"]] = entry
+            self.queue.put_nowait(entry)
+        self._compact()
+
+        self.worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+        self.retry_task = asyncio.create_task(self._retry_failed())
+        print(f"✅ Webhook queue started with {self.worker_count} workers ({len(replayed)} callback(s) replayed)")
+
+    def enqueue(self, data: dict) -> bool:
+        """Persist a callback and queue it; returns False when the queue is full"""
+        if self.queue is None or len(self.pending) >= self.max_pending:
+            return False
+
+        entry = {"id": uuid.uuid4().hex, "received_at": time.time(), "data": data}
+        self._append(entry)
+        self.pending[entry["id"]] = entry
+        self.queue.put_nowait(entry)
+        return True
+
+    async def _retry_failed(self):
+        """Periodically put failed callbacks back on the queue for another round of attempts"""
+        while True:
+            await asyncio.sleep(self.retry_interval)
+            for entry_id in list(self.failed):
+                if len(self.pending) >= self.max_pending:
+                    break
+                entry = self.failed.pop(entry_id)
+                self.pending[entry_id] = entry
+                self.queue.put_nowait(entry)
+
+    async def _worker(self):
+        while True:
+            entry = await self.queue.get()
+            try:
+                await self._process(entry)
+            except Exception as e:
+                print(f"❌ Webhook worker error: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def _process(self, entry: dict):
+        retry_delay = 1
+        for attempt in range(self.max_attempts):
+            try:
+                await self.processor(entry["data"])
+                break
+            except Exception as e:
+                if attempt < self.max_attempts - 1:
+                    print(f"⏳ Webhook callback {entry['id'][:8]} failed, retrying in {retry_delay} seconds... ({e})")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 2
+                else:
+                    print(f"❌ Webhook callback {entry['id'][:8]} failed after {self.max_attempts} attempts: {e}")
+                    self.pending.pop(entry["id"], None)
+                    # The round count is persisted with the entry whenever the spool is compacted
+                    entry["rounds"] = entry.get("rounds", 0) + 1
+                    if entry["rounds"] < self.max_rounds:
+                        # Kept in the spool and requeued by the retry task (or replayed on the next start)
+                        self.failed[entry["id"]] = entry
+                        return
+                    print(f"❌ Webhook callback {entry['id'][:8]} moved to {self.dead_letter_path} after {entry['rounds']} rounds")
+                    self._append({**entry, "dead_lettered_at": time.time(), "error": str(e)}, self.dead_letter_path)
+                    break
+
+        self._append({"ack": entry["id"]})
+        self.pending.pop(entry["id"], None)
+        self.acks_since_compact += 1
+        if not self.pending or self.acks_since_compact >= self.compact_every:
+            self._compact()